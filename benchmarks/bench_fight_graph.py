@@ -0,0 +1,79 @@
+"""
+Benchmark for the CSR fight graph.
+
+Builds a FightGraph from synthetic fight documents, saves it and memory-maps it
+back, then times win-chain shortest paths, common opponents and k-hop
+neighbourhoods between random fighters on the mapped graph.
+
+Usage:
+    python benchmarks/bench_fight_graph.py --fighters 5000 --fights 10000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from typing import Callable
+
+from synthetic import fighter_url, generate_documents
+
+from fightgraphs_pipeline.extract.extraction import build_fights
+from fightgraphs_pipeline.graph.fight_graph import FightGraph
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+
+def _milliseconds_per_query(query: Callable[[int, int], object], pairs: list) -> float:
+    start = time.perf_counter()
+    for fighter_id, other_id in pairs:
+        query(fighter_id, other_id)
+    return (time.perf_counter() - start) * 1000 / len(pairs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fighters", type=int, default=5000)
+    parser.add_argument("--fights", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--hops", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    documents = generate_documents(
+        args.fighters, max(1, args.fights // 12), args.fights, seed=args.seed
+    )
+    fights = build_fights(documents["fights"], trusted=True)
+    start = time.perf_counter()
+    graph = FightGraph.from_fights(fights)
+    print(
+        f"built {len(graph):,} fighters, {graph.edge_count:,} edges "
+        f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        graph.save(directory)
+        start = time.perf_counter()
+        mapped = FightGraph.load(directory)
+        print(f"memory-mapped in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        rng = random.Random(args.seed)
+        ids = [gen_id_from_url(fighter_url(i)) for i in range(args.fighters)]
+        ids = [fighter_id for fighter_id in ids if fighter_id in mapped]
+        pairs = [tuple(rng.sample(ids, 2)) for _ in range(args.queries)]
+        found = sum(mapped.shortest_path(*pair) is not None for pair in pairs)
+
+        print(f"{'query':<24}{'ms/query':>10}")
+        for name, query in (
+            ("shortest win chain", mapped.shortest_path),
+            ("shortest fight chain", lambda a, b: mapped.shortest_path(a, b, None)),
+            ("common opponents", mapped.common_opponents),
+            (
+                f"{args.hops}-hop neighbourhood",
+                lambda a, _: mapped.neighbourhood(a, args.hops),
+            ),
+        ):
+            print(f"{name:<24}{_milliseconds_per_query(query, pairs):>10.3f}")
+        print(f"{found:,} of {len(pairs):,} pairs are linked by a chain of wins")
+
+
+if __name__ == "__main__":
+    main()
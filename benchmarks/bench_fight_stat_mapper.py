@@ -0,0 +1,97 @@
+"""
+Benchmark for FightStatMapper at scale.
+
+Maps synthetic fights to fightstat rows with the column-wise mapper and with a
+naive per-value regex baseline, and reports rounds/sec for each. Fights are
+generated and mapped in chunks so memory stays flat; only mapping is timed.
+
+Usage:
+    python benchmarks/bench_fight_stat_mapper.py --rounds 1000000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from bench_model_construction import make_fight_doc
+
+from fightgraphs_pipeline.extract.extraction import build_fights
+from fightgraphs_pipeline.models.mongodb_models import FightModel
+from fightgraphs_pipeline.transform.fight_stat_mapper import (
+    COUNT_FIELDS,
+    DURATION_FIELDS,
+    FIGHT_STAT_COLUMNS,
+    LANDED_OF_ATTEMPTED_FIELDS,
+    FightStatMapper,
+)
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+ROUNDS_PER_FIGHT = 5
+
+
+def naive_map_fights_to_rows(fights: list[FightModel]) -> list[tuple]:
+    """
+    Baseline: one regex call per field per round per fighter.
+    """
+    rows = []
+    for fight in fights:
+        fight_id = gen_id_from_url(fight.fight_ufcstats_url)
+        for round_key, round_stats in fight.fight_stats.items():
+            round_number = int(re.search(r"\d+", round_key).group())
+            for stats in (round_stats.fighter1, round_stats.fighter2):
+                values = {"round": round_number}
+                for field, (landed, attempted) in LANDED_OF_ATTEMPTED_FIELDS.items():
+                    match = re.match(r"(\d+)\s+of\s+(\d+)", getattr(stats, field) or "")
+                    values[landed] = int(match.group(1)) if match else 0
+                    values[attempted] = int(match.group(2)) if match else 0
+                for field, column in COUNT_FIELDS.items():
+                    match = re.match(r"\d+", getattr(stats, field) or "")
+                    values[column] = int(match.group()) if match else 0
+                for field, column in DURATION_FIELDS.items():
+                    match = re.match(r"(\d+):(\d+)", getattr(stats, field) or "")
+                    values[column] = (
+                        int(match.group(1)) * 60 + int(match.group(2)) if match else 0
+                    )
+                values["fighter_id"] = gen_id_from_url(stats.fighter_ufcstats_url)
+                values["fight_id"] = fight_id
+                rows.append(tuple(values[name] for name in FIGHT_STAT_COLUMNS))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=1000000)
+    parser.add_argument("--chunk-fights", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mapper = FightStatMapper()
+    total_fights = args.rounds // ROUNDS_PER_FIGHT
+    timings = {"column-wise": 0.0, "per-value": 0.0}
+    rows = 0
+    for start in range(0, total_fights, args.chunk_fights):
+        count = min(args.chunk_fights, total_fights - start)
+        fights = build_fights(
+            [make_fight_doc(rng, start + i, ROUNDS_PER_FIGHT) for i in range(count)],
+            trusted=True,
+        )
+        for name, map_rows in (
+            ("column-wise", mapper.map_fights_to_rows),
+            ("per-value", naive_map_fights_to_rows),
+        ):
+            began = time.perf_counter()
+            mapped = map_rows(fights)
+            timings[name] += time.perf_counter() - began
+        rows += len(mapped)
+
+    rounds = total_fights * ROUNDS_PER_FIGHT
+    print(f"{rounds:,} rounds -> {rows:,} fightstat rows")
+    print(f"{'mapper':<14}{'seconds':>10}{'rounds/s':>14}")
+    for name, seconds in timings.items():
+        print(f"{name:<14}{seconds:>10.2f}{rounds / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark for server-side flattening of fight stats.
+
+Compares the nested path (whole fight documents -> FightModel -> rows) with the
+aggregation path (flat per-round, per-fighter documents -> rows). Reports the
+BSON bytes each path has the server send and the client time to build rows.
+The flat documents are produced in Python here, in the shape the
+build_flat_fight_stats_pipeline aggregation returns.
+
+Usage:
+    python benchmarks/bench_flat_fight_stats.py --fights 20000 --rounds 3
+"""
+
+import argparse
+import random
+import time
+
+import bson
+from bench_model_construction import make_fight_doc
+
+from fightgraphs_pipeline.extract.extraction import build_fights
+from fightgraphs_pipeline.transform.fight_stat_mapper import (
+    STAT_FIELDS,
+    FightStatMapper,
+)
+
+
+def flatten(documents: list[dict]) -> list[dict]:
+    """
+    Python equivalent of the build_flat_fight_stats_pipeline aggregation.
+    """
+    flat = []
+    for document in documents:
+        for round_index, (round_key, round_stats) in enumerate(
+            (document.get("fight_stats") or {}).items()
+        ):
+            for fighter in ("fighter1", "fighter2"):
+                stats = round_stats[fighter]
+                flat.append(
+                    {
+                        "fight_ufcstats_url": document["fight_ufcstats_url"],
+                        "round_index": round_index,
+                        "round_key": round_key,
+                        "fighter_ufcstats_url": stats.get("fighter_ufcstats_url")
+                        or document[fighter]["fighter_ufcstats_url"],
+                        **{field: stats.get(field) for field in STAT_FIELDS},
+                    }
+                )
+    return flat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fights", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    documents = [make_fight_doc(rng, i, args.rounds) for i in range(args.fights)]
+    flat_documents = flatten(documents)
+
+    def nested() -> int:
+        return len(FightStatMapper().map_fights_to_rows(build_fights(documents)))
+
+    def flat() -> int:
+        return len(FightStatMapper().map_flat_stats(flat_documents))
+
+    print(f"{'path':<10}{'rows':>10}{'MB sent':>10}{'rows/s':>12}")
+    for name, map_rows, sent in (
+        ("nested", nested, documents),
+        ("flat", flat, flat_documents),
+    ):
+        megabytes = sum(len(bson.encode(document)) for document in sent) / (1 << 20)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            rows = map_rows()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<10}{rows:>10,}{megabytes:>10.1f}{rows / best:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark for building source models from raw Mongo documents.
+
+Compares docs/sec of the per-document builders (strict) and the trusted path,
+which validates each batch in a single pydantic-core call, on synthetic documents
+without a database.
+
+Usage:
+    python benchmarks/bench_model_construction.py --docs 20000 --rounds 3
+"""
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from fightgraphs_pipeline.extract.extraction import (
+    build_events,
+    build_fighters,
+    build_fights,
+)
+
+_STATS = (
+    "sig_strikes",
+    "total_strikes",
+    "takedowns",
+    "head_strikes",
+    "body_strikes",
+    "leg_strikes",
+    "distance_strikes",
+    "clinch_strikes",
+    "ground_strikes",
+)
+
+
+def _x_of_y(rng: random.Random) -> str:
+    attempted = rng.randint(0, 60)
+    return f"{rng.randint(0, attempted)} of {attempted}"
+
+
+def _round_stats(rng: random.Random, fighter_url: str) -> dict:
+    stats = {name: _x_of_y(rng) for name in _STATS}
+    stats.update(
+        kd=str(rng.randint(0, 1)),
+        fighter_ufcstats_url=fighter_url,
+        sub_attempts=str(rng.randint(0, 2)),
+        reversals=str(rng.randint(0, 1)),
+        control_time=f"{rng.randint(0, 4)}:{rng.randint(0, 59):02d}",
+    )
+    return stats
+
+
+def make_fighter_doc(rng: random.Random, i: int) -> dict:
+    return {
+        "fighter_ufcstats_url": f"http://ufcstats.com/fighter-details/{i:016x}",
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "nickname": None,
+        "height": f"5' {rng.randint(0, 11)}\"",
+        "weight": f"{rng.randint(115, 265)} lbs.",
+        "reach": f'{rng.randint(60, 84)}"',
+        "stance": rng.choice(["Orthodox", "Southpaw", "Switch"]),
+        "fighter_record": f"{rng.randint(0, 30)}-{rng.randint(0, 15)}-0",
+        "date_of_birth": "Jan 01, 1990",
+        "fight_urls": [
+            f"http://ufcstats.com/fight-details/{rng.getrandbits(64):016x}"
+            for _ in range(rng.randint(1, 20))
+        ],
+    }
+
+
+def make_fight_doc(rng: random.Random, i: int, rounds: int) -> dict:
+    fighter1_url = f"http://ufcstats.com/fighter-details/{2 * i:016x}"
+    fighter2_url = f"http://ufcstats.com/fighter-details/{2 * i + 1:016x}"
+    return {
+        "fight_ufcstats_url": f"http://ufcstats.com/fight-details/{i:016x}",
+        "fighter1": {
+            "name": f"Fighter {2 * i}",
+            "fighter_ufcstats_url": fighter1_url,
+            "fighter_status": "W",
+        },
+        "fighter2": {
+            "name": f"Fighter {2 * i + 1}",
+            "fighter_ufcstats_url": fighter2_url,
+            "fighter_status": "L",
+        },
+        "fight_details": {
+            "event_ufcstats_url": f"http://ufcstats.com/event-details/{i // 12:016x}",
+            "method": "Decision - Unanimous",
+            "time": "5:00",
+            "time_format": f"{rounds} Rnd ({'-'.join(['5'] * rounds)})",
+            "referee": "Herb Dean",
+            "finish_details": None,
+            "fight_of_the_night": None,
+            "performance_of_the_night": None,
+            "weight_class": "Lightweight Bout",
+            "title_fight": None,
+            "judge1_name": "Judge One",
+            "judge1_score": "29 - 28",
+            "judge2_name": "Judge Two",
+            "judge2_score": "29 - 28",
+            "judge3_name": "Judge Three",
+            "judge3_score": "28 - 29",
+        },
+        "fight_stats": {
+            f"Round {r}": {
+                "fighter1": _round_stats(rng, fighter1_url),
+                "fighter2": _round_stats(rng, fighter2_url),
+            }
+            for r in range(1, rounds + 1)
+        },
+    }
+
+
+def make_event_doc(rng: random.Random, i: int) -> dict:
+    return {
+        "event_name": f"UFC {i}",
+        "event_date": "Jan 01, 2020",
+        "event_location": "Las Vegas, Nevada, USA",
+        "event_status": "completed",
+        "event_ufcstats_url": f"http://ufcstats.com/event-details/{i:016x}",
+        "fight_refs": [
+            [f"http://ufcstats.com/fight-details/{rng.getrandbits(64):016x}", str(pos)]
+            for pos in range(1, 13)
+        ],
+    }
+
+
+def _docs_per_second(
+    build: Callable[[list[dict], bool], list],
+    docs: list[dict],
+    trusted: bool,
+    batch_size: int,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(0, len(docs), batch_size):
+            build(docs[i : i + batch_size], trusted)
+        best = min(best, time.perf_counter() - start)
+    return len(docs) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = [
+        (
+            "fighters",
+            build_fighters,
+            [make_fighter_doc(rng, i) for i in range(args.docs)],
+        ),
+        ("events", build_events, [make_event_doc(rng, i) for i in range(args.docs)]),
+        (
+            "fights",
+            build_fights,
+            [make_fight_doc(rng, i, args.rounds) for i in range(args.docs)],
+        ),
+    ]
+    print(
+        f"{'collection':<12}{'strict docs/s':>16}{'trusted docs/s':>16}{'speedup':>10}"
+    )
+    for name, build, docs in cases:
+        strict = _docs_per_second(build, docs, False, args.batch_size, args.repeat)
+        trusted = _docs_per_second(build, docs, True, args.batch_size, args.repeat)
+        print(f"{name:<12}{strict:>16,.0f}{trusted:>16,.0f}{trusted / strict:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for the process-pool transform stage.
+
+Maps synthetic fighters and fights to row tuples in-process and with
+ProcessPoolTransformer at increasing worker counts, and reports rows/sec for
+each. Also compares the pickled size of ORM entities and row tuples, which is
+what crosses the process boundary.
+
+Usage:
+    python benchmarks/bench_parallel_transform.py --fighters 50000 --fights 20000
+"""
+
+import argparse
+import os
+import pickle
+import random
+import time
+from typing import Callable
+
+from bench_model_construction import make_fight_doc, make_fighter_doc
+
+from fightgraphs_pipeline.extract.extraction import build_fighters, build_fights
+from fightgraphs_pipeline.transform.fight_stat_mapper import FightStatMapper
+from fightgraphs_pipeline.transform.fighter_mapper import FighterMapper
+from fightgraphs_pipeline.transform.parallel_transform import ProcessPoolTransformer
+
+
+def _rows_per_second(map_rows: Callable[[], int], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = map_rows()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fighters", type=int, default=50000)
+    parser.add_argument("--fights", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    fighters = build_fighters(
+        [make_fighter_doc(rng, i) for i in range(args.fighters)], trusted=True
+    )
+    fights = build_fights(
+        [make_fight_doc(rng, i, args.rounds) for i in range(args.fights)],
+        trusted=True,
+    )
+
+    mapper = FighterMapper()
+    sample = fighters[:1000]
+    entities = [
+        e["fighter_entity"] for e in mapper.map_fighters_to_entities(sample, [])
+    ]
+    rows, _ = mapper.map_fighters_to_rows(sample, [])
+    print(
+        f"pickled bytes per fighter: ORM {len(pickle.dumps(entities)) / len(sample):,.0f}"
+        f", tuple {len(pickle.dumps(rows)) / len(sample):,.0f}"
+    )
+
+    print(f"{'mapper':<18}{'workers':>8}{'fighter rows/s':>16}{'fightstat rows/s':>18}")
+    fighter_rate = _rows_per_second(
+        lambda: len(mapper.map_fighters_to_rows(fighters, [])[0]), args.repeat
+    )
+    stat_mapper = FightStatMapper()
+    stat_rate = _rows_per_second(
+        lambda: len(stat_mapper.map_fights_to_rows(fights)), args.repeat
+    )
+    print(f"{'in-process':<18}{1:>8}{fighter_rate:>16,.0f}{stat_rate:>18,.0f}")
+
+    workers = 1
+    while workers <= args.max_workers:
+        with ProcessPoolTransformer(workers, args.chunk_size) as transformer:
+            transformer.map_fighters(fighters[: args.chunk_size], [])  # warm up
+            fighter_rate = _rows_per_second(
+                lambda: len(transformer.map_fighters(fighters, [])[0]), args.repeat
+            )
+            stat_rate = _rows_per_second(
+                lambda: len(transformer.map_fight_stats(fights)), args.repeat
+            )
+        print(
+            f"{'process pool':<18}{workers:>8}{fighter_rate:>16,.0f}{stat_rate:>18,.0f}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark for the memory held by mapped rows.
+
+Maps synthetic fighters and fight stats to ORM entities and to row records
+(models.row_models), and reports the memory the mapped rows hold per 100k rows,
+measured with tracemalloc, along with the time taken to map them.
+
+Usage:
+    python benchmarks/bench_row_memory.py --fighters 100000 --fights 20000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from bench_model_construction import make_fight_doc, make_fighter_doc
+
+from fightgraphs_pipeline.extract.extraction import build_fighters, build_fights
+from fightgraphs_pipeline.models.postgresql_models import FightStatEntity
+from fightgraphs_pipeline.transform.fight_stat_mapper import FightStatMapper
+from fightgraphs_pipeline.transform.fighter_mapper import FighterMapper
+
+
+def _measure(map_rows: Callable[[], Any], count_rows: Callable[[Any], int]) -> tuple:
+    """
+    Returns (rows, bytes held by the result, seconds to build it).
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = map_rows()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count_rows(result), held, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fighters", type=int, default=100000)
+    parser.add_argument("--fights", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    fighters = build_fighters(
+        [make_fighter_doc(rng, i) for i in range(args.fighters)], trusted=True
+    )
+    fights = build_fights(
+        [make_fight_doc(rng, i, args.rounds) for i in range(args.fights)],
+        trusted=True,
+    )
+    fighter_mapper = FighterMapper()
+    stat_mapper = FightStatMapper()
+
+    cases = [
+        (
+            "fighter + record",
+            "entities",
+            lambda: fighter_mapper.map_fighters_to_entities(fighters, []),
+            len,
+        ),
+        (
+            "fighter + record",
+            "rows",
+            lambda: fighter_mapper.map_fighters_to_rows(fighters, []),
+            lambda rows: len(rows[0]),
+        ),
+        (
+            "fightstat",
+            "entities",
+            lambda: [
+                FightStatEntity(**row._asdict())
+                for row in stat_mapper.map_fights_to_rows(fights)
+            ],
+            len,
+        ),
+        (
+            "fightstat",
+            "rows",
+            lambda: stat_mapper.map_fights_to_rows(fights),
+            len,
+        ),
+    ]
+
+    print(f"{'table':<18}{'as':<10}{'rows':>10}{'MB / 100k rows':>16}{'seconds':>10}")
+    for table, kind, map_rows, count_rows in cases:
+        rows, held, seconds = _measure(map_rows, count_rows)
+        per_100k = held / rows * 100000 / (1 << 20)
+        print(f"{table:<18}{kind:<10}{rows:>10,}{per_100k:>16,.1f}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""
+Synthetic source data for the benchmarks.
+
+generate_documents builds linked `fighters`, `fighter_images`, `events` and
+`fights` documents shaped like the scraped collections: every fight belongs to
+an event card and to two fighters from the pool, and every fighter lists the
+fights they are in. InMemoryMongoController serves them in-process with the
+subset of the MongoDBController API the extractors use, and seed_mongo writes
+them to a real database instead.
+"""
+
+import random
+from typing import Any, Iterator, Optional
+
+import bson
+
+from fightgraphs_pipeline.database.mongodb_controller import MongoDBController
+
+STAT_NAMES = (
+    "sig_strikes",
+    "total_strikes",
+    "takedowns",
+    "head_strikes",
+    "body_strikes",
+    "leg_strikes",
+    "distance_strikes",
+    "clinch_strikes",
+    "ground_strikes",
+)
+
+WEIGHT_CLASSES = (
+    "Flyweight Bout",
+    "Bantamweight Bout",
+    "Featherweight Bout",
+    "Lightweight Bout",
+    "Welterweight Bout",
+    "Middleweight Bout",
+    "Light Heavyweight Bout",
+    "Heavyweight Bout",
+    "Women's Strawweight Bout",
+    "Women's Flyweight Bout",
+    "Women's Bantamweight Bout",
+    "UFC Lightweight Title Bout",
+    "UFC Women's Strawweight Title Bout",
+    "Catch Weight Bout",
+)
+
+METHODS = (
+    ("KO/TKO", "Punches"),
+    ("KO/TKO", "Kick"),
+    ("Submission", "Rear Naked Choke"),
+    ("Submission", "Guillotine Choke"),
+    ("Decision - Unanimous", None),
+    ("Decision - Unanimous", None),
+    ("Decision - Split", None),
+)
+
+REFEREES = tuple(f"Referee {i}" for i in range(40))
+JUDGES = tuple(f"Judge {i}" for i in range(120))
+CITIES = (
+    "Las Vegas, Nevada, USA",
+    "Abu Dhabi, Abu Dhabi, United Arab Emirates",
+    "London, England, United Kingdom",
+    "Newark, New Jersey, USA",
+    "Sydney, New South Wales, Australia",
+)
+MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+COLLECTIONS = ("fighters", "fighter_images", "events", "fights")
+
+
+def fighter_url(i: int) -> str:
+    return f"http://ufcstats.com/fighter-details/{i:016x}"
+
+
+def event_url(i: int) -> str:
+    return f"http://ufcstats.com/event-details/{i:016x}"
+
+
+def fight_url(i: int) -> str:
+    return f"http://ufcstats.com/fight-details/{i:016x}"
+
+
+def _date(rng: random.Random, year: int) -> str:
+    return f"{rng.choice(MONTHS)} {rng.randint(1, 28):02d}, {year}"
+
+
+def _x_of_y(rng: random.Random, most: int) -> str:
+    attempted = rng.randint(0, most)
+    return f"{rng.randint(0, attempted)} of {attempted}"
+
+
+def _round_stats(rng: random.Random, url: str) -> dict[str, Any]:
+    stats: dict[str, Any] = {name: _x_of_y(rng, 60) for name in STAT_NAMES}
+    stats.update(
+        takedowns=_x_of_y(rng, 5),
+        kd=str(rng.randint(0, 1)),
+        fighter_ufcstats_url=url,
+        sub_attempts=str(rng.randint(0, 2)),
+        reversals=str(rng.randint(0, 1)),
+        control_time=f"{rng.randint(0, 4)}:{rng.randint(0, 59):02d}",
+    )
+    return stats
+
+
+def make_fighter(rng: random.Random, i: int, fight_urls: list[str]) -> dict:
+    return {
+        "fighter_ufcstats_url": fighter_url(i),
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "nickname": rng.choice([None, f"The Nick {i}"]),
+        "height": f"{rng.randint(5, 6)}' {rng.randint(0, 11)}\"",
+        "weight": f"{rng.randint(115, 265)} lbs.",
+        "reach": rng.choice(["--", f'{rng.randint(60, 84)}"']),
+        "stance": rng.choice(["Orthodox", "Southpaw", "Switch", None]),
+        "fighter_record": (
+            f"Record: {rng.randint(0, 30)}-{rng.randint(0, 15)}-{rng.randint(0, 2)}"
+        ),
+        "date_of_birth": rng.choice(["--", _date(rng, rng.randint(1970, 2002))]),
+        "fight_urls": fight_urls,
+    }
+
+
+def make_fighter_image(i: int) -> dict:
+    return {
+        "fighter_ufcstats_url": fighter_url(i),
+        "fighter_image_url": f"https://images.example.com/fighters/{i:016x}.png",
+    }
+
+
+def make_event(rng: random.Random, i: int, year: int, fight_urls: list[str]) -> dict:
+    return {
+        "event_name": f"UFC Fight Night {i}",
+        "event_date": _date(rng, year),
+        "event_location": rng.choice(CITIES),
+        "event_status": "completed",
+        "event_ufcstats_url": event_url(i),
+        # Main event first, as on the card.
+        "fight_refs": [
+            [url, str(position)] for position, url in enumerate(fight_urls, 1)
+        ],
+    }
+
+
+def make_fight(
+    rng: random.Random,
+    i: int,
+    fighter_ids: tuple[int, int],
+    event_id: int,
+    rounds: Optional[int] = None,
+) -> dict:
+    """
+    Builds one fight. Without `rounds`, the fight is a 3 or 5 round bout that
+    ends early on a finish; otherwise it goes exactly `rounds` rounds.
+    """
+    method, finish_details = rng.choice(METHODS)
+    if rounds is None:
+        scheduled = 5 if rng.random() < 0.2 else 3
+        fought = (
+            scheduled if method.startswith("Decision") else rng.randint(1, scheduled)
+        )
+    else:
+        scheduled = fought = rounds
+    decision = method.startswith("Decision")
+    urls = [fighter_url(fighter_id) for fighter_id in fighter_ids]
+    winner = rng.randint(0, 1)
+    judges = rng.sample(JUDGES, 3)
+    details = {
+        "event_ufcstats_url": event_url(event_id),
+        "method": method,
+        "time": "5:00" if decision else f"{rng.randint(0, 4)}:{rng.randint(0, 59):02d}",
+        "time_format": f"{scheduled} Rnd ({'-'.join(['5'] * scheduled)})",
+        "referee": rng.choice(REFEREES),
+        "finish_details": finish_details,
+        "fight_of_the_night": None,
+        "performance_of_the_night": None,
+        "weight_class": rng.choice(WEIGHT_CLASSES),
+        "title_fight": None,
+    }
+    for n, judge in enumerate(judges, 1):
+        details[f"judge{n}_name"] = judge if decision else None
+        details[f"judge{n}_score"] = (
+            f"{10 * fought - rng.randint(0, 2)} - {10 * fought - rng.randint(0, 2)}"
+            if decision
+            else None
+        )
+    return {
+        "fight_ufcstats_url": fight_url(i),
+        "fighter1": {
+            "name": f"Fighter {fighter_ids[0]}",
+            "fighter_ufcstats_url": urls[0],
+            "fighter_status": "W" if winner == 0 else "L",
+        },
+        "fighter2": {
+            "name": f"Fighter {fighter_ids[1]}",
+            "fighter_ufcstats_url": urls[1],
+            "fighter_status": "W" if winner == 1 else "L",
+        },
+        "fight_details": details,
+        "fight_stats": {
+            f"Round {r}": {
+                "fighter1": _round_stats(rng, urls[0]),
+                "fighter2": _round_stats(rng, urls[1]),
+            }
+            for r in range(1, fought + 1)
+        },
+    }
+
+
+def generate_documents(
+    fighters: int = 5000,
+    events: int = 700,
+    fights: int = 10000,
+    rounds: Optional[int] = None,
+    seed: int = 0,
+) -> dict[str, list[dict]]:
+    """
+    Generates linked source documents for every collection.
+
+    Args:
+        fighters (int): Number of fighters (and fighter images).
+        events (int): Number of events. Fights are dealt over their cards.
+        fights (int): Number of fights.
+        rounds (Optional[int]): Total rounds over all fights, spread evenly. Defaults
+            to a realistic mix of finishes and 3 and 5 round decisions.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        dict[str, list[dict]]: Documents by collection name.
+    """
+    if fighters < 2 or events < 1 or fights < 0:
+        raise ValueError("Need at least two fighters and one event.")
+    rng = random.Random(seed)
+    fighter_fights: list[list[str]] = [[] for _ in range(fighters)]
+    event_fights: list[list[str]] = [[] for _ in range(events)]
+    fight_documents = []
+    for i in range(fights):
+        fighter_ids = tuple(rng.sample(range(fighters), 2))
+        event_id = i * events // max(fights, 1)
+        fight_rounds = None
+        if rounds is not None:
+            fight_rounds = max(1, rounds // fights + (i < rounds % fights))
+        fight_documents.append(make_fight(rng, i, fighter_ids, event_id, fight_rounds))
+        for fighter_id in fighter_ids:
+            fighter_fights[fighter_id].append(fight_url(i))
+        event_fights[event_id].insert(0, fight_url(i))
+    return {
+        "fighters": [make_fighter(rng, i, fighter_fights[i]) for i in range(fighters)],
+        "fighter_images": [make_fighter_image(i) for i in range(fighters)],
+        "events": [
+            make_event(rng, i, 1994 + 30 * i // events, event_fights[i])
+            for i in range(events)
+        ],
+        "fights": fight_documents,
+    }
+
+
+def count_rounds(fights: list[dict]) -> int:
+    return sum(len(fight["fight_stats"] or {}) for fight in fights)
+
+
+def seed_mongo(controller: MongoDBController, documents: dict[str, list[dict]]) -> None:
+    """
+    Replaces the benchmark collections of a real database with `documents`.
+    """
+    for name, collection_documents in documents.items():
+        collection = controller.get_collection(name)
+        collection.drop()
+        if collection_documents:
+            collection.insert_many(
+                [dict(document) for document in collection_documents], ordered=False
+            )
+
+
+def _matches(document: dict, query: dict) -> bool:
+    for field, condition in query.items():
+        value = document.get(field)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        for operator, operand in condition.items():
+            if operator == "$in":
+                if value not in operand:
+                    return False
+            elif operator == "$exists":
+                if (field in document) != operand:
+                    return False
+            elif value is None:
+                return False
+            elif operator == "$gt" and not value > operand:
+                return False
+            elif operator == "$gte" and not value >= operand:
+                return False
+            elif operator == "$lt" and not value < operand:
+                return False
+            elif operator == "$lte" and not value <= operand:
+                return False
+            elif operator == "$ne" and value == operand:
+                return False
+    return True
+
+
+def _project(document: dict, projection: Optional[dict]) -> dict:
+    if not projection:
+        return document
+    included = {field.split(".")[0] for field, keep in projection.items() if keep}
+    if included:
+        if projection.get("_id", 1):
+            included.add("_id")
+        return {field: value for field, value in document.items() if field in included}
+    return {
+        field: value for field, value in document.items() if field not in projection
+    }
+
+
+class InMemoryCursor:
+    def __init__(self, documents: list[bytes], query: dict, projection: Optional[dict]):
+        self._documents = documents
+        self._query = query
+        self._projection = projection
+        self._sort: list[tuple[str, int]] = []
+        self._limit = 0
+
+    def sort(self, key: Any, direction: int = 1) -> "InMemoryCursor":
+        self._sort = list(key) if isinstance(key, list) else [(key, direction)]
+        return self
+
+    def limit(self, limit: int) -> "InMemoryCursor":
+        self._limit = limit
+        return self
+
+    def __iter__(self) -> Iterator[dict]:
+        # Documents are stored as BSON and decoded on every read, like PyMongo does.
+        matched = (bson.decode(raw) for raw in self._documents)
+        matched = [document for document in matched if _matches(document, self._query)]
+        for key, direction in reversed(self._sort):
+            matched.sort(key=lambda document: document[key], reverse=direction < 0)
+        if self._limit:
+            matched = matched[: self._limit]
+        return (_project(document, self._projection) for document in matched)
+
+    def __enter__(self) -> "InMemoryCursor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+class InMemoryCollection:
+    def __init__(self, documents: list[dict]):
+        self._documents = [bson.encode(document) for document in documents]
+
+    def find(
+        self,
+        filter: Optional[dict] = None,
+        projection: Optional[dict] = None,
+        batch_size: int = 0,
+        sort: Optional[list[tuple[str, int]]] = None,
+        **kwargs: Any,
+    ) -> InMemoryCursor:
+        cursor = InMemoryCursor(self._documents, filter or {}, projection)
+        return cursor.sort(sort) if sort else cursor
+
+    def count_documents(self, filter: dict) -> int:
+        return sum(1 for _ in self.find(filter))
+
+
+class InMemoryMongoController:
+    """
+    In-process stand-in for MongoDBController, serving `find` from BSON held in
+    memory so extraction can be benchmarked without a server. Only equality,
+    $in, $exists, $ne and range queries on top-level fields are supported.
+    """
+
+    def __init__(self, documents: dict[str, list[dict]]):
+        self._collections = {
+            name: InMemoryCollection(collection_documents)
+            for name, collection_documents in documents.items()
+        }
+
+    def get_collection(self, collection_name: str) -> InMemoryCollection:
+        if not collection_name:
+            raise ValueError("Collection name cannot be empty.")
+        return self._collections.setdefault(collection_name, InMemoryCollection([]))
+
+    def close_connection(self) -> None:
+        pass
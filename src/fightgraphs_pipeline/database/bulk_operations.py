@@ -0,0 +1,285 @@
+import csv
+import io
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+from psycopg2.extras import execute_values
+from sqlalchemy import Table
+
+COPY_READ_SIZE = 1 << 16
+
+# Anything that maps to a table: an ORM entity class or a Core Table.
+TableLike = Union[type, Table]
+
+
+def get_table(entity_or_table: TableLike) -> Table:
+    """
+    Returns the Core Table for an ORM entity class, or the table itself.
+    """
+    if isinstance(entity_or_table, Table):
+        return entity_or_table
+    table = getattr(entity_or_table, "__table__", None)
+    if table is None:
+        raise TypeError(f"{entity_or_table!r} is not a mapped entity or a Table.")
+    return table
+
+
+def get_columns(table: Table, columns: Optional[Sequence[str]] = None) -> list[str]:
+    """
+    Returns the column names to load, defaulting to every column in table order.
+    """
+    if columns is None:
+        return [column.name for column in table.columns]
+    unknown = [name for name in columns if name not in table.columns]
+    if unknown:
+        raise ValueError(f"Unknown columns for table '{table.name}': {unknown}")
+    return list(columns)
+
+
+def resolve_columns(
+    table: Table, columns: Optional[Sequence[str]], rows: Iterable[Any]
+) -> tuple[list[str], Iterator[Any]]:
+    """
+    Returns the columns to load and the rows to load them from. Without explicit
+    columns, row records (named tuples such as FighterRow) supply their own
+    fields; anything else defaults to every column.
+    """
+    rows = iter(rows)
+    if columns is None:
+        first = next(rows, None)
+        if first is None:
+            return get_columns(table), rows
+        rows = chain([first], rows)
+        if isinstance(first, tuple) and hasattr(first, "_fields"):
+            columns = first._fields
+    return get_columns(table, columns), rows
+
+
+def iter_row_values(
+    table: Table, columns: Sequence[str], rows: Iterable[Any]
+) -> Iterator[tuple]:
+    """
+    Normalizes rows to tuples ordered like `columns`.
+
+    Tuples are taken as-is and must already be ordered like `columns`. ORM instances
+    are read attribute by attribute, and scalar column defaults are applied to
+    attributes left as None, as the ORM would do on flush.
+    """
+    defaults = [
+        table.columns[name].default.arg
+        if table.columns[name].default is not None
+        and table.columns[name].default.is_scalar
+        else None
+        for name in columns
+    ]
+    width = len(columns)
+    for row in rows:
+        if isinstance(row, tuple):
+            if len(row) != width:
+                raise ValueError(
+                    f"Row has {len(row)} values but {width} columns were given for '{table.name}'."
+                )
+            yield row
+        else:
+            yield tuple(
+                value if value is not None else default
+                for value, default in zip(
+                    (getattr(row, name) for name in columns), defaults
+                )
+            )
+
+
+class _CopyStream:
+    """
+    File-like object that renders rows as COPY CSV on demand, so psycopg2 can
+    stream an arbitrarily large iterable without materializing it. Only None is
+    left unquoted, which COPY reads as NULL; empty strings stay empty strings.
+    """
+
+    def __init__(self, rows: Iterator[tuple], chunk_rows: int = 1000):
+        self._rows = rows
+        self._chunk_rows = chunk_rows
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(
+            self._buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n"
+        )
+        self._pending = ""
+        self._position = 0
+        self.row_count = 0
+
+    def _fill(self) -> bool:
+        chunk = list(islice(self._rows, self._chunk_rows))
+        if not chunk:
+            return False
+        self._writer.writerows(chunk)
+        self.row_count += len(chunk)
+        self._pending = self._pending[self._position :] + self._buffer.getvalue()
+        self._position = 0
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while (size < 0 or len(self._pending) - self._position < size) and self._fill():
+            pass
+        end = len(self._pending) if size < 0 else self._position + size
+        data = self._pending[self._position : end]
+        self._position += len(data)
+        return data
+
+
+def copy_rows(
+    cursor: Any,
+    entity_or_table: TableLike,
+    rows: Iterable[Any],
+    columns: Optional[Sequence[str]] = None,
+    table_name: Optional[str] = None,
+) -> int:
+    """
+    Streams rows into a table with `COPY ... FROM STDIN` on a psycopg2 cursor.
+    The caller owns the transaction.
+
+    Args:
+        cursor: A psycopg2 cursor.
+        entity_or_table (TableLike): The ORM entity class or Table describing the rows.
+        rows (Iterable): ORM instances, row records, or tuples ordered like `columns`.
+        columns (Optional[Sequence[str]]): Columns to load. Defaults to the fields of
+            row records, else every column.
+        table_name (Optional[str]): Load into this table instead, e.g. a staging table
+            or a partition with the same columns.
+
+    Returns:
+        int: The number of rows copied.
+    """
+    table = get_table(entity_or_table)
+    columns, rows = resolve_columns(table, columns, rows)
+    stream = _CopyStream(iter_row_values(table, columns, rows))
+    cursor.copy_expert(
+        f"COPY {table_name or table.name} ({', '.join(columns)}) "
+        "FROM STDIN WITH (FORMAT csv)",
+        stream,
+        size=COPY_READ_SIZE,
+    )
+    return stream.row_count
+
+
+def _on_conflict_sql(columns: Sequence[str], conflict_columns: Sequence[str]) -> str:
+    """
+    Builds the `ON CONFLICT` clause of an upsert, which leaves rows whose values
+    are unchanged untouched.
+    """
+    update_columns = [column for column in columns if column not in conflict_columns]
+    sql = f"ON CONFLICT ({', '.join(conflict_columns)}) "
+    if not update_columns:
+        return sql + "DO NOTHING"
+    return (
+        sql
+        + "DO UPDATE SET "
+        + ", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+        + " WHERE ("
+        + ", ".join(f"target.{column}" for column in update_columns)
+        + ") IS DISTINCT FROM ("
+        + ", ".join(f"EXCLUDED.{column}" for column in update_columns)
+        + ")"
+    )
+
+
+def build_upsert_sql(
+    table: Table,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str],
+    table_name: Optional[str] = None,
+) -> str:
+    """
+    Builds an `INSERT ... VALUES %s ON CONFLICT ... DO UPDATE` statement for
+    `execute_values`. Rows whose values are unchanged are left untouched, and
+    changed or inserted rows are returned so they can be counted.
+    """
+    name = table_name or table.name
+    return (
+        f"INSERT INTO {name} AS target ({', '.join(columns)}) VALUES %s "
+        + _on_conflict_sql(columns, conflict_columns)
+        + " RETURNING 1"
+    )
+
+
+def build_merge_sql(
+    table: Table,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str],
+    source_name: str,
+    sequence_column: str,
+) -> str:
+    """
+    Builds a set-based `INSERT ... SELECT ... ON CONFLICT ... DO UPDATE` statement
+    that upserts every row of `source_name`, a table with the same columns, into
+    `table`. Of source rows sharing a conflict key, the one with the highest
+    `sequence_column`, a column of `source_name` only, wins.
+    """
+    column_list = ", ".join(columns)
+    keys = ", ".join(conflict_columns)
+    return (
+        f"INSERT INTO {table.name} AS target ({column_list}) "
+        f"SELECT DISTINCT ON ({keys}) {column_list} FROM {source_name} "
+        f"ORDER BY {keys}, {sequence_column} DESC "
+        + _on_conflict_sql(columns, conflict_columns)
+    )
+
+
+def upsert_rows(
+    cursor: Any,
+    entity_or_table: TableLike,
+    rows: Iterable[Any],
+    columns: Optional[Sequence[str]] = None,
+    conflict_columns: Optional[Sequence[str]] = None,
+    page_size: int = 1000,
+) -> int:
+    """
+    Inserts or updates rows with multi-row `INSERT ... ON CONFLICT DO UPDATE`
+    statements on a psycopg2 cursor. The caller owns the transaction.
+
+    Rows are sent `page_size` at a time. Within a page, later rows win over earlier
+    rows with the same conflict key, since PostgreSQL rejects a statement that
+    touches the same row twice.
+
+    Args:
+        cursor: A psycopg2 cursor.
+        entity_or_table (TableLike): The ORM entity class or Table describing the rows.
+        rows (Iterable): ORM instances, row records, or tuples ordered like `columns`.
+        columns (Optional[Sequence[str]]): Columns to write. Defaults to the fields of
+            row records, else every column.
+        conflict_columns (Optional[Sequence[str]]): The unique key to upsert on.
+            Defaults to the primary key.
+        page_size (int): Number of rows per statement.
+
+    Returns:
+        int: The number of rows inserted or changed. Unchanged rows are not counted.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer.")
+
+    table = get_table(entity_or_table)
+    columns, rows = resolve_columns(table, columns, rows)
+    conflict_columns = list(
+        conflict_columns or [column.name for column in table.primary_key.columns]
+    )
+    missing = [name for name in conflict_columns if name not in columns]
+    if missing:
+        raise ValueError(
+            f"Conflict columns {missing} must be part of the loaded columns."
+        )
+
+    sql = build_upsert_sql(table, columns, conflict_columns)
+    key_positions = [columns.index(name) for name in conflict_columns]
+    values = iter_row_values(table, columns, rows)
+    changed = 0
+    while page := list(islice(values, page_size)):
+        unique_page = list(
+            {tuple(row[i] for i in key_positions): row for row in page}.values()
+        )
+        changed += len(
+            execute_values(
+                cursor, sql, unique_page, page_size=len(unique_page), fetch=True
+            )
+        )
+    return changed
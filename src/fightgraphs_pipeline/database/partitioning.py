@@ -0,0 +1,89 @@
+from typing import Optional
+
+from sqlalchemy import Column, MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import AddConstraint, CreateIndex, CreateTable
+
+# The column each table that can be partitioned is hash-partitioned on. fightstat
+# is partitioned on fight_id, so all of a fight's rows share one partition and
+# replacing them touches only that partition.
+PARTITION_KEYS: dict[str, str] = {
+    "fightstat": "fight_id",
+}
+
+
+def partition_name(table_name: str, remainder: int) -> str:
+    return f"{table_name}_p{remainder}"
+
+
+def hash_partitioned_table(table: Table, column: str) -> Table:
+    """
+    Returns a copy of `table`, in a MetaData of its own, that PostgreSQL creates
+    hash-partitioned on `column`. The primary key of a partitioned table must
+    include the partition key, so `column` is added to it. Foreign keys and
+    indexes are left out; add the ones of `table` once the copy exists.
+    """
+    key = [primary.name for primary in table.primary_key.columns]
+    if column not in key:
+        key.append(column)
+    return Table(
+        table.name,
+        MetaData(),
+        *(
+            Column(
+                source.name,
+                source.type,
+                primary_key=source.name in key,
+                nullable=source.nullable,
+                autoincrement=source is table.autoincrement_column,
+            )
+            for source in table.columns
+        ),
+        postgresql_partition_by=f"HASH ({column})",
+    )
+
+
+def create_hash_partitioned_table(
+    connection: Connection,
+    table: Table,
+    partitions: int,
+    column: Optional[str] = None,
+    constraints: bool = True,
+) -> bool:
+    """
+    Creates `table` hash-partitioned into `partitions` partitions named
+    <table>_p<remainder>, unless a table of that name exists already.
+
+    Args:
+        connection (Connection): A connection in the transaction to create it in.
+        table (Table): The table to create, e.g. FightStatEntity.__table__.
+        partitions (int): The number of partitions, the hash modulus.
+        column (Optional[str]): The partition key. Defaults to the table's entry in
+            PARTITION_KEYS.
+        constraints (bool): Also add the table's foreign keys and indexes, which
+            PostgreSQL adds to every partition.
+
+    Returns:
+        bool: Whether the table was created.
+    """
+    if partitions <= 0:
+        raise ValueError("partitions must be a positive integer.")
+    if inspect(connection).has_table(table.name):
+        return False
+    connection.execute(
+        CreateTable(hash_partitioned_table(table, column or PARTITION_KEYS[table.name]))
+    )
+    for remainder in range(partitions):
+        connection.execute(
+            text(
+                f"CREATE TABLE {partition_name(table.name, remainder)} "
+                f"PARTITION OF {table.name} "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            )
+        )
+    if constraints:
+        for index in table.indexes:
+            connection.execute(CreateIndex(index))
+        for constraint in table.foreign_key_constraints:
+            connection.execute(AddConstraint(constraint, isolate_from_table=False))
+    return True
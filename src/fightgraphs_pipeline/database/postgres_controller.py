@@ -1,9 +1,23 @@
-from sqlalchemy import create_engine
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.schema import AddConstraint, CreateIndex, CreateTable, DDLElement
 from sqlalchemy.orm import sessionmaker, Session
 from fightgraphs_pipeline.models.postgresql_models import get_postgres_base
 from contextlib import contextmanager
 from sqlalchemy.engine import Engine
-from typing import Iterator
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+from fightgraphs_pipeline.database.bulk_operations import (
+    TableLike,
+    copy_rows,
+    upsert_rows,
+)
+from fightgraphs_pipeline.database.partitioning import (
+    PARTITION_KEYS,
+    create_hash_partitioned_table,
+)
+from fightgraphs_pipeline.database.sql_profiler import SQLProfiler
 
 # Assuming Base is imported from your models file.
 # from fightgraphs_pipeline.models.postgresql_models import Base
@@ -13,6 +27,10 @@ Base = get_postgres_base()
 class PostgresController:
     """
     Controller for managing PostgreSQL database connections and sessions.
+
+    The controller is safe to use across processes: a forked child drops the
+    pooled connections it inherited (without closing the parent's sockets) and
+    opens its own, and a pickled controller carries only its connection settings.
     """
 
     def __init__(self, db_uri: str, db_name: str, echo: bool = False):
@@ -24,19 +42,181 @@ class PostgresController:
                 db_name (str): The name of the database.
                 echo (bool): If True, the engine will log all statements.
         """
+        self._db_uri = db_uri
+        self._db_name = db_name
+        self._echo = echo
         full_uri = f"{db_uri}/{db_name}"
+        self._pid = os.getpid()
         self._engine: Engine = create_engine(full_uri, echo=echo)
         self._session_local = sessionmaker(
             autocommit=False, autoflush=False, bind=self._engine
         )
+        self.profiler: Optional[SQLProfiler] = None
+
+    def _ensure_process(self) -> None:
+        """
+        Resets the connection pool if this controller was inherited through fork.
+        """
+        if self._pid != os.getpid():
+            self._engine.dispose(close=False)
+            self._pid = os.getpid()
+
+    def __getstate__(self) -> dict:
+        return {"db_uri": self._db_uri, "db_name": self._db_name, "echo": self._echo}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["db_uri"], state["db_name"], state["echo"])
+
+    def enable_profiler(self, profiler: Optional[SQLProfiler] = None) -> SQLProfiler:
+        """
+        Starts profiling every statement this controller runs, through sessions
+        and raw connections alike. Profilers are not carried across processes.
+
+        Args:
+                profiler (Optional[SQLProfiler]): The profiler to report to. Defaults to a new one.
+
+        Returns:
+                SQLProfiler: The profiler, see SQLProfiler.report.
+        """
+        self.disable_profiler()
+        self.profiler = profiler or SQLProfiler()
+        self.profiler.attach(self._engine)
+        return self.profiler
 
-    def init_db(self) -> None:
+    def disable_profiler(self) -> None:
+        """
+        Stops profiling. The profiler keeps what it collected.
+        """
+        if self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
+
+    def init_db(
+        self, bulk_load: bool = False, partitions: Optional[Mapping[str, int]] = None
+    ) -> None:
         """
         Creates all database tables defined in the Base metadata.
         This should be called once when the application starts.
+
+        Args:
+                bulk_load (bool): Create missing tables bare, without foreign keys and
+                        secondary indexes, so a fresh full load does not check or maintain
+                        them row by row. Primary keys and unique constraints, which upserts
+                        rely on, are kept. Call finalize_bulk_load once the data is loaded.
+                        PostgreSQL only.
+                partitions (Optional[Mapping[str, int]]): Hash partitions per table name,
+                        e.g. {"fightstat": 8}, for missing tables listed in PARTITION_KEYS.
+                        Existing tables are left as they are. PostgreSQL only.
+
+        Without bulk_load, indexes missing from existing tables, such as ones added
+        to the models after the tables were created, are created too.
         """
-        Base.metadata.create_all(bind=self._engine)
-        print("Database initialized.")
+        self._ensure_process()
+        partitions = dict(partitions or {})
+        unknown = set(partitions) - set(PARTITION_KEYS)
+        if unknown:
+            raise ValueError(f"Tables that cannot be partitioned: {sorted(unknown)}")
+        if not bulk_load and not partitions:
+            Base.metadata.create_all(bind=self._engine)
+            self._create_missing_indexes()
+            print("Database initialized.")
+            return
+        with self._engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                if table.name in partitions:
+                    create_hash_partitioned_table(
+                        connection,
+                        table,
+                        partitions[table.name],
+                        constraints=not bulk_load,
+                    )
+                elif bulk_load:
+                    connection.execute(
+                        CreateTable(
+                            table,
+                            include_foreign_key_constraints=[],
+                            if_not_exists=True,
+                        )
+                    )
+                else:
+                    table.create(bind=connection, checkfirst=True)
+        if not bulk_load:
+            self._create_missing_indexes()
+        print(
+            "Database initialized for bulk loading."
+            if bulk_load
+            else "Database initialized."
+        )
+
+    def _create_missing_indexes(self) -> None:
+        with self._engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    connection.execute(CreateIndex(index, if_not_exists=True))
+
+    def _run_ddl(
+        self, statement: DDLElement, maintenance_work_mem: Optional[str]
+    ) -> None:
+        with self._engine.begin() as connection:
+            if maintenance_work_mem:
+                # Scoped to the transaction, so the pooled connection is left as it was.
+                connection.execute(
+                    text("SELECT set_config('maintenance_work_mem', :value, true)"),
+                    {"value": maintenance_work_mem},
+                )
+            connection.execute(statement)
+
+    def finalize_bulk_load(
+        self, workers: int = 1, maintenance_work_mem: Optional[str] = "1GB"
+    ) -> int:
+        """
+        Builds the indexes and adds the foreign keys that init_db(bulk_load=True)
+        left out, each in a single pass over its loaded table: every index first,
+        then every foreign key, which is validated as it is added. Indexes and
+        foreign keys that already exist are skipped, so this can be re-run after
+        a failure.
+
+        Args:
+                workers (int): Statements run at the same time, each on its own connection.
+                maintenance_work_mem (Optional[str]): Memory each statement may use to
+                        build an index or validate a foreign key, e.g. "2GB". None keeps
+                        the server setting.
+
+        Returns:
+                int: The number of indexes and foreign keys added.
+        """
+        self._ensure_process()
+        inspector = inspect(self._engine)
+        indexes = [
+            CreateIndex(index, if_not_exists=True)
+            for table in Base.metadata.sorted_tables
+            for index in table.indexes
+        ]
+        foreign_keys = []
+        for table in Base.metadata.sorted_tables:
+            present = {
+                tuple(foreign_key["constrained_columns"])
+                for foreign_key in inspector.get_foreign_keys(table.name)
+            }
+            foreign_keys.extend(
+                AddConstraint(constraint, isolate_from_table=False)
+                for constraint in table.foreign_key_constraints
+                if tuple(constraint.column_keys) not in present
+            )
+        # Index builds take locks that conflict with adding a foreign key to the
+        # same table, so the foreign keys only start once every index is built.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for statements in (indexes, foreign_keys):
+                for future in [
+                    executor.submit(self._run_ddl, statement, maintenance_work_mem)
+                    for statement in statements
+                ]:
+                    future.result()
+        print(
+            f"Bulk load finalized: {len(indexes)} indexes, "
+            f"{len(foreign_keys)} foreign keys."
+        )
+        return len(indexes) + len(foreign_keys)
 
     @contextmanager
     def get_db_session(self) -> Iterator[Session]:
@@ -47,6 +227,7 @@ class PostgresController:
         Yields:
                 Session: The SQLAlchemy session object.
         """
+        self._ensure_process()
         session: Session = self._session_local()
         try:
             yield session
@@ -57,6 +238,31 @@ class PostgresController:
         finally:
             session.close()
 
+    @contextmanager
+    def get_raw_connection(self) -> Iterator[Any]:
+        """
+        Provides a pooled DBAPI (psycopg2) connection for driver-level operations
+        such as COPY. It automatically handles commit, rollback, and returning
+        the connection to the pool.
+
+        Yields:
+                The DBAPI connection.
+        """
+        self._ensure_process()
+        connection = self._engine.raw_connection()
+        if self.profiler is not None:
+            connection.dbapi_connection.cursor_factory = self.profiler.cursor_factory()
+        try:
+            yield connection
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            if self.profiler is not None:
+                connection.dbapi_connection.cursor_factory = None
+            connection.close()
+
     def batch_insert(self, objects: list) -> None:
         """
         Inserts a list of SQLAlchemy model instances in a single transaction.
@@ -66,10 +272,70 @@ class PostgresController:
         with self.get_db_session() as session:
             session.add_all(objects)
 
+    def bulk_copy(
+        self,
+        entity: TableLike,
+        rows: Iterable[Any],
+        columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Streams rows into the entity's table with PostgreSQL `COPY FROM STDIN`
+        in a single transaction. This skips the ORM unit of work entirely and is
+        the fastest way to load large tables such as `fightstat`.
+
+        Args:
+            entity (TableLike): The ORM entity class (e.g. FightStatEntity) or its Table.
+            rows (Iterable): ORM instances, row records (see models.row_models), or
+                tuples ordered like `columns`.
+            columns (Optional[Sequence[str]]): Columns to load. Defaults to the fields of
+                row records, else every column of `__table__`; leave out `id` to let a
+                serial key be generated.
+
+        Returns:
+            int: The number of rows copied.
+        """
+        with self.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                return copy_rows(cursor, entity, rows, columns)
+
+    def batch_upsert(
+        self,
+        entity: TableLike,
+        rows: Iterable[Any],
+        columns: Optional[Sequence[str]] = None,
+        conflict_columns: Optional[Sequence[str]] = None,
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Inserts new rows and updates changed ones in a single transaction, using
+        multi-row `INSERT ... ON CONFLICT (id) DO UPDATE` statements.
+        Rows whose values already match the table are skipped, so re-running a
+        load with the deterministic `gen_id_from_url` keys only writes what changed.
+
+        Args:
+            entity (TableLike): The ORM entity class (e.g. FighterEntity) or its Table.
+            rows (Iterable): ORM instances, row records (see models.row_models), or
+                tuples ordered like `columns`.
+            columns (Optional[Sequence[str]]): Columns to write. Defaults to the fields of
+                row records, else every column.
+            conflict_columns (Optional[Sequence[str]]): The unique key to upsert on.
+                Defaults to the primary key.
+            page_size (int): Number of rows per statement.
+
+        Returns:
+            int: The number of rows inserted or changed.
+        """
+        with self.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                return upsert_rows(
+                    cursor, entity, rows, columns, conflict_columns, page_size
+                )
+
     def close_db(self) -> None:
         """
         Closes the database engine connection.
         This should be called when the application is shutting down.
         """
+        self._ensure_process()
         self._engine.dispose()
         print("Database connection closed.")
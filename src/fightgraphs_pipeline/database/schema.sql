@@ -117,6 +117,12 @@ CREATE TABLE fightstat (
     fighter_id INTEGER NOT NULL REFERENCES fighter(id),
     fight_id INTEGER NOT NULL REFERENCES fight(id)
 );
+-- Loads replace a fight's rows by deleting them first.
+CREATE INDEX IF NOT EXISTS ix_fightstat_fight_id ON fightstat (fight_id);
+-- init_db(partitions={"fightstat": N}) creates fightstat with
+-- PRIMARY KEY (id, fight_id) ... PARTITION BY HASH (fight_id) instead, and
+-- partitions fightstat_p0 .. fightstat_p<N-1>
+-- FOR VALUES WITH (MODULUS N, REMAINDER r).
 
 CREATE TABLE fightbonus (
     id SERIAL PRIMARY KEY,
@@ -146,4 +152,27 @@ CREATE TABLE titlefight (
     id SERIAL PRIMARY KEY,
     fight_id INTEGER NOT NULL REFERENCES fight(id),
     title_id INTEGER NOT NULL REFERENCES title(id)
+);
+
+CREATE TABLE extractionwatermark (
+    collection_name VARCHAR(100) PRIMARY KEY,
+    watermark_field VARCHAR(100) NOT NULL,
+    watermark_type VARCHAR(20) NOT NULL,
+    watermark TEXT NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE TABLE fingerprint (
+    entity VARCHAR(20) NOT NULL,
+    id INTEGER NOT NULL,
+    digest VARCHAR(32) NOT NULL,
+    PRIMARY KEY (entity, id)
+);
+
+CREATE TABLE loadprogress (
+    entity VARCHAR(20) PRIMARY KEY,
+    key_field VARCHAR(100) NOT NULL,
+    last_key TEXT NOT NULL,
+    batches INTEGER NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL
 );
\ No newline at end of file
@@ -0,0 +1,316 @@
+import functools
+import math
+import random
+import re
+import threading
+import time
+from typing import Any, Optional, Union
+
+from psycopg2.extensions import cursor as Psycopg2Cursor
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Latencies kept per statement for percentiles. Counts and totals stay exact.
+LATENCY_SAMPLE_SIZE = 4096
+
+# Statements EXPLAIN ANALYZE can run; COPY and DDL are left out.
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|\b(?:NULL|TRUE|FALSE)\b", re.IGNORECASE)
+_CAST = re.compile(r"\?::\w+(?:\[\])?")
+_COMMA = re.compile(r"\s*,\s*")
+_REPEATED_TUPLE = re.compile(r"(\([^()]*\))(?:, \1)+")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: Union[str, bytes]) -> str:
+    """
+    Reduces a statement to its shape, so executions that differ only in values
+    are aggregated together: literals, placeholders and their casts become "?", repeated
+    VALUES tuples (multi-row inserts, execute_values pages) collapse to one
+    tuple followed by "...", and IN lists to "IN (?)".
+    """
+    if isinstance(statement, bytes):
+        statement = statement.decode("utf-8", errors="replace")
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _CAST.sub("?", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _COMMA.sub(", ", statement)
+    statement = _REPEATED_TUPLE.sub(r"\1, ...", statement)
+    return _IN_LIST.sub("IN (?)", statement)
+
+
+class StatementStats:
+    """
+    Aggregated executions of one normalized statement.
+    """
+
+    def __init__(self, statement: str):
+        self.statement = statement
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.errors = 0
+        self.samples: list[float] = []
+        self.slowest: Optional[tuple[Any, Any]] = None
+        self.plan: Optional[str] = None
+
+    def add(
+        self, seconds: float, rows: int, statement: Any, parameters: Any, failed: bool
+    ) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.errors += failed
+        if rows > 0:
+            self.rows += rows
+        if seconds >= self.max_seconds:
+            self.max_seconds = seconds
+            self.slowest = (statement, parameters)
+        # Reservoir sampling keeps a uniform sample of latencies in bounded memory.
+        if len(self.samples) < LATENCY_SAMPLE_SIZE:
+            self.samples.append(seconds)
+        else:
+            index = random.randrange(self.count)
+            if index < LATENCY_SAMPLE_SIZE:
+                self.samples[index] = seconds
+
+    def percentile(self, fraction: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "statement": self.statement,
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+            "p95_seconds": self.percentile(0.95),
+            "max_seconds": self.max_seconds,
+            "rows": self.rows,
+            "errors": self.errors,
+            "plan": self.plan,
+        }
+
+
+class ProfilingCursor(Psycopg2Cursor):
+    """
+    psycopg2 cursor that reports its executions, including COPY, to a profiler.
+    Raw DBAPI connections bypass SQLAlchemy's engine events, so this is how the
+    profiler sees bulk_copy and batch_upsert.
+    """
+
+    def __init__(self, *args: Any, profiler: "SQLProfiler", **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._profiler = profiler
+
+    def _timed(self, statement: Any, parameters: Any, run: Any) -> Any:
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = run()
+            failed = False
+            return result
+        finally:
+            self._profiler.record(
+                statement,
+                parameters,
+                time.perf_counter() - started,
+                self.rowcount,
+                failed,
+            )
+
+    def execute(self, query: Any, vars: Any = None) -> None:
+        return self._timed(
+            query, vars, lambda: super(ProfilingCursor, self).execute(query, vars)
+        )
+
+    def executemany(self, query: Any, vars_list: Any) -> None:
+        vars_list = list(vars_list)
+        return self._timed(
+            query,
+            vars_list[:1],
+            lambda: super(ProfilingCursor, self).executemany(query, vars_list),
+        )
+
+    def copy_expert(self, sql: Any, file: Any, size: int = 8192) -> None:
+        return self._timed(
+            sql, None, lambda: super(ProfilingCursor, self).copy_expert(sql, file, size)
+        )
+
+
+class SQLProfiler:
+    """
+    Aggregates SQL executions by normalized statement: count, total, p95 and max
+    latency, and rows affected. Statements run through SQLAlchemy are captured
+    with engine events; statements on raw DBAPI connections (COPY and
+    execute_values upserts) through ProfilingCursor.
+
+    Many executions of one cheap statement point at an N+1 pattern; a high p95
+    on an upsert points at a slow load. `explain_slowest` re-runs the slowest
+    execution of the most expensive statements under EXPLAIN (ANALYZE, BUFFERS)
+    in a rolled-back transaction.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+        self._attached = False
+
+    def record(
+        self,
+        statement: Any,
+        parameters: Any,
+        seconds: float,
+        rows: int = -1,
+        failed: bool = False,
+    ) -> None:
+        """
+        Adds one execution of `statement`.
+        """
+        key = normalize_statement(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(key)
+            stats.add(seconds, rows, statement, parameters, failed)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        conn.info.setdefault("profiler_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        seconds = time.perf_counter() - conn.info["profiler_started"].pop()
+        if executemany:
+            parameters = list(parameters[:1])
+        self.record(statement, parameters, seconds, cursor.rowcount)
+
+    def _handle_error(self, exception_context) -> None:
+        connection = exception_context.connection
+        started = connection.info.get("profiler_started") if connection else None
+        if started:
+            self.record(
+                exception_context.statement or "",
+                exception_context.parameters,
+                time.perf_counter() - started.pop(),
+                failed=True,
+            )
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Starts profiling the statements SQLAlchemy runs on `engine`.
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        self._engine = engine
+        self._attached = True
+
+    def detach(self) -> None:
+        """
+        Stops profiling the engine passed to `attach`. The engine is still used
+        by explain_slowest.
+        """
+        if not self._attached:
+            return
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(self._engine, "handle_error", self._handle_error)
+        self._attached = False
+
+    def cursor_factory(self) -> functools.partial:
+        """
+        Returns a psycopg2 cursor factory whose cursors report to this profiler.
+        """
+        return functools.partial(ProfilingCursor, profiler=self)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+    def stats(self, sort_by: str = "total_seconds") -> list[StatementStats]:
+        """
+        Returns the aggregated statements, most expensive first.
+
+        Args:
+            sort_by (str): "total_seconds", "count", "max_seconds", "rows", or "p95_seconds".
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+        if sort_by == "p95_seconds":
+            return sorted(stats, key=lambda item: item.percentile(0.95), reverse=True)
+        return sorted(stats, key=lambda item: getattr(item, sort_by), reverse=True)
+
+    def as_dicts(self, sort_by: str = "total_seconds") -> list[dict[str, Any]]:
+        return [stats.as_dict() for stats in self.stats(sort_by)]
+
+    def explain_slowest(self, top: int = 5) -> list[StatementStats]:
+        """
+        Captures EXPLAIN (ANALYZE, BUFFERS) for the slowest execution of the `top`
+        statements with the highest total time. ANALYZE really runs the statement,
+        so each one runs in its own transaction, which is rolled back.
+
+        Returns:
+            list[StatementStats]: The explained statements, with `plan` set.
+        """
+        if self._engine is None:
+            raise RuntimeError("The profiler was never attached to an engine.")
+        explained = []
+        for stats in self.stats():
+            if len(explained) >= top:
+                break
+            if stats.slowest is None:
+                continue
+            statement, parameters = stats.slowest
+            if isinstance(statement, bytes):
+                statement = statement.decode("utf-8", errors="replace")
+            if not _EXPLAINABLE.match(statement):
+                continue
+            if isinstance(parameters, list):
+                parameters = parameters[0] if parameters else None
+            connection = self._engine.raw_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters or None
+                    )
+                    stats.plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception as error:
+                stats.plan = f"EXPLAIN failed: {error}"
+            finally:
+                connection.rollback()
+                connection.close()
+            explained.append(stats)
+        return explained
+
+    def report(self, top: int = 20, sort_by: str = "total_seconds") -> None:
+        """
+        Prints the `top` statements and, for explained ones, their plans.
+        """
+        print(
+            f"{'count':>9}{'total s':>10}{'p95 ms':>10}{'max ms':>10}{'rows':>11}  statement"
+        )
+        stats = self.stats(sort_by)[:top]
+        for item in stats:
+            statement = item.statement
+            if len(statement) > 120:
+                statement = statement[:117] + "..."
+            print(
+                f"{item.count:>9,}{item.total_seconds:>10.3f}"
+                f"{item.percentile(0.95) * 1000:>10.2f}{item.max_seconds * 1000:>10.2f}"
+                f"{item.rows:>11,}  {statement}"
+            )
+        for item in stats:
+            if item.plan:
+                print(f"\n{item.statement[:200]}\n{item.plan}")
@@ -0,0 +1,151 @@
+from typing import Any, Iterator, Optional
+
+from pymongo.collection import Collection
+
+from fightgraphs_pipeline.database.mongodb_controller import MongoDBController
+from fightgraphs_pipeline.extract.extraction import DEFAULT_BATCH_SIZE
+from fightgraphs_pipeline.models.row_models import FightStatRow
+from fightgraphs_pipeline.transform.fight_stat_mapper import (
+    STAT_FIELDS,
+    FightStatMapper,
+)
+
+# Fields of each flattened document, besides the raw STAT_FIELDS values.
+FLAT_FIGHT_STAT_KEYS: tuple[str, ...] = (
+    "fight_ufcstats_url",
+    "round_key",
+    "round_index",
+    "fighter_ufcstats_url",
+)
+
+
+def _fighter_round_stats(fighter: str) -> dict[str, Any]:
+    """
+    Projects one fighter's stats out of an unwound round. The fighter's URL falls
+    back to the fight-level one, as in FightStatMapper.map_fights_to_rows.
+    """
+    return {
+        "fighter_ufcstats_url": {
+            "$ifNull": [
+                f"$round.v.{fighter}.fighter_ufcstats_url",
+                f"${fighter}.fighter_ufcstats_url",
+            ]
+        },
+        **{field: f"$round.v.{fighter}.{field}" for field in STAT_FIELDS},
+    }
+
+
+def build_flat_fight_stats_pipeline(
+    query: Optional[dict[str, Any]] = None,
+) -> list[dict[str, Any]]:
+    """
+    Builds an aggregation pipeline that turns each fight's nested `fight_stats`
+    into one flat document per round per fighter, holding only FLAT_FIGHT_STAT_KEYS
+    and the STAT_FIELDS that fightstat rows need.
+
+    Args:
+        query (Optional[dict]): Filter applied to the fights first.
+
+    Returns:
+        list[dict]: The aggregation stages.
+    """
+    return [
+        {"$match": {**(query or {}), "fight_stats": {"$type": "object"}}},
+        {
+            "$project": {
+                "_id": 0,
+                "fight_ufcstats_url": 1,
+                "fighter1.fighter_ufcstats_url": 1,
+                "fighter2.fighter_ufcstats_url": 1,
+                "round": {"$objectToArray": "$fight_stats"},
+            }
+        },
+        {"$unwind": {"path": "$round", "includeArrayIndex": "round_index"}},
+        {
+            "$project": {
+                "fight_ufcstats_url": 1,
+                "round_index": 1,
+                "round_key": "$round.k",
+                "fighter": [
+                    _fighter_round_stats("fighter1"),
+                    _fighter_round_stats("fighter2"),
+                ],
+            }
+        },
+        {"$unwind": "$fighter"},
+        {
+            "$project": {
+                "fight_ufcstats_url": 1,
+                "round_index": 1,
+                "round_key": 1,
+                **{
+                    field: f"$fighter.{field}"
+                    for field in ("fighter_ufcstats_url", *STAT_FIELDS)
+                },
+            }
+        },
+    ]
+
+
+def iter_flat_fight_stats(
+    controller: MongoDBController,
+    collection_name: str = "fights",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    query: Optional[dict[str, Any]] = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Streams per-round, per-fighter stats already flattened by the server, in
+    batches of at most `batch_size` documents. Fights are never sent whole, so
+    transfer size and client-side dict walking shrink to what fightstat needs.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        collection_name (str): The name of the collection to extract fights from.
+        batch_size (int): Cursor batch size and maximum number of documents per batch.
+        query (Optional[dict]): Filter applied to the fights.
+
+    Yields:
+        list[dict]: The next batch of flat documents, see build_flat_fight_stats_pipeline.
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+
+    collection = controller.get_collection(collection_name)
+    return _stream_flat_fight_stats(collection, batch_size, query)
+
+
+def _stream_flat_fight_stats(
+    collection: Collection, batch_size: int, query: Optional[dict[str, Any]]
+) -> Iterator[list[dict[str, Any]]]:
+    documents: list[dict] = []
+    with collection.aggregate(
+        build_flat_fight_stats_pipeline(query),
+        batchSize=batch_size,
+        allowDiskUse=True,
+    ) as cursor:
+        for document in cursor:
+            documents.append(document)
+            if len(documents) >= batch_size:
+                yield documents
+                documents = []
+    if documents:
+        yield documents
+
+
+def iter_fight_stat_rows(
+    controller: MongoDBController,
+    collection_name: str = "fights",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    query: Optional[dict[str, Any]] = None,
+    mapper: Optional[FightStatMapper] = None,
+) -> Iterator[list[FightStatRow]]:
+    """
+    Streams fightstat rows built from server-flattened stats, without going
+    through FightModel. See iter_flat_fight_stats for the arguments.
+
+    Yields:
+        list[FightStatRow]: The rows of the next batch.
+    """
+    mapper = mapper or FightStatMapper()
+    batches = iter_flat_fight_stats(controller, collection_name, batch_size, query)
+    return (mapper.map_flat_stats(documents) for documents in batches)
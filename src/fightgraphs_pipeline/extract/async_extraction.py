@@ -0,0 +1,273 @@
+import asyncio
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, TypeVar
+
+from pydantic import BaseModel
+from pymongo.asynchronous.collection import AsyncCollection
+
+from fightgraphs_pipeline.database.async_mongodb_controller import (
+    AsyncMongoDBController,
+)
+from fightgraphs_pipeline.extract.extraction import (
+    DEFAULT_BATCH_SIZE,
+    build_events,
+    build_fighter_images,
+    build_fighters,
+    build_fights,
+)
+from fightgraphs_pipeline.models.mongodb_models import (
+    EventModel,
+    FighterImageModel,
+    FighterModel,
+    FightModel,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Keys per `$in` query, and `$in` queries in flight at once, for keyed lookups.
+DEFAULT_LOOKUP_CHUNK_SIZE = 500
+DEFAULT_MAX_CONCURRENT_LOOKUPS = 32
+
+
+def _aiter_batches(
+    controller: AsyncMongoDBController,
+    collection_name: str,
+    build_batch: Callable[[list[dict], bool], list[ModelT]],
+    batch_size: int,
+    projection: Optional[dict[str, Any]],
+    query: Optional[dict[str, Any]],
+    trusted: bool,
+) -> AsyncIterator[list[ModelT]]:
+    """
+    Streams a collection through a server-side cursor and yields the built models
+    in lists of at most `batch_size` items. Other tasks run while a batch is
+    being fetched. The arguments are checked when this is called, not when the
+    first batch is awaited.
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+
+    collection = controller.get_collection(collection_name)
+    return _astream_batches(
+        collection, build_batch, batch_size, projection, query, trusted
+    )
+
+
+async def _astream_batches(
+    collection: AsyncCollection,
+    build_batch: Callable[[list[dict], bool], list[ModelT]],
+    batch_size: int,
+    projection: Optional[dict[str, Any]],
+    query: Optional[dict[str, Any]],
+    trusted: bool,
+) -> AsyncIterator[list[ModelT]]:
+    documents: list[dict] = []
+    async with collection.find(
+        query or {}, projection, batch_size=batch_size
+    ) as cursor:
+        async for document in cursor:
+            documents.append(document)
+            if len(documents) >= batch_size:
+                yield build_batch(documents, trusted)
+                documents = []
+    if documents:
+        yield build_batch(documents, trusted)
+
+
+def aiter_fighters(
+    controller: AsyncMongoDBController,
+    collection_name: str = "fighters",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+) -> AsyncIterator[list[FighterModel]]:
+    """
+    Async counterpart of iter_fighters; see there for the arguments.
+    """
+    return _aiter_batches(
+        controller,
+        collection_name,
+        build_fighters,
+        batch_size,
+        projection,
+        query,
+        trusted,
+    )
+
+
+def aiter_fighter_images(
+    controller: AsyncMongoDBController,
+    collection_name: str = "fighter_images",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+) -> AsyncIterator[list[FighterImageModel]]:
+    """
+    Async counterpart of iter_fighter_images; see there for the arguments.
+    """
+    return _aiter_batches(
+        controller,
+        collection_name,
+        build_fighter_images,
+        batch_size,
+        projection,
+        query,
+        trusted,
+    )
+
+
+def aiter_events(
+    controller: AsyncMongoDBController,
+    collection_name: str = "events",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+) -> AsyncIterator[list[EventModel]]:
+    """
+    Async counterpart of iter_events; see there for the arguments.
+    """
+    return _aiter_batches(
+        controller,
+        collection_name,
+        build_events,
+        batch_size,
+        projection,
+        query,
+        trusted,
+    )
+
+
+def aiter_fights(
+    controller: AsyncMongoDBController,
+    collection_name: str = "fights",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+) -> AsyncIterator[list[FightModel]]:
+    """
+    Async counterpart of iter_fights; see there for the arguments.
+    """
+    return _aiter_batches(
+        controller,
+        collection_name,
+        build_fights,
+        batch_size,
+        projection,
+        query,
+        trusted,
+    )
+
+
+async def _collect(batches: AsyncIterator[list[ModelT]]) -> list[ModelT]:
+    return [model async for batch in batches for model in batch]
+
+
+async def extract_all_async(
+    controller: AsyncMongoDBController, trusted: bool = False
+) -> tuple[
+    list[FighterModel], list[FighterImageModel], list[EventModel], list[FightModel]
+]:
+    """
+    Extracts fighters, fighter images, events and fights with the four collection
+    scans running concurrently on the event loop.
+
+    Returns:
+        tuple: (fighters, fighter_images, events, fights)
+    """
+    return await asyncio.gather(
+        _collect(aiter_fighters(controller, trusted=trusted)),
+        _collect(aiter_fighter_images(controller, trusted=trusted)),
+        _collect(aiter_events(controller, trusted=trusted)),
+        _collect(aiter_fights(controller, trusted=trusted)),
+    )
+
+
+async def find_by_keys(
+    controller: AsyncMongoDBController,
+    collection_name: str,
+    build_batch: Callable[[list[dict], bool], list[ModelT]],
+    key: str,
+    values: Iterable[Any],
+    projection: Optional[dict[str, Any]] = None,
+    chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_LOOKUPS,
+    trusted: bool = False,
+) -> list[ModelT]:
+    """
+    Fetches the documents whose `key` is one of `values`, split into `$in` queries
+    of `chunk_size` keys that run concurrently, at most `max_concurrent` at a time.
+    Results are returned in no particular order; duplicate values are fetched once.
+
+    Args:
+        controller (AsyncMongoDBController): An instance of the AsyncMongoDBController class.
+        collection_name (str): The name of the collection to query.
+        build_batch (Callable): Builds models from documents, e.g. build_fighters.
+        key (str): The field to match, ideally indexed.
+        values (Iterable): The keys to look up.
+        projection (Optional[dict]): Fields to fetch.
+        chunk_size (int): Keys per `$in` query.
+        max_concurrent (int): Queries in flight at once.
+        trusted (bool): If True, validate each chunk in a single pydantic-core call.
+
+    Returns:
+        list[BaseModel]: The models found.
+    """
+    if chunk_size <= 0 or max_concurrent <= 0:
+        raise ValueError("chunk_size and max_concurrent must be positive integers.")
+
+    collection = controller.get_collection(collection_name)
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch(chunk: list[Any]) -> list[ModelT]:
+        async with semaphore:
+            documents = await collection.find(
+                {key: {"$in": chunk}}, projection, batch_size=len(chunk)
+            ).to_list()
+        return build_batch(documents, trusted) if documents else []
+
+    unique = iter(dict.fromkeys(values))
+    chunks = list(iter(lambda: list(islice(unique, chunk_size)), []))
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+    return [model for models in results for model in models]
+
+
+async def find_fighters_by_url(
+    controller: AsyncMongoDBController,
+    fighter_urls: Iterable[str],
+    collection_name: str = "fighters",
+    **kwargs: Any,
+) -> list[FighterModel]:
+    """
+    Looks up fighters by `fighter_ufcstats_url`. See find_by_keys for kwargs.
+    """
+    return await find_by_keys(
+        controller,
+        collection_name,
+        build_fighters,
+        "fighter_ufcstats_url",
+        fighter_urls,
+        **kwargs,
+    )
+
+
+async def find_fights_by_url(
+    controller: AsyncMongoDBController,
+    fight_urls: Iterable[str],
+    collection_name: str = "fights",
+    **kwargs: Any,
+) -> list[FightModel]:
+    """
+    Looks up fights by `fight_ufcstats_url`. See find_by_keys for kwargs.
+    """
+    return await find_by_keys(
+        controller,
+        collection_name,
+        build_fights,
+        "fight_ufcstats_url",
+        fight_urls,
+        **kwargs,
+    )
@@ -1,3 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from pymongo.collection import Collection
+
 from fightgraphs_pipeline.models.mongodb_models import (
     FighterInfoModel,
     FighterModel,
@@ -8,13 +14,395 @@ from fightgraphs_pipeline.models.mongodb_models import (
     RoundStatsModel,
     FightModel,
     FightRefModel,
+    validate_batch,
 )
 
 from fightgraphs_pipeline.database.mongodb_controller import MongoDBController
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _fill_missing(document: dict, model: type[BaseModel]) -> dict:
+    """
+    Sets required model fields that were left out of a projection to None,
+    so a projected document can still be turned into a model.
+    """
+    for name, field in model.model_fields.items():
+        if name not in document and field.is_required():
+            document[name] = None
+    return document
+
+
+def _iter_batches(
+    controller: MongoDBController,
+    collection_name: str,
+    build_batch: Callable[[list[dict], bool], list[ModelT]],
+    batch_size: int,
+    projection: Optional[dict[str, Any]],
+    query: Optional[dict[str, Any]],
+    trusted: bool,
+    sort: Optional[list[tuple[str, int]]] = None,
+) -> Iterator[list[ModelT]]:
+    """
+    Streams a collection through a server-side cursor and yields the built models
+    in lists of at most `batch_size` items. The arguments are checked when this is
+    called, not when the first batch is requested.
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+
+    collection = controller.get_collection(collection_name)
+    return _stream_batches(
+        collection, build_batch, batch_size, projection, query, trusted, sort
+    )
+
+
+def _stream_batches(
+    collection: Collection,
+    build_batch: Callable[[list[dict], bool], list[ModelT]],
+    batch_size: int,
+    projection: Optional[dict[str, Any]],
+    query: Optional[dict[str, Any]],
+    trusted: bool,
+    sort: Optional[list[tuple[str, int]]],
+) -> Iterator[list[ModelT]]:
+    documents: list[dict] = []
+    with collection.find(
+        query or {}, projection, batch_size=batch_size, sort=sort
+    ) as cursor:
+        for document in cursor:
+            documents.append(document)
+            if len(documents) >= batch_size:
+                yield build_batch(documents, trusted)
+                documents = []
+    if documents:
+        yield build_batch(documents, trusted)
+
+
+def _build_batch(
+    model: type[ModelT],
+    documents: list[dict],
+    build: Callable[[dict], ModelT],
+    trusted: bool,
+) -> list[ModelT]:
+    """
+    Builds a batch of models. Trusted batches are validated by pydantic-core in one
+    call, see _validate_trusted; untrusted batches are built one document at a
+    time so projected documents are normalized and errors point at the offending
+    document.
+    """
+    if trusted:
+        return _validate_trusted(model, documents, documents, build)
+    return [build(document) for document in documents]
+
+
+def _validate_trusted(
+    model: type[ModelT],
+    shaped: list[dict],
+    documents: list[dict],
+    build: Callable[[dict], ModelT],
+) -> list[ModelT]:
+    """
+    Validates a batch in one pydantic-core call. Only the documents that fail are
+    built one at a time from `documents`; the others are validated again in one
+    call, so a single bad document does not send the whole batch down the slow path.
+
+    Args:
+        model (type[BaseModel]): The model class to validate against.
+        shaped (list[dict]): The documents, shaped like the model.
+        documents (list[dict]): The same documents as stored, for `build`.
+        build (Callable[[dict], BaseModel]): Builds one model from a stored document.
+
+    Returns:
+        list[BaseModel]: The models, in input order.
+    """
+    try:
+        return validate_batch(model, shaped)
+    except ValidationError as error:
+        # The first element of an error's location is the document's index.
+        failed = {
+            detail["loc"][0]
+            for detail in error.errors()
+            if detail["loc"] and isinstance(detail["loc"][0], int)
+        }
+    if not failed:
+        return [build(document) for document in documents]
+    passed = [index for index in range(len(documents)) if index not in failed]
+    models = dict(
+        zip(
+            passed,
+            _validate_trusted(
+                model,
+                [shaped[index] for index in passed],
+                [documents[index] for index in passed],
+                build,
+            ),
+        )
+    )
+    return [
+        models[index] if index in models else build(document)
+        for index, document in enumerate(documents)
+    ]
+
+
+def build_fighter(document: dict) -> FighterModel:
+    """
+    Builds a FighterModel from a 'fighters' document.
+    """
+    return FighterModel(**_fill_missing(document, FighterModel))
+
+
+def build_fighter_image(document: dict) -> FighterImageModel:
+    """
+    Builds a FighterImageModel from a 'fighter_images' document.
+    """
+    return FighterImageModel(**_fill_missing(document, FighterImageModel))
+
+
+def build_event(document: dict) -> EventModel:
+    """
+    Builds an EventModel and its fight references from an 'events' document.
+    """
+    fight_refs = [
+        FightRefModel(fight_ufcstats_url=url, card_position=pos)
+        for url, pos in document.get("fight_refs") or []
+    ]
+    return EventModel(
+        event_name=document.get("event_name"),
+        event_date=document.get("event_date"),
+        event_location=document.get("event_location"),
+        event_status=document.get("event_status"),
+        event_ufcstats_url=document.get("event_ufcstats_url"),
+        fight_refs=fight_refs,
+    )
+
+
+def build_fight(document: dict) -> FightModel:
+    """
+    Builds a FightModel, including its details and per-round stats, from a 'fights' document.
+    """
+    fight_details = document.get("fight_details")
+    fight_stats = document.get("fight_stats")
+    return FightModel(
+        fight_ufcstats_url=document.get("fight_ufcstats_url"),
+        fighter1=FighterInfoModel(**document["fighter1"]),
+        fighter2=FighterInfoModel(**document["fighter2"]),
+        fight_details=(
+            FightDetailsModel(**fight_details) if fight_details is not None else None
+        ),
+        fight_stats=(
+            {
+                k: RoundStatsModel(
+                    fighter1=PerFighterRoundStatsModel(**v["fighter1"]),
+                    fighter2=PerFighterRoundStatsModel(**v["fighter2"]),
+                )
+                for k, v in fight_stats.items()
+            }
+            if fight_stats is not None
+            else None
+        ),
+    )
+
+
+def build_fighters(documents: list[dict], trusted: bool = False) -> list[FighterModel]:
+    """
+    Builds a batch of FighterModel objects from 'fighters' documents.
+    """
+    return _build_batch(FighterModel, documents, build_fighter, trusted)
+
+
+def build_fighter_images(
+    documents: list[dict], trusted: bool = False
+) -> list[FighterImageModel]:
+    """
+    Builds a batch of FighterImageModel objects from 'fighter_images' documents.
+    """
+    return _build_batch(FighterImageModel, documents, build_fighter_image, trusted)
+
+
+def build_events(documents: list[dict], trusted: bool = False) -> list[EventModel]:
+    """
+    Builds a batch of EventModel objects from 'events' documents.
+    Fight references are stored as [url, card_position] pairs and are reshaped
+    before trusted validation.
+    """
+    if trusted:
+        shaped = [
+            {
+                **document,
+                "fight_refs": [
+                    {"fight_ufcstats_url": url, "card_position": pos}
+                    for url, pos in document.get("fight_refs") or []
+                ],
+            }
+            for document in documents
+        ]
+        return _validate_trusted(EventModel, shaped, documents, build_event)
+    return [build_event(document) for document in documents]
+
+
+def build_fights(documents: list[dict], trusted: bool = False) -> list[FightModel]:
+    """
+    Builds a batch of FightModel objects from 'fights' documents.
+    """
+    return _build_batch(FightModel, documents, build_fight, trusted)
+
+
+def iter_fighters(
+    controller: MongoDBController,
+    collection_name: str = "fighters",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+    sort: Optional[list[tuple[str, int]]] = None,
+) -> Iterator[list[FighterModel]]:
+    """
+    Streams fighters from a MongoDB collection in batches.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        collection_name (str): The name of the collection to extract fighters from.
+        batch_size (int): Cursor batch size and maximum number of models per yielded batch.
+        projection (Optional[dict]): Fields to fetch. Required model fields left out are set to None.
+        query (Optional[dict]): Filter applied to the collection.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+        sort (Optional[list[tuple[str, int]]]): Order to stream documents in, e.g.
+            [("fight_ufcstats_url", 1)]. The sort fields should be indexed.
+
+    Yields:
+        list[FighterModel]: The next batch of extracted fighters.
+    """
+    return _iter_batches(
+        controller,
+        collection_name,
+        build_fighters,
+        batch_size,
+        projection,
+        query,
+        trusted,
+        sort,
+    )
+
+
+def iter_fighter_images(
+    controller: MongoDBController,
+    collection_name: str = "fighter_images",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+    sort: Optional[list[tuple[str, int]]] = None,
+) -> Iterator[list[FighterImageModel]]:
+    """
+    Streams fighter images from a MongoDB collection in batches.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        collection_name (str): The name of the collection to extract fighter images from.
+        batch_size (int): Cursor batch size and maximum number of models per yielded batch.
+        projection (Optional[dict]): Fields to fetch. Required model fields left out are set to None.
+        query (Optional[dict]): Filter applied to the collection.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+        sort (Optional[list[tuple[str, int]]]): Order to stream documents in, e.g.
+            [("fight_ufcstats_url", 1)]. The sort fields should be indexed.
+
+    Yields:
+        list[FighterImageModel]: The next batch of extracted fighter images.
+    """
+    return _iter_batches(
+        controller,
+        collection_name,
+        build_fighter_images,
+        batch_size,
+        projection,
+        query,
+        trusted,
+        sort,
+    )
+
+
+def iter_events(
+    controller: MongoDBController,
+    collection_name: str = "events",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+    sort: Optional[list[tuple[str, int]]] = None,
+) -> Iterator[list[EventModel]]:
+    """
+    Streams events from a MongoDB collection in batches.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        collection_name (str): The name of the collection to extract events from.
+        batch_size (int): Cursor batch size and maximum number of models per yielded batch.
+        projection (Optional[dict]): Fields to fetch. Fields left out are set to None.
+        query (Optional[dict]): Filter applied to the collection.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+        sort (Optional[list[tuple[str, int]]]): Order to stream documents in, e.g.
+            [("fight_ufcstats_url", 1)]. The sort fields should be indexed.
+
+    Yields:
+        list[EventModel]: The next batch of extracted events.
+    """
+    return _iter_batches(
+        controller,
+        collection_name,
+        build_events,
+        batch_size,
+        projection,
+        query,
+        trusted,
+        sort,
+    )
+
+
+def iter_fights(
+    controller: MongoDBController,
+    collection_name: str = "fights",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    projection: Optional[dict[str, Any]] = None,
+    query: Optional[dict[str, Any]] = None,
+    trusted: bool = False,
+    sort: Optional[list[tuple[str, int]]] = None,
+) -> Iterator[list[FightModel]]:
+    """
+    Streams fights from a MongoDB collection in batches.
+    Excluding `fight_stats` from the projection skips the per-round stats entirely.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        collection_name (str): The name of the collection to extract fights from.
+        batch_size (int): Cursor batch size and maximum number of models per yielded batch.
+        projection (Optional[dict]): Fields to fetch. `fighter1` and `fighter2` must be included.
+        query (Optional[dict]): Filter applied to the collection.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+        sort (Optional[list[tuple[str, int]]]): Order to stream documents in, e.g.
+            [("fight_ufcstats_url", 1)]. The sort fields should be indexed.
+
+    Yields:
+        list[FightModel]: The next batch of extracted fights.
+    """
+    return _iter_batches(
+        controller,
+        collection_name,
+        build_fights,
+        batch_size,
+        projection,
+        query,
+        trusted,
+        sort,
+    )
+
 
 def extract_fighters(
-    controller: MongoDBController, collection_name: str = "fighters"
+    controller: MongoDBController,
+    collection_name: str = "fighters",
+    trusted: bool = False,
 ) -> list[FighterModel]:
     """
     Extracts fighters from a MongoDB collection.
@@ -22,17 +410,21 @@ def extract_fighters(
     Args:
         collection_name (str): The name of the collection to extract fighters from.
         controller (MongoDBController): An instance of the MongoDBController class.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
 
     Returns:
         list[FighterModel]: A list of FighterModel objects representing the extracted fighters.
     """
-    fighters_collection = controller.get_collection(collection_name)
-    fighters = [FighterModel(**fighter) for fighter in fighters_collection.find()]
+    fighters = []
+    for batch in iter_fighters(controller, collection_name, trusted=trusted):
+        fighters.extend(batch)
     return fighters
 
 
 def extract_fighter_images(
-    controller: MongoDBController, collection_name: str = "fighter_images"
+    controller: MongoDBController,
+    collection_name: str = "fighter_images",
+    trusted: bool = False,
 ) -> list[FighterImageModel]:
     """
     Extracts fighter images from a MongoDB collection.
@@ -40,20 +432,21 @@ def extract_fighter_images(
     Args:
         collection_name (str): The name of the collection to extract fighter images from.
         controller (MongoDBController): An instance of the MongoDBController class.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
 
     Returns:
         list[FighterImageModel]: A list of FighterImageModel objects representing the extracted fighter images.
     """
-    fighter_images_collection = controller.get_collection(collection_name)
-    fighter_images = [
-        FighterImageModel(**fighter_image)
-        for fighter_image in fighter_images_collection.find()
-    ]
+    fighter_images = []
+    for batch in iter_fighter_images(controller, collection_name, trusted=trusted):
+        fighter_images.extend(batch)
     return fighter_images
 
 
 def extract_events(
-    controller: MongoDBController, collection_name: str = "events"
+    controller: MongoDBController,
+    collection_name: str = "events",
+    trusted: bool = False,
 ) -> list[EventModel]:
     """
     Extracts events from a MongoDB collection.
@@ -61,33 +454,21 @@ def extract_events(
     Args:
         collection_name (str): The name of the collection to extract events from.
         controller (MongoDBController): An instance of the MongoDBController class.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
 
     Returns:
         list[EventModel]: A list of EventModel objects representing the extracted events.
     """
     events = []
-    events_collection = controller.get_collection(collection_name)
-    for event in events_collection.find():
-        fight_refs = [
-            FightRefModel(fight_ufcstats_url=url, card_position=pos)
-            for url, pos in event["fight_refs"]
-        ]
-        events.append(
-            EventModel(
-                event_name=event.get("event_name"),
-                event_date=event.get("event_date"),
-                event_location=event.get("event_location"),
-                event_status=event.get("event_status"),
-                event_ufcstats_url=event.get("event_ufcstats_url"),
-                fight_refs=fight_refs,
-            )
-        )
-
+    for batch in iter_events(controller, collection_name, trusted=trusted):
+        events.extend(batch)
     return events
 
 
 def extract_fights(
-    controller: MongoDBController, collection_name: str = "fights"
+    controller: MongoDBController,
+    collection_name: str = "fights",
+    trusted: bool = False,
 ) -> list[FightModel]:
     """
     Extracts fights from a MongoDB collection.
@@ -95,32 +476,53 @@ def extract_fights(
     Args:
         collection_name (str): The name of the collection to extract fights from.
         controller (MongoDBController): An instance of the MongoDBController class.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
 
     Returns:
         list[FightModel]: A list of FightModel objects representing the extracted fights.
     """
-    fights_collection = controller.get_collection(collection_name)
     fights = []
-    for fight in fights_collection.find():
-        fight_ufcstats_url = fight["fight_ufcstats_url"]
-        fighter1 = FighterInfoModel(**fight["fighter1"])
-        fighter2 = FighterInfoModel(**fight["fighter2"])
-        fight_details = FightDetailsModel(**fight["fight_details"])
-        fight_stats = {
-            k: RoundStatsModel(
-                fighter1=PerFighterRoundStatsModel(**v["fighter1"]),
-                fighter2=PerFighterRoundStatsModel(**v["fighter2"]),
-            )
-            for k, v in fight["fight_stats"].items()
-        }
-        fights.append(
-            FightModel(
-                fight_ufcstats_url=fight_ufcstats_url,
-                fighter1=fighter1,
-                fighter2=fighter2,
-                fight_details=fight_details,
-                fight_stats=fight_stats,
-            )
-        )
-
+    for batch in iter_fights(controller, collection_name, trusted=trusted):
+        fights.extend(batch)
     return fights
+
+
+def extract_all(
+    controller: MongoDBController,
+    max_workers: int = 4,
+    trusted: bool = False,
+) -> tuple[
+    list[FighterModel], list[FighterImageModel], list[EventModel], list[FightModel]
+]:
+    """
+    Extracts fighters, fighter images, events and fights concurrently.
+    Each collection is scanned on its own thread through the controller's shared
+    MongoClient, so the wall-clock time is bound by the slowest collection.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        max_workers (int): Maximum number of collections scanned at the same time.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+
+    Returns:
+        tuple: The fighters, fighter images, events and fights, as returned by
+            `extract_fighters`, `extract_fighter_images`, `extract_events` and `extract_fights`.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer.")
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="extract"
+    ) as executor:
+        fights = executor.submit(extract_fights, controller, trusted=trusted)
+        fighters = executor.submit(extract_fighters, controller, trusted=trusted)
+        events = executor.submit(extract_events, controller, trusted=trusted)
+        fighter_images = executor.submit(
+            extract_fighter_images, controller, trusted=trusted
+        )
+        return (
+            fighters.result(),
+            fighter_images.result(),
+            events.result(),
+            fights.result(),
+        )
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Iterable, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.postgresql_models import FingerprintEntity
+
+T = TypeVar("T")
+
+# Mixed into every digest. Bump it when a mapper changes what it derives from the
+# same documents, so the next run treats every document as changed.
+FINGERPRINT_VERSION = 1
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Returns a stable digest of the source a row is mapped from. Models are hashed
+    as their JSON dump, in field order; other values, such as the fight
+    references of an event, as JSON with sorted keys.
+
+    Args:
+        *parts: Models, dicts or None, e.g. a fighter and its image.
+
+    Returns:
+        str: A 32-character hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{FINGERPRINT_VERSION}".encode())
+    for part in parts:
+        digest.update(b"\x00")
+        if isinstance(part, BaseModel):
+            digest.update(part.model_dump_json().encode("utf-8"))
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class FingerprintStore:
+    """
+    The digests of one entity type's documents as last loaded, used to skip
+    documents that have not changed since.
+
+    `partition` splits a batch before it is transformed and holds the new digests
+    of changed documents; `commit` stores them once their rows are loaded, so a
+    failed load is retried by the next run. Digests are only compared with what
+    the pipeline itself loaded: rows changed or deleted in PostgreSQL by anything
+    else are not detected, so clear the entity's fingerprints after doing that.
+    """
+
+    def __init__(self, postgres: PostgresController, entity: str):
+        """
+        Args:
+            postgres (PostgresController): The controller holding the fingerprint table.
+            entity (str): The entity type, e.g. "fighters".
+        """
+        self.postgres = postgres
+        self.entity = entity
+        self._digests: dict[int, str] = {}
+        self._pending: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self) -> int:
+        """
+        Reads the stored digests of this entity type.
+
+        Returns:
+            int: The number of digests read.
+        """
+        with self.postgres.get_db_session() as session:
+            rows = session.execute(
+                select(FingerprintEntity.id, FingerprintEntity.digest).where(
+                    FingerprintEntity.entity == self.entity
+                )
+            )
+            digests = {item_id: digest for item_id, digest in rows}
+        with self._lock:
+            self._digests = digests
+        return len(digests)
+
+    def partition(
+        self, items: list[T], key: Callable[[T], tuple[int, str]]
+    ) -> tuple[list[T], list[T]]:
+        """
+        Splits a batch into changed and unchanged items.
+
+        Args:
+            items (list): A batch of models.
+            key (Callable): Returns an item's gen_id_from_url id and fingerprint.
+
+        Returns:
+            tuple[list, list]: The changed items, including new ones, and the unchanged ones.
+        """
+        keyed = [(item, *key(item)) for item in items]
+        changed, unchanged = [], []
+        with self._lock:
+            for item, item_id, digest in keyed:
+                if self._digests.get(item_id) == digest:
+                    unchanged.append(item)
+                else:
+                    changed.append(item)
+                    self._pending[item_id] = digest
+        return changed, unchanged
+
+    def commit(self, ids: Iterable[int]) -> int:
+        """
+        Stores the digests `partition` held for `ids`, once their rows are loaded.
+
+        Returns:
+            int: The number of digests stored.
+        """
+        with self._lock:
+            rows = [
+                (self.entity, item_id, self._pending.pop(item_id))
+                for item_id in set(ids)
+                if item_id in self._pending
+            ]
+            self._digests.update((item_id, digest) for _, item_id, digest in rows)
+        if not rows:
+            return 0
+        self.postgres.batch_upsert(
+            FingerprintEntity, rows, columns=("entity", "id", "digest")
+        )
+        return len(rows)
+
+    def clear(self) -> None:
+        """
+        Deletes the stored digests of this entity type, so every document is
+        treated as changed.
+        """
+        with self.postgres.get_db_session() as session:
+            session.execute(
+                FingerprintEntity.__table__.delete().where(
+                    FingerprintEntity.entity == self.entity
+                )
+            )
+        with self._lock:
+            self._digests = {}
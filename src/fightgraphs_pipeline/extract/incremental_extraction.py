@@ -0,0 +1,318 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from fightgraphs_pipeline.database.mongodb_controller import MongoDBController
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.postgresql_models import ExtractionWatermarkEntity
+
+T = TypeVar("T")
+
+# Follows insertion order; see IncrementalWindow for what it misses.
+DEFAULT_WATERMARK_FIELD = "_id"
+
+_ENCODERS: dict[type, tuple[str, Callable[[Any], str]]] = {
+    ObjectId: ("objectid", str),
+    datetime: ("datetime", datetime.isoformat),
+    int: ("int", str),
+    float: ("float", repr),
+    str: ("str", str),
+}
+
+_DECODERS: dict[str, Callable[[str], Any]] = {
+    "objectid": ObjectId,
+    "datetime": datetime.fromisoformat,
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+
+def _encode_watermark(value: Any) -> tuple[str, str]:
+    if type(value) not in _ENCODERS:
+        raise TypeError(
+            f"Unsupported watermark type '{type(value).__name__}'. "
+            f"Use a field holding one of: {', '.join(t.__name__ for t in _ENCODERS)}."
+        )
+    watermark_type, encode = _ENCODERS[type(value)]
+    return watermark_type, encode(value)
+
+
+def get_watermark(
+    postgres: PostgresController, collection_name: str, watermark_field: str = "_id"
+) -> Optional[Any]:
+    """
+    Returns the stored high-water mark of a collection.
+
+    Args:
+        postgres (PostgresController): The controller holding the watermark table.
+        collection_name (str): The MongoDB collection name.
+        watermark_field (str): The field the watermark must have been taken on.
+
+    Returns:
+        Optional[Any]: The watermark value, or None if there is none for this field.
+    """
+    with postgres.get_db_session() as session:
+        checkpoint = session.get(ExtractionWatermarkEntity, collection_name)
+        if checkpoint is None or checkpoint.watermark_field != watermark_field:
+            return None
+        return _DECODERS[checkpoint.watermark_type](checkpoint.watermark)
+
+
+def save_watermark(
+    postgres: PostgresController,
+    collection_name: str,
+    watermark_field: str,
+    value: Any,
+) -> None:
+    """
+    Stores the high-water mark of a collection, replacing any previous one.
+
+    Args:
+        postgres (PostgresController): The controller holding the watermark table.
+        collection_name (str): The MongoDB collection name.
+        watermark_field (str): The field the watermark was taken on.
+        value (Any): An ObjectId, datetime, int, float or str.
+    """
+    watermark_type, watermark = _encode_watermark(value)
+    with postgres.get_db_session() as session:
+        session.merge(
+            ExtractionWatermarkEntity(
+                collection_name=collection_name,
+                watermark_field=watermark_field,
+                watermark_type=watermark_type,
+                watermark=watermark,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+
+
+def _current_max(
+    controller: MongoDBController,
+    collection_name: str,
+    watermark_field: str,
+    below: Optional[Any] = None,
+) -> Optional[Any]:
+    bounds: dict[str, Any] = {"$ne": None}
+    if below is not None:
+        bounds["$lt"] = below
+    collection = controller.get_collection(collection_name)
+    latest = list(
+        collection.find({watermark_field: bounds}, {watermark_field: 1})
+        .sort(watermark_field, DESCENDING)
+        .limit(1)
+    )
+    return latest[0][watermark_field] if latest else None
+
+
+def _current_min(
+    controller: MongoDBController,
+    collection_name: str,
+    watermark_field: str,
+    query: dict[str, Any],
+) -> Optional[Any]:
+    collection = controller.get_collection(collection_name)
+    earliest = list(
+        collection.find(query, {watermark_field: 1})
+        .sort(watermark_field, ASCENDING)
+        .limit(1)
+    )
+    return earliest[0].get(watermark_field) if earliest else None
+
+
+def combine_queries(*queries: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """
+    Returns a filter matching the documents every query matches, or None if no
+    query is given. Queries on different fields are merged into one document;
+    otherwise they are combined with $and.
+    """
+    queries = [query for query in queries if query]
+    if not queries:
+        return None
+    if len(queries) == 1:
+        return queries[0]
+    fields = [field for query in queries for field in query]
+    if len(fields) == len(set(fields)) and not any(
+        field.startswith("$") for field in fields
+    ):
+        return {field: value for query in queries for field, value in query.items()}
+    return {"$and": queries}
+
+
+class IncrementalWindow:
+    """
+    The documents of a collection added since its stored watermark, up to the
+    collection's current maximum of the watermark field.
+
+    The upper bound is read by `open`, before the scan, so documents written
+    during the scan are picked up by the next run. `commit` stores it as the new
+    watermark and must only be called once everything extracted from the window
+    is loaded, so a run that fails after extraction is retried in full. Documents
+    extracted but not loaded are passed to `hold`, which keeps the watermark
+    below them. The stored watermark never moves backwards, e.g. after the newest
+    documents are deleted.
+
+    The default `_id` watermark follows insertion time: documents updated in
+    place, such as a fighter whose record changes after a fight or an event whose
+    status and results are filled in after it was first scraped, are not picked
+    up again. Track a last-modified field written by the scraper for those
+    collections, or run with `full_refresh` now and then. The field should be
+    indexed.
+    """
+
+    def __init__(
+        self,
+        mongo: MongoDBController,
+        postgres: PostgresController,
+        collection_name: str,
+        watermark_field: str = DEFAULT_WATERMARK_FIELD,
+        full_refresh: bool = False,
+    ):
+        """
+        Args:
+            mongo (MongoDBController): The source controller.
+            postgres (PostgresController): The controller holding the watermark table.
+            collection_name (str): The MongoDB collection name.
+            watermark_field (str): The monotonically increasing field to track.
+            full_refresh (bool): If True, ignore the stored watermark and scan everything.
+        """
+        self.mongo = mongo
+        self.postgres = postgres
+        self.collection_name = collection_name
+        self.watermark_field = watermark_field
+        self.full_refresh = full_refresh
+        self.lower: Optional[Any] = None
+        self.upper: Optional[Any] = None
+        self.held: Optional[Any] = None
+
+    def open(self) -> bool:
+        """
+        Reads the collection's current maximum and the stored watermark.
+
+        Returns:
+            bool: Whether the window holds any documents.
+        """
+        self.upper = _current_max(
+            self.mongo, self.collection_name, self.watermark_field
+        )
+        self.held = None
+        self.lower = (
+            None
+            if self.full_refresh
+            else get_watermark(
+                self.postgres, self.collection_name, self.watermark_field
+            )
+        )
+        return not self.empty
+
+    @property
+    def empty(self) -> bool:
+        return self.upper is None or (
+            self.lower is not None and self.lower >= self.upper
+        )
+
+    def remaining_query(self) -> dict[str, Any]:
+        """
+        Returns the filter for the documents in the window.
+        """
+        bounds = {"$lte": self.upper}
+        if self.lower is not None:
+            bounds["$gt"] = self.lower
+        return {self.watermark_field: bounds}
+
+    def loaded_query(self) -> Optional[dict[str, Any]]:
+        """
+        Returns the filter for the documents loaded by earlier runs, or None if
+        there are none.
+        """
+        if self.lower is None:
+            return None
+        return {self.watermark_field: {"$lte": self.lower}}
+
+    def hold(self, query: dict[str, Any]) -> None:
+        """
+        Keeps the watermark below the oldest document in the window matching
+        `query`, so the next run extracts it again.
+
+        Args:
+            query (dict): A filter for documents extracted but not loaded, e.g. by
+                their URLs.
+        """
+        if self.empty:
+            return
+        oldest = _current_min(
+            self.mongo,
+            self.collection_name,
+            self.watermark_field,
+            combine_queries(query, self.remaining_query()),
+        )
+        if oldest is not None and (self.held is None or oldest < self.held):
+            self.held = oldest
+
+    def commit(self) -> None:
+        """
+        Stores the window's upper bound, or the newest value below a held
+        document, as the collection's watermark, unless the stored one is higher.
+        """
+        if self.empty:
+            return
+        watermark = self.upper
+        if self.held is not None:
+            watermark = _current_max(
+                self.mongo, self.collection_name, self.watermark_field, self.held
+            )
+        stored = get_watermark(
+            self.postgres, self.collection_name, self.watermark_field
+        )
+        if watermark is None or (stored is not None and watermark <= stored):
+            return
+        save_watermark(
+            self.postgres, self.collection_name, self.watermark_field, watermark
+        )
+
+
+def iter_incremental(
+    extractor: Callable[..., Iterator[list[T]]],
+    mongo: MongoDBController,
+    postgres: PostgresController,
+    collection_name: str,
+    watermark_field: str = DEFAULT_WATERMARK_FIELD,
+    full_refresh: bool = False,
+    query: Optional[dict[str, Any]] = None,
+    **extractor_kwargs: Any,
+) -> Iterator[list[T]]:
+    """
+    Streams only the documents added since the last run, using one of the
+    `iter_*` extraction functions, see IncrementalWindow.
+
+    The new watermark is stored once the caller has consumed every batch. A
+    caller that loads the batches in other threads, like Pipeline, should use
+    IncrementalWindow directly and commit it after the loads commit.
+
+    Args:
+        extractor (Callable): An `iter_*` function from `extract.extraction`, e.g. `iter_fights`.
+        mongo (MongoDBController): The source controller.
+        postgres (PostgresController): The controller holding the watermark table.
+        collection_name (str): The MongoDB collection name.
+        watermark_field (str): The monotonically increasing field to track.
+        full_refresh (bool): If True, ignore the stored watermark and scan everything.
+        query (Optional[dict]): Additional filter combined with the watermark range.
+        **extractor_kwargs: Passed through to the extractor (batch_size, projection, trusted).
+
+    Yields:
+        list: Batches of models, as yielded by the extractor.
+    """
+    window = IncrementalWindow(
+        mongo, postgres, collection_name, watermark_field, full_refresh
+    )
+    if not window.open():
+        return
+    yield from extractor(
+        mongo,
+        collection_name,
+        query=combine_queries(query, window.remaining_query()),
+        **extractor_kwargs,
+    )
+    window.commit()
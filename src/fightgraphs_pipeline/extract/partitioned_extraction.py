@@ -0,0 +1,243 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterator, Optional
+
+from pymongo import ASCENDING
+
+from fightgraphs_pipeline.database.mongodb_controller import MongoDBController
+from fightgraphs_pipeline.extract.extraction import DEFAULT_BATCH_SIZE, iter_fights
+from fightgraphs_pipeline.models.mongodb_models import FightModel
+
+# A key range as (inclusive lower bound, exclusive upper bound); None means unbounded.
+KeyRange = tuple[Optional[Any], Optional[Any]]
+
+# One controller per worker process and database, reused by every task it runs.
+_worker_controllers: dict[tuple[str, str], MongoDBController] = {}
+
+
+def compute_partitions(
+    controller: MongoDBController,
+    partitions: int,
+    collection_name: str = "fights",
+    key: str = "_id",
+) -> list[KeyRange]:
+    """
+    Splits a collection into contiguous, roughly equal-sized ranges of `key`
+    using a `$bucketAuto` aggregation over the key alone.
+
+    The first and last ranges are left open so documents inserted after the
+    split points were computed are still covered.
+
+    Args:
+        controller (MongoDBController): An instance of the MongoDBController class.
+        partitions (int): The number of ranges to produce.
+        collection_name (str): The name of the collection to split.
+        key (str): The field to range over, e.g. "_id" or "fight_ufcstats_url".
+
+    Returns:
+        list[KeyRange]: Ranges as (lower, upper) pairs, in key order.
+    """
+    if partitions <= 0:
+        raise ValueError("partitions must be a positive integer.")
+
+    collection = controller.get_collection(collection_name)
+    buckets = collection.aggregate(
+        [
+            {"$project": {key: 1}},
+            {"$bucketAuto": {"groupBy": f"${key}", "buckets": partitions}},
+        ],
+        allowDiskUse=True,
+    )
+    split_points = [bucket["_id"]["min"] for bucket in buckets][1:]
+    lowers = [None, *split_points]
+    uppers = [*split_points, None]
+    return list(zip(lowers, uppers))
+
+
+def _range_query(key: str, key_range: KeyRange) -> dict[str, Any]:
+    lower, upper = key_range
+    bounds = {}
+    if lower is not None:
+        bounds["$gte"] = lower
+    if upper is not None:
+        bounds["$lt"] = upper
+    return {key: bounds} if bounds else {}
+
+
+def _extract_fight_range(
+    mongo_uri: str,
+    db_name: str,
+    collection_name: str,
+    key: str,
+    key_range: KeyRange,
+    batch_size: int,
+    trusted: bool,
+) -> tuple[list[FightModel], Optional[KeyRange]]:
+    """
+    Worker entry point: scans and models the first `batch_size` documents of a
+    key range, in key order, on the worker process's own connection.
+
+    Returns:
+        tuple: The fights, and the rest of the range, or None if it is done.
+    """
+    if (mongo_uri, db_name) not in _worker_controllers:
+        _worker_controllers[mongo_uri, db_name] = MongoDBController(mongo_uri, db_name)
+    controller = _worker_controllers[mongo_uri, db_name]
+    lower, upper = key_range
+    following = list(
+        controller.get_collection(collection_name)
+        .find(_range_query(key, key_range), {key: 1})
+        .sort(key, ASCENDING)
+        .skip(batch_size)
+        .limit(1)
+    )
+    split = following[0][key] if following else upper
+    fights = []
+    for batch in iter_fights(
+        controller,
+        collection_name,
+        batch_size=batch_size,
+        query=_range_query(key, (lower, split)),
+        trusted=trusted,
+    ):
+        fights.extend(batch)
+    return fights, (split, upper) if following else None
+
+
+def iter_fights_partitioned(
+    mongo_uri: str,
+    db_name: str,
+    collection_name: str = "fights",
+    key: str = "_id",
+    partitions: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    trusted: bool = False,
+) -> Iterator[list[FightModel]]:
+    """
+    Extracts fights with a process pool, one key range per task.
+    Every worker process opens its own MongoDBController, so cursor reads and
+    Pydantic model construction run on separate cores.
+
+    A task extracts at most `batch_size` fights of its range and returns the rest
+    of the range, which is submitted again, so at most one chunk per range is held
+    in memory however large the ranges are. With a `key` that is not unique, a
+    chunk also takes every document sharing its last key.
+
+    Args:
+        mongo_uri (str): The MongoDB connection URI.
+        db_name (str): The name of the database to use.
+        collection_name (str): The name of the collection to extract fights from.
+        key (str): The field to partition on, e.g. "_id" or "fight_ufcstats_url".
+        partitions (Optional[int]): Number of ranges. Defaults to twice the worker count.
+        max_workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+        batch_size (int): Fights per task, and the cursor batch size.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+
+    Yields:
+        list[FightModel]: Up to `batch_size` fights of one range, in completion
+            order.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if partitions is None:
+        partitions = max_workers * 2
+    if max_workers <= 0 or partitions <= 0 or batch_size <= 0:
+        raise ValueError(
+            "max_workers, partitions and batch_size must be positive integers."
+        )
+    if not collection_name:
+        raise ValueError("Collection name cannot be empty.")
+    return _stream_fights_partitioned(
+        mongo_uri,
+        db_name,
+        collection_name,
+        key,
+        partitions,
+        max_workers,
+        batch_size,
+        trusted,
+    )
+
+
+def _stream_fights_partitioned(
+    mongo_uri: str,
+    db_name: str,
+    collection_name: str,
+    key: str,
+    partitions: int,
+    max_workers: int,
+    batch_size: int,
+    trusted: bool,
+) -> Iterator[list[FightModel]]:
+    controller = MongoDBController(mongo_uri, db_name)
+    try:
+        key_ranges = compute_partitions(controller, partitions, collection_name, key)
+    finally:
+        controller.close_connection()
+
+    # Workers are spawned rather than forked: a forked child would inherit the
+    # parent's MongoClient sockets and background threads.
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+
+        def submit(key_range: KeyRange) -> Future:
+            return executor.submit(
+                _extract_fight_range,
+                mongo_uri,
+                db_name,
+                collection_name,
+                key,
+                key_range,
+                batch_size,
+                trusted,
+            )
+
+        pending = {submit(key_range) for key_range in key_ranges}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                fights, rest = future.result()
+                if rest is not None:
+                    pending.add(submit(rest))
+                yield fights
+
+
+def extract_fights_partitioned(
+    mongo_uri: str,
+    db_name: str,
+    collection_name: str = "fights",
+    key: str = "_id",
+    partitions: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    trusted: bool = False,
+) -> list[FightModel]:
+    """
+    Extracts all fights with a process pool. See `iter_fights_partitioned`.
+
+    Args:
+        mongo_uri (str): The MongoDB connection URI.
+        db_name (str): The name of the database to use.
+        collection_name (str): The name of the collection to extract fights from.
+        key (str): The field to partition on, e.g. "_id" or "fight_ufcstats_url".
+        partitions (Optional[int]): Number of ranges. Defaults to twice the worker count.
+        max_workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+        trusted (bool): If True, validate each batch in a single pydantic-core call.
+
+    Returns:
+        list[FightModel]: The extracted fights. Order across ranges is not guaranteed.
+    """
+    fights = []
+    for batch in iter_fights_partitioned(
+        mongo_uri,
+        db_name,
+        collection_name,
+        key=key,
+        partitions=partitions,
+        max_workers=max_workers,
+        trusted=trusted,
+    ):
+        fights.extend(batch)
+    return fights
@@ -0,0 +1,346 @@
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+from sqlalchemy import select
+
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.mongodb_models import FightModel
+from fightgraphs_pipeline.models.postgresql_models import FightEntity, FighterEntity
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+# The result of a fight for the fighter an edge starts at.
+WIN = 1
+LOSS = -1
+NO_WIN = 0  # Draws, no contests and fights without a recorded winner.
+
+# The arrays a graph is made of, each saved to <name>.npy.
+ARRAYS = ("fighter_ids", "indptr", "opponents", "fight_ids", "results")
+
+
+class FightGraph:
+    """
+    Fighters and the fights between them as a compressed sparse row (CSR)
+    adjacency structure in NumPy arrays.
+
+    Fighters are numbered 0..n-1 in order of their gen_id_from_url id, kept in
+    `fighter_ids`. Every fight is stored as two edges, one from each fighter:
+    the edges of fighter i are positions indptr[i]..indptr[i+1] of `opponents`
+    (the opponent's number), `fight_ids` and `results` (WIN, LOSS or NO_WIN, for
+    fighter i). Rematches are separate edges.
+
+    Traversals run breadth-first over whole frontiers at once, so a query costs a
+    few array operations per hop rather than a SQL round trip. `save` writes the
+    arrays as .npy files, and `load` memory-maps them, so processes serving
+    queries share one copy of the graph through the page cache.
+    """
+
+    def __init__(
+        self,
+        fighter_ids: np.ndarray,
+        indptr: np.ndarray,
+        opponents: np.ndarray,
+        fight_ids: np.ndarray,
+        results: np.ndarray,
+    ):
+        """
+        Args:
+            fighter_ids (np.ndarray): The sorted fighter ids, one per fighter.
+            indptr (np.ndarray): Where each fighter's edges start, plus the edge count.
+            opponents (np.ndarray): The opponent's number, per edge.
+            fight_ids (np.ndarray): The fight id, per edge.
+            results (np.ndarray): The result for the edge's fighter, per edge.
+        """
+        if len(indptr) != len(fighter_ids) + 1:
+            raise ValueError("indptr must have one entry per fighter, plus one.")
+        edges = int(indptr[-1])
+        if not len(opponents) == len(fight_ids) == len(results) == edges:
+            raise ValueError(f"Every edge array must have {edges} entries.")
+        self.fighter_ids = fighter_ids
+        self.indptr = indptr
+        self.opponents = opponents
+        self.fight_ids = fight_ids
+        self.results = results
+
+    @classmethod
+    def from_edges(
+        cls,
+        fight_ids: Sequence[int],
+        fighter1_ids: Sequence[int],
+        fighter2_ids: Sequence[int],
+        winner_ids: Sequence[Optional[int]],
+        fighter_ids: Iterable[int] = (),
+    ) -> "FightGraph":
+        """
+        Builds a graph from fights given column-wise, like the fight table.
+
+        Args:
+            fight_ids (Sequence[int]): The id of each fight.
+            fighter1_ids (Sequence[int]): The first fighter of each fight.
+            fighter2_ids (Sequence[int]): The second fighter of each fight.
+            winner_ids (Sequence[Optional[int]]): The winner of each fight, or None.
+            fighter_ids (Iterable[int]): Fighters to include even without fights.
+
+        Returns:
+            FightGraph: The graph.
+        """
+        fights = np.asarray(fight_ids, dtype=np.int64)
+        first = np.asarray(fighter1_ids, dtype=np.int64)
+        second = np.asarray(fighter2_ids, dtype=np.int64)
+        winners = np.array(
+            [-1 if winner is None else winner for winner in winner_ids],
+            dtype=np.int64,
+        )
+        if not len(fights) == len(first) == len(second) == len(winners):
+            raise ValueError("Every fight column must have the same length.")
+
+        ids = np.unique(
+            np.concatenate([first, second, np.fromiter(fighter_ids, dtype=np.int64)])
+        )
+        first_index = np.searchsorted(ids, first)
+        second_index = np.searchsorted(ids, second)
+        first_results = np.where(
+            winners == first, WIN, np.where(winners == second, LOSS, NO_WIN)
+        ).astype(np.int8)
+
+        sources = np.concatenate([first_index, second_index])
+        targets = np.concatenate([second_index, first_index])
+        # Edges are grouped by fighter, and by opponent within a fighter.
+        order = np.lexsort((targets, sources))
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(ids)), out=indptr[1:])
+        return cls(
+            ids,
+            indptr,
+            targets[order].astype(np.int32),
+            np.concatenate([fights, fights])[order],
+            np.concatenate([first_results, -first_results])[order],
+        )
+
+    @classmethod
+    def from_postgres(cls, postgres: PostgresController) -> "FightGraph":
+        """
+        Builds the graph of every fighter and fight loaded into PostgreSQL.
+        """
+        with postgres.get_db_session() as session:
+            fighter_ids = session.execute(select(FighterEntity.id)).scalars().all()
+            fights = session.execute(
+                select(
+                    FightEntity.id,
+                    FightEntity.fighter1_id,
+                    FightEntity.fighter2_id,
+                    FightEntity.winner_id,
+                )
+            ).all()
+        columns = list(zip(*fights)) or [(), (), (), ()]
+        return cls.from_edges(*columns, fighter_ids=fighter_ids)
+
+    @classmethod
+    def from_fights(cls, fights: Iterable[FightModel]) -> "FightGraph":
+        """
+        Builds a graph straight from MongoDB fight documents, with the ids and
+        winners FightMapper derives from them. Fights missing a fighter's URL are
+        left out.
+        """
+        columns: tuple[list, list, list, list] = ([], [], [], [])
+        for fight in fights:
+            if not (
+                fight.fight_ufcstats_url
+                and fight.fighter1.fighter_ufcstats_url
+                and fight.fighter2.fighter_ufcstats_url
+            ):
+                continue
+            fighter1_id = gen_id_from_url(fight.fighter1.fighter_ufcstats_url)
+            fighter2_id = gen_id_from_url(fight.fighter2.fighter_ufcstats_url)
+            winner_id = None
+            if fight.fighter1.fighter_status == "W":
+                winner_id = fighter1_id
+            elif fight.fighter2.fighter_status == "W":
+                winner_id = fighter2_id
+            for column, value in zip(
+                columns,
+                (
+                    gen_id_from_url(fight.fight_ufcstats_url),
+                    fighter1_id,
+                    fighter2_id,
+                    winner_id,
+                ),
+            ):
+                column.append(value)
+        return cls.from_edges(*columns)
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """
+        Writes the graph's arrays to .npy files in `directory`, creating it.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "FightGraph":
+        """
+        Reads a graph written by `save`.
+
+        Args:
+            directory (Union[str, Path]): The directory the graph was saved to.
+            mmap (bool): Memory-map the arrays read-only instead of reading them
+                into memory, so every process loading them shares the pages.
+
+        Returns:
+            FightGraph: The graph.
+        """
+        directory = Path(directory)
+        return cls(
+            *(
+                np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+                for name in ARRAYS
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.fighter_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.opponents)
+
+    def __contains__(self, fighter_id: int) -> bool:
+        index = int(np.searchsorted(self.fighter_ids, fighter_id))
+        return index < len(self) and self.fighter_ids[index] == fighter_id
+
+    def index(self, fighter_id: int) -> int:
+        """
+        Returns a fighter's number, raising KeyError for fighters not in the graph.
+        """
+        index = int(np.searchsorted(self.fighter_ids, fighter_id))
+        if index == len(self) or self.fighter_ids[index] != fighter_id:
+            raise KeyError(fighter_id)
+        return index
+
+    def _edges(
+        self, fighters: np.ndarray, result: Optional[int] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the positions of the edges of `fighters` with the given result,
+        and the fighter each one starts at.
+        """
+        starts = self.indptr[fighters]
+        counts = self.indptr[fighters + 1] - starts
+        ends = np.cumsum(counts)
+        positions = np.arange(int(ends[-1]) if len(ends) else 0) - np.repeat(
+            ends - counts - starts, counts
+        )
+        sources = np.repeat(fighters, counts)
+        if result is not None:
+            keep = self.results[positions] == result
+            positions, sources = positions[keep], sources[keep]
+        return positions, sources
+
+    def _traverse(
+        self,
+        start: int,
+        result: Optional[int],
+        hops: Optional[int] = None,
+        target: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Runs a breadth-first search from fighter number `start`, for at most
+        `hops` hops or until `target` is reached.
+
+        Returns:
+            np.ndarray: The fighter each fighter was first reached from, -1 for
+                fighters not reached; `start` is its own.
+        """
+        parents = np.full(len(self), -1, dtype=np.int64)
+        parents[start] = start
+        frontier = np.array([start], dtype=np.int64)
+        hop = 0
+        while len(frontier) and (hops is None or hop < hops):
+            positions, sources = self._edges(frontier, result)
+            targets = self.opponents[positions]
+            unseen = parents[targets] < 0
+            targets, first = np.unique(targets[unseen], return_index=True)
+            parents[targets] = sources[unseen][first]
+            frontier = targets.astype(np.int64)
+            hop += 1
+            if target is not None and parents[target] >= 0:
+                break
+        return parents
+
+    def opponents_of(self, fighter_id: int, result: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the ids of a fighter's opponents.
+
+        Args:
+            fighter_id (int): The fighter.
+            result (Optional[int]): Only the opponents the fighter got this result
+                against, e.g. WIN for the ones they beat. None for all of them.
+
+        Returns:
+            np.ndarray: The opponents' ids, sorted.
+        """
+        index = self.index(fighter_id)
+        positions, _ = self._edges(np.array([index]), result)
+        return self.fighter_ids[np.unique(self.opponents[positions])]
+
+    def common_opponents(self, fighter_id: int, other_id: int) -> np.ndarray:
+        """
+        Returns the ids of the fighters both fighters have fought, sorted.
+        """
+        return np.intersect1d(
+            self.opponents_of(fighter_id),
+            self.opponents_of(other_id),
+            assume_unique=True,
+        )
+
+    def neighbourhood(
+        self, fighter_id: int, hops: int, result: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Returns the ids of the fighters within `hops` fights of a fighter, not
+        including the fighter.
+
+        Args:
+            fighter_id (int): The fighter to start from.
+            hops (int): The number of fights to follow, e.g. 2 for opponents and
+                their opponents.
+            result (Optional[int]): Only follow fights with this result for the
+                fighter the fight is followed from, e.g. WIN for who they beat, who
+                those beat, and so on. None follows every fight.
+
+        Returns:
+            np.ndarray: The fighters' ids, sorted.
+        """
+        start = self.index(fighter_id)
+        parents = self._traverse(start, result, hops=hops)
+        reached = np.flatnonzero(parents >= 0)
+        return self.fighter_ids[reached[reached != start]]
+
+    def shortest_path(
+        self, fighter_id: int, other_id: int, result: Optional[int] = WIN
+    ) -> Optional[list[int]]:
+        """
+        Finds a shortest chain of fights from one fighter to another. With the
+        default WIN, it is a chain of wins: fighter_id beat x, x beat y, ..., and
+        the last beat other_id.
+
+        Args:
+            fighter_id (int): The fighter the chain starts at.
+            other_id (int): The fighter the chain ends at.
+            result (Optional[int]): The result every fight in the chain has for the
+                fighter before it. None follows every fight.
+
+        Returns:
+            Optional[list[int]]: The fighters' ids along the chain, both ends
+                included, or None if there is no chain.
+        """
+        start, target = self.index(fighter_id), self.index(other_id)
+        parents = self._traverse(start, result, target=target)
+        if parents[target] < 0:
+            return None
+        path = [target]
+        while path[-1] != start:
+            path.append(int(parents[path[-1]]))
+        return [int(self.fighter_ids[index]) for index in reversed(path)]
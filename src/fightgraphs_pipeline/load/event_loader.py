@@ -0,0 +1,24 @@
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.postgresql_models import EventEntity, PromotionEntity
+
+
+def load_promotions(postgres: PostgresController) -> int:
+    """
+    Upserts the promotions every event and weight class refers to.
+    UFC (id 1) is the only promotion in this context.
+    """
+    return postgres.batch_upsert(PromotionEntity, [PromotionEntity(id=1, name="UFC")])
+
+
+def load_events(postgres: PostgresController, event_entities: list[EventEntity]) -> int:
+    """
+    Upserts mapped events.
+
+    Args:
+        postgres (PostgresController): An instance of the PostgresController class.
+        event_entities (list[EventEntity]): Events from EventMapper.map_event_to_postgres.
+
+    Returns:
+        int: The number of rows inserted or changed.
+    """
+    return postgres.batch_upsert(EventEntity, event_entities)
@@ -0,0 +1,125 @@
+from typing import Any, Iterable, Optional
+
+from fightgraphs_pipeline.database.bulk_operations import copy_rows
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.load.partition_router import PartitionRouter
+from fightgraphs_pipeline.models.postgresql_models import (
+    FightEntity,
+    FightStatEntity,
+    ScorecardEntity,
+)
+from fightgraphs_pipeline.models.row_models import (
+    FightRow,
+    FightStatRow,
+    ScorecardRow,
+)
+from fightgraphs_pipeline.transform.fight_mapper import FightMapper
+
+
+def load_fights(
+    postgres: PostgresController,
+    fight_mapper: FightMapper,
+    fight_and_scorecard_entities: list[dict[str, Any]],
+) -> int:
+    """
+    Upserts mapped fights and their scorecards. The dimension values the mapper
+    queued are flushed first so the fights' foreign keys resolve.
+
+    Args:
+        postgres (PostgresController): An instance of the PostgresController class.
+        fight_mapper (FightMapper): The mapper that produced the entities.
+        fight_and_scorecard_entities (list[dict[str, Any]]): The output of
+            FightMapper.map_fights_to_entities.
+
+    Returns:
+        int: The number of rows inserted or changed.
+    """
+    written = fight_mapper.flush_dimensions()
+    written += postgres.batch_upsert(
+        FightEntity,
+        [entities["fight_entity"] for entities in fight_and_scorecard_entities],
+    )
+    written += postgres.batch_upsert(
+        ScorecardEntity,
+        [
+            scorecard
+            for entities in fight_and_scorecard_entities
+            for scorecard in entities["scorecard_entities"]
+        ],
+    )
+    return written
+
+
+def load_fight_rows(
+    postgres: PostgresController,
+    fight_mapper: FightMapper,
+    fight_rows: list[FightRow],
+    scorecard_rows: list[ScorecardRow],
+) -> int:
+    """
+    Upserts fight and scorecard rows, as returned by FightMapper.map_fight_to_rows.
+    The dimension values the mapper queued are flushed first.
+
+    Returns:
+        int: The number of rows inserted or changed.
+    """
+    written = fight_mapper.flush_dimensions()
+    written += postgres.batch_upsert(FightEntity, fight_rows)
+    written += postgres.batch_upsert(ScorecardEntity, scorecard_rows)
+    return written
+
+
+def load_fight_stats(
+    postgres: PostgresController,
+    rows: list[FightStatRow],
+    router: Optional[PartitionRouter] = None,
+) -> int:
+    """
+    Copies fightstat rows from FightStatMapper into the table, letting the serial
+    id be generated. The fights they refer to must already be loaded.
+
+    Args:
+        postgres (PostgresController): An instance of the PostgresController class.
+        rows (list[FightStatRow]): Rows from FightStatMapper.
+        router (Optional[PartitionRouter]): Copies the rows into the partitions of
+            a partitioned fightstat table directly.
+
+    Returns:
+        int: The number of rows copied.
+    """
+    if router is not None:
+        return router.load(rows)
+    return postgres.bulk_copy(FightStatEntity, rows)
+
+
+def replace_fight_stats(
+    postgres: PostgresController,
+    fight_ids: Iterable[int],
+    rows: list[FightStatRow],
+    router: Optional[PartitionRouter] = None,
+) -> int:
+    """
+    Replaces the fightstat rows of `fight_ids` with `rows` in one transaction, so
+    loading the same fights again does not duplicate their stats.
+
+    Args:
+        postgres (PostgresController): An instance of the PostgresController class.
+        fight_ids (Iterable[int]): The fights whose stats are replaced, including
+            fights that no longer have any.
+        rows (list[FightStatRow]): Rows from FightStatMapper for those fights.
+        router (Optional[PartitionRouter]): Replaces the rows partition by partition
+            in a partitioned fightstat table. Each fight's rows are still replaced
+            in one transaction.
+
+    Returns:
+        int: The number of rows copied.
+    """
+    if router is not None:
+        return router.load(rows, replace_keys=fight_ids)
+    with postgres.get_raw_connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FightStatEntity.__tablename__} WHERE fight_id = ANY(%s)",
+                (list(fight_ids),),
+            )
+            return copy_rows(cursor, FightStatEntity, rows)
@@ -0,0 +1,51 @@
+from typing import Any
+
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.postgresql_models import (
+    FighterEntity,
+    FighterRecordEntity,
+)
+from fightgraphs_pipeline.models.row_models import FighterRecordRow, FighterRow
+
+
+def load_fighters(
+    postgres: PostgresController, fighter_and_record_entities: list[dict[str, Any]]
+) -> int:
+    """
+    Upserts mapped fighters and their records, fighters first so the records'
+    foreign keys resolve.
+
+    Args:
+        postgres (PostgresController): An instance of the PostgresController class.
+        fighter_and_record_entities (list[dict[str, Any]]): The output of
+            FighterMapper.map_fighters_to_entities.
+
+    Returns:
+        int: The number of rows inserted or changed.
+    """
+    written = postgres.batch_upsert(
+        FighterEntity,
+        [entities["fighter_entity"] for entities in fighter_and_record_entities],
+    )
+    written += postgres.batch_upsert(
+        FighterRecordEntity,
+        [entities["fighter_record_entity"] for entities in fighter_and_record_entities],
+    )
+    return written
+
+
+def load_fighter_rows(
+    postgres: PostgresController,
+    fighter_rows: list[FighterRow],
+    fighter_record_rows: list[FighterRecordRow],
+) -> int:
+    """
+    Upserts fighter and fighterrecord rows, as returned by
+    FighterMapper.map_fighters_to_rows.
+
+    Returns:
+        int: The number of rows inserted or changed.
+    """
+    written = postgres.batch_upsert(FighterEntity, fighter_rows)
+    written += postgres.batch_upsert(FighterRecordEntity, fighter_record_rows)
+    return written
@@ -0,0 +1,135 @@
+import threading
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, Optional
+
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.postgresql_models import LoadProgressEntity
+
+# The unique field each entity's documents are extracted in order of when a load
+# is checkpointed. Extraction sorts on it, so it should be indexed.
+CHECKPOINT_KEYS: dict[str, str] = {
+    "fighters": "fighter_ufcstats_url",
+    "events": "event_ufcstats_url",
+    "fights": "fight_ufcstats_url",
+}
+
+
+class LoadCheckpoint:
+    """
+    Records how far a load sorted on a unique key has got, so a restarted run can
+    resume after the last batch committed instead of starting over.
+
+    Batches are numbered in extraction order and finish out of order when a stage
+    has several workers. Progress only moves past a batch once it and every batch
+    before it are done, so a resumed run redoes at most the batches that were in
+    flight; the loads are upserts, so redoing them is harmless.
+    """
+
+    def __init__(
+        self, postgres: PostgresController, entity: str, key_field: Optional[str] = None
+    ):
+        """
+        Args:
+            postgres (PostgresController): The controller holding the loadprogress table.
+            entity (str): The entity type, e.g. "fights".
+            key_field (Optional[str]): The unique field documents are sorted on.
+                Defaults to the entity's entry in CHECKPOINT_KEYS.
+        """
+        self.postgres = postgres
+        self.entity = entity
+        self.key_field = key_field or CHECKPOINT_KEYS[entity]
+        self.last_key: Optional[str] = None
+        self.batches = 0
+        self._last_keys: dict[int, str] = {}
+        self._done: set[int] = set()
+        self._next = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def start(self, resume: bool = False) -> Optional[str]:
+        """
+        Prepares a run. With `resume`, the stored progress is read; otherwise it is
+        deleted, and the run starts from the beginning.
+
+        Returns:
+            Optional[str]: The key the run resumes after, or None.
+        """
+        with self.postgres.get_db_session() as session:
+            progress = session.get(LoadProgressEntity, self.entity)
+            if progress is not None and (
+                not resume or progress.key_field != self.key_field
+            ):
+                session.delete(progress)
+                progress = None
+            self.last_key = progress.last_key if progress is not None else None
+            self.batches = progress.batches if progress is not None else 0
+        return self.last_key
+
+    @property
+    def sort(self) -> list[tuple[str, int]]:
+        return [(self.key_field, 1)]
+
+    def remaining_query(self) -> Optional[dict[str, Any]]:
+        """
+        Returns the filter for the documents not loaded yet, or None for all of them.
+        """
+        if self.last_key is None:
+            return None
+        return {self.key_field: {"$gt": self.last_key}}
+
+    def loaded_query(self) -> Optional[dict[str, Any]]:
+        """
+        Returns the filter for the documents loaded before a resume, or None if there
+        are none.
+        """
+        if self.last_key is None:
+            return None
+        return {self.key_field: {"$lte": self.last_key}}
+
+    def track(self, batches: Iterable[list]) -> Iterator[list]:
+        """
+        Passes `batches` through, noting the key of each batch's last model.
+        Batches must be sorted on the key and are numbered from 0, as run_pipeline
+        numbers them.
+        """
+        for sequence, batch in enumerate(batches):
+            if batch:
+                with self._lock:
+                    self._last_keys[sequence] = getattr(batch[-1], self.key_field)
+            yield batch
+
+    def done(self, sequence: int) -> None:
+        """
+        Marks a batch as committed, and stores the new progress if every batch
+        before it is committed too.
+        """
+        with self._lock:
+            self._done.add(sequence)
+            advanced = False
+            while self._next in self._done:
+                self._done.remove(self._next)
+                last_key = self._last_keys.pop(self._next, None)
+                if last_key is not None:
+                    self.last_key = last_key
+                    self.batches += 1
+                    advanced = True
+                self._next += 1
+        if advanced:
+            self._save()
+
+    def _save(self) -> None:
+        # Saves are serialized and each writes the latest progress, so a slow
+        # save never overwrites a later one.
+        with self._save_lock:
+            with self._lock:
+                last_key, batches = self.last_key, self.batches
+            with self.postgres.get_db_session() as session:
+                session.merge(
+                    LoadProgressEntity(
+                        entity=self.entity,
+                        key_field=self.key_field,
+                        last_key=last_key,
+                        batches=batches,
+                        updated_at=datetime.now(timezone.utc),
+                    )
+                )
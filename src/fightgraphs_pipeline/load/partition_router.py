@@ -0,0 +1,219 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Optional, Sequence
+
+from sqlalchemy.dialects import postgresql
+
+from fightgraphs_pipeline.database.bulk_operations import (
+    TableLike,
+    copy_rows,
+    get_table,
+    iter_row_values,
+    resolve_columns,
+)
+from fightgraphs_pipeline.database.partitioning import PARTITION_KEYS
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+
+_HASH_BOUND = re.compile(r"modulus (\d+), remainder (\d+)", re.IGNORECASE)
+
+
+class PartitionRouter:
+    """
+    Routes the rows of a hash-partitioned table to its partitions, so each
+    partition's rows are COPY'd into it directly, and partitions are loaded in
+    parallel over separate connections.
+
+    PostgreSQL's hash functions are not reproduced here: the partition of each
+    new key value is asked from the database, with satisfies_hash_partition, and
+    remembered. Rows of one key value always share a partition, so replacing
+    them stays atomic however the partitions are loaded.
+    """
+
+    def __init__(
+        self,
+        postgres: PostgresController,
+        entity: TableLike,
+        column: Optional[str] = None,
+        workers: int = 1,
+    ):
+        """
+        Args:
+            postgres (PostgresController): The target database. Its pool must allow
+                `workers` more connections than the callers already hold.
+            entity (TableLike): The ORM entity class or Table, e.g. FightStatEntity.
+            column (Optional[str]): The partition key. Defaults to the table's entry
+                in PARTITION_KEYS.
+            workers (int): Partitions loaded at the same time. With one, a load runs
+                in a single transaction.
+        """
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer.")
+        self.postgres = postgres
+        self.table = get_table(entity)
+        self.column = column or PARTITION_KEYS[self.table.name]
+        self.workers = workers
+        self.partitions: list[tuple[str, int, int]] = []
+        self._key_type = self.table.columns[self.column].type.compile(
+            dialect=postgresql.dialect()
+        )
+        self._partition_of: dict[Any, str] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """
+        Reads the table's hash partitions from the catalog.
+
+        Returns:
+            int: The number of partitions, 0 if the table is not hash-partitioned.
+        """
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+                    "FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = to_regclass(%s)",
+                    (self.table.name,),
+                )
+                bounds = cursor.fetchall()
+        partitions = []
+        for name, bound in bounds:
+            match = _HASH_BOUND.search(bound or "")
+            if match is not None:
+                partitions.append((name, int(match.group(1)), int(match.group(2))))
+        with self._lock:
+            self.partitions = sorted(partitions)
+            self._partition_of = {}
+        return len(partitions)
+
+    def _lookup(self, cursor: Any, keys: set) -> None:
+        with self._lock:
+            missing = [key for key in keys if key not in self._partition_of]
+        if not missing:
+            return
+        names, moduli, remainders = zip(*self.partitions)
+        cursor.execute(
+            f"SELECT key, partition.name FROM unnest(%s::{self._key_type}[]) AS key, "
+            "unnest(%s::text[], %s::int[], %s::int[]) "
+            "AS partition(name, modulus, remainder) "
+            "WHERE satisfies_hash_partition("
+            "to_regclass(%s)::oid, partition.modulus, partition.remainder, key)",
+            (missing, list(names), list(moduli), list(remainders), self.table.name),
+        )
+        found = dict(cursor.fetchall())
+        unrouted = [key for key in missing if key not in found]
+        if unrouted:
+            raise ValueError(
+                f"No partition of '{self.table.name}' holds {self.column} values "
+                f"{unrouted[:10]}."
+            )
+        with self._lock:
+            self._partition_of.update(found)
+
+    def route(
+        self,
+        cursor: Any,
+        rows: Iterable[Any],
+        columns: Optional[Sequence[str]] = None,
+        keys: Iterable[Any] = (),
+    ) -> tuple[list[str], dict[str, tuple[list[tuple], list]]]:
+        """
+        Groups rows, and key values whose rows are replaced, by partition.
+
+        Args:
+            cursor: A psycopg2 cursor, used to look up key values not seen before.
+            rows (Iterable): Rows as accepted by copy_rows.
+            columns (Optional[Sequence[str]]): Columns to load, see copy_rows. They
+                must include the partition key.
+            keys (Iterable): Key values whose rows are deleted first.
+
+        Returns:
+            tuple[list[str], dict[str, tuple[list[tuple], list]]]: The columns loaded,
+                and the rows and key values of each partition.
+        """
+        if not self.partitions:
+            raise RuntimeError(
+                f"'{self.table.name}' has no known hash partitions; call refresh()."
+            )
+        columns, rows = resolve_columns(self.table, columns, rows)
+        if self.column not in columns:
+            raise ValueError(
+                f"Rows for '{self.table.name}' must load the partition key "
+                f"'{self.column}'."
+            )
+        position = columns.index(self.column)
+        rows = list(iter_row_values(self.table, columns, rows))
+        keys = set(keys)
+        self._lookup(cursor, keys | {row[position] for row in rows})
+        routed: dict[str, tuple[list[tuple], list]] = {}
+        with self._lock:
+            partition_of = self._partition_of
+            for row in rows:
+                routed.setdefault(partition_of[row[position]], ([], []))[0].append(row)
+            for key in keys:
+                routed.setdefault(partition_of[key], ([], []))[1].append(key)
+        return columns, routed
+
+    def _write(
+        self,
+        cursor: Any,
+        partition: str,
+        columns: list[str],
+        rows: list[tuple],
+        keys: list,
+    ) -> int:
+        if keys:
+            cursor.execute(
+                f"DELETE FROM {partition} WHERE {self.column} = ANY(%s)", (keys,)
+            )
+        return copy_rows(cursor, self.table, rows, columns, partition)
+
+    def _write_partition(
+        self, partition: str, columns: list[str], rows: list[tuple], keys: list
+    ) -> int:
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                return self._write(cursor, partition, columns, rows, keys)
+
+    def load(
+        self,
+        rows: Iterable[Any],
+        columns: Optional[Sequence[str]] = None,
+        replace_keys: Iterable[Any] = (),
+    ) -> int:
+        """
+        Copies rows into their partitions. With `replace_keys`, the rows holding
+        those key values are deleted first, partition by partition.
+
+        With one worker, everything is loaded in one transaction. With more, each
+        partition is loaded in its own transaction, so a failure can leave other
+        partitions loaded; every key value is still replaced all at once.
+
+        Args:
+            rows (Iterable): Rows as accepted by copy_rows.
+            columns (Optional[Sequence[str]]): Columns to load, see copy_rows.
+            replace_keys (Iterable): Key values whose rows are replaced, including
+                ones that no longer have any rows.
+
+        Returns:
+            int: The number of rows copied.
+        """
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                columns, routed = self.route(cursor, rows, columns, replace_keys)
+                if self.workers == 1 or len(routed) <= 1:
+                    return sum(
+                        self._write(cursor, partition, columns, partition_rows, keys)
+                        for partition, (partition_rows, keys) in routed.items()
+                    )
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="partition-load"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._write_partition, partition, columns, partition_rows, keys
+                )
+                for partition, (partition_rows, keys) in routed.items()
+            ]
+            return sum(future.result() for future in futures)
@@ -0,0 +1,213 @@
+import threading
+from itertools import chain
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql
+
+from fightgraphs_pipeline.database.bulk_operations import (
+    TableLike,
+    build_merge_sql,
+    copy_rows,
+    get_table,
+    resolve_columns,
+)
+from fightgraphs_pipeline.database.postgres_controller import Base, PostgresController
+from fightgraphs_pipeline.models.postgresql_models import (
+    EventEntity,
+    FightEntity,
+    FighterEntity,
+    FighterRecordEntity,
+    FightStatEntity,
+    ScorecardEntity,
+)
+
+STAGING_PREFIX = "stage_"
+
+# A bigserial column only the staging tables have, numbering rows in the order
+# they were staged, so the merge keeps the last row staged for each key.
+SEQUENCE_COLUMN = "stage_seq"
+
+# The tables the pipeline stages.
+STAGED_ENTITIES = (
+    FighterEntity,
+    FighterRecordEntity,
+    EventEntity,
+    FightEntity,
+    ScorecardEntity,
+    FightStatEntity,
+)
+
+# Tables without a natural key, whose rows are replaced per parent instead of
+# upserted, with the column referring to the parent and the parent table: every
+# target row of a staged parent is deleted before the staged rows are inserted,
+# including the rows of parents that no longer have any.
+REPLACE_PARENTS: dict[str, tuple[str, str]] = {
+    "fightstat": ("fight_id", "fight"),
+}
+
+
+def staging_table_name(table: Table) -> str:
+    return f"{STAGING_PREFIX}{table.name}"
+
+
+class StagingArea:
+    """
+    Loads rows into UNLOGGED staging tables and merges them into the real
+    tables in one transaction.
+
+    Staging tables have the target's columns but no keys, constraints or
+    indexes, and skip the WAL, so batches are COPY'd into them at little cost
+    and a failed run leaves the real tables untouched. `merge` then moves every
+    table's rows in foreign key order with one set-based statement each: an
+    `INSERT ... SELECT ... ON CONFLICT DO UPDATE` on the primary key, or a
+    delete and insert for the tables in REPLACE_PARENTS. Readers see either
+    none of the run's rows or all of them.
+
+    Unlogged tables are emptied by PostgreSQL after a crash, so rows staged
+    before one must be loaded again.
+    """
+
+    def __init__(
+        self,
+        postgres: PostgresController,
+        entities: Iterable[TableLike] = STAGED_ENTITIES,
+    ):
+        """
+        Args:
+            postgres (PostgresController): The target database.
+            entities (Iterable[TableLike]): The entity classes or Tables to stage.
+        """
+        self.postgres = postgres
+        self.tables = [get_table(entity) for entity in entities]
+        self._columns: dict[Table, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def create(self) -> None:
+        """
+        Creates the staging tables that do not exist yet, and empties the rest.
+        """
+        dialect = postgresql.dialect()
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                for table in self.tables:
+                    columns = ", ".join(
+                        f"{column.name} {column.type.compile(dialect=dialect)}"
+                        for column in table.columns
+                    )
+                    cursor.execute(
+                        f"CREATE UNLOGGED TABLE IF NOT EXISTS "
+                        f"{staging_table_name(table)} ({columns})"
+                    )
+                    # Staging tables created before the column existed.
+                    cursor.execute(
+                        f"ALTER TABLE {staging_table_name(table)} "
+                        f"ADD COLUMN IF NOT EXISTS {SEQUENCE_COLUMN} bigserial"
+                    )
+                cursor.execute(self._truncate_sql())
+        self._columns = {}
+
+    def drop(self) -> None:
+        """
+        Drops the staging tables.
+        """
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                for table in self.tables:
+                    cursor.execute(f"DROP TABLE IF EXISTS {staging_table_name(table)}")
+
+    def _truncate_sql(self) -> str:
+        return "TRUNCATE " + ", ".join(
+            staging_table_name(table) for table in self.tables
+        )
+
+    def copy(self, table_rows: Mapping[TableLike, Iterable[Any]]) -> int:
+        """
+        Stages rows of one or more tables in a single transaction. Every batch of
+        a table must load the same columns, which are the ones merged.
+
+        Args:
+            table_rows (Mapping[TableLike, Iterable]): Rows per entity class or
+                Table, as accepted by PostgresController.bulk_copy.
+
+        Returns:
+            int: The number of rows staged.
+        """
+        staged = 0
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                for entity, rows in table_rows.items():
+                    table = get_table(entity)
+                    if table not in self.tables:
+                        raise ValueError(f"Table '{table.name}' is not staged.")
+                    rows = iter(rows)
+                    first = next(rows, None)
+                    if first is None:
+                        # An empty batch would default to every column.
+                        continue
+                    columns, rows = resolve_columns(table, None, chain([first], rows))
+                    with self._lock:
+                        known = self._columns.setdefault(table, columns)
+                    if known != columns:
+                        raise ValueError(
+                            f"Rows for '{table.name}' load columns {columns}, "
+                            f"but earlier rows loaded {known}."
+                        )
+                    staged += copy_rows(
+                        cursor, table, rows, columns, staging_table_name(table)
+                    )
+        return staged
+
+    def _merge_table(
+        self, cursor: Any, table: Table, columns: Optional[Sequence[str]]
+    ) -> int:
+        staging_name = staging_table_name(table)
+        if table.name in REPLACE_PARENTS:
+            replace_column, parent_name = REPLACE_PARENTS[table.name]
+            parent = Base.metadata.tables[parent_name]
+            (parent_key,) = [column.name for column in parent.primary_key.columns]
+            cursor.execute(
+                f"DELETE FROM {table.name} WHERE {replace_column} IN "
+                f"(SELECT {parent_key} FROM {staging_table_name(parent)})"
+            )
+            if columns is None:
+                return 0
+            column_list = ", ".join(columns)
+            cursor.execute(
+                f"INSERT INTO {table.name} ({column_list}) "
+                f"SELECT {column_list} FROM {staging_name}"
+            )
+        else:
+            conflict_columns = [column.name for column in table.primary_key.columns]
+            cursor.execute(
+                build_merge_sql(
+                    table, columns, conflict_columns, staging_name, SEQUENCE_COLUMN
+                )
+            )
+        return cursor.rowcount
+
+    def merge(self) -> dict[str, int]:
+        """
+        Merges every staged table into its real table, parents before children,
+        and empties the staging tables, all in one transaction.
+
+        Returns:
+            dict[str, int]: The rows inserted or changed per table name.
+        """
+        with self._lock:
+            columns = dict(self._columns)
+        written = {}
+        with self.postgres.get_raw_connection() as connection:
+            with connection.cursor() as cursor:
+                for table in Base.metadata.sorted_tables:
+                    replaced = table.name in REPLACE_PARENTS and any(
+                        staged.name == REPLACE_PARENTS[table.name][1]
+                        for staged in columns
+                    )
+                    if table in columns or replaced:
+                        written[table.name] = self._merge_table(
+                            cursor, table, columns.get(table)
+                        )
+                cursor.execute(self._truncate_sql())
+        self._columns = {}
+        return written
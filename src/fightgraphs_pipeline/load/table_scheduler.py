@@ -0,0 +1,166 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import Table
+
+from fightgraphs_pipeline.database.bulk_operations import TableLike, get_table
+from fightgraphs_pipeline.database.postgres_controller import Base, PostgresController
+
+LOAD_METHODS = ("batch_upsert", "bulk_copy")
+
+
+def table_dependencies(tables: Iterable[Table]) -> dict[Table, set[Table]]:
+    """
+    Returns the tables each of `tables` refers to through foreign keys, leaving out
+    self-references and tables that are not in `tables`.
+    """
+    tables = list(tables)
+    included = set(tables)
+    return {
+        table: {
+            foreign_key.column.table
+            for foreign_key in table.foreign_keys
+            if foreign_key.column.table in included
+            and foreign_key.column.table is not table
+        }
+        for table in tables
+    }
+
+
+class TableLoadScheduler:
+    """
+    Loads many tables at once over separate pooled connections, in foreign key
+    order: for the fightgraphs schema, promotion first; then weightclass, event,
+    fighter and the other tables it or nothing refers to; then fight; then
+    fightstat, scorecard and the other per-fight tables.
+
+    Each table's rows are split into chunks of `chunk_size`, and every chunk is
+    loaded by a worker thread in its own transaction. A table's chunks are
+    submitted as soon as every table it refers to has committed all of its
+    chunks, so independent tables, and the chunks of one table, load
+    concurrently while a child never sees a missing parent. Tables not passed to
+    `load` are taken to be loaded already.
+
+    Chunks of one table must not share conflict keys, or concurrent upserts can
+    deadlock on them; the mappers' gen_id_from_url keys are unique per table.
+    """
+
+    def __init__(
+        self,
+        postgres: PostgresController,
+        workers: int = 4,
+        chunk_size: int = 5000,
+        method: str = "batch_upsert",
+    ):
+        """
+        Args:
+            postgres (PostgresController): The target database. Its pool must allow
+                `workers` connections at once.
+            workers (int): Chunks loaded at the same time.
+            chunk_size (int): Rows per chunk and transaction.
+            method (str): "batch_upsert" or "bulk_copy", see PostgresController.
+        """
+        if workers <= 0 or chunk_size <= 0:
+            raise ValueError("workers and chunk_size must be positive integers.")
+        if method not in LOAD_METHODS:
+            raise ValueError(f"method must be one of {LOAD_METHODS}, got '{method}'.")
+        self.postgres = postgres
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.method = method
+
+    def _load_chunk(self, table: Table, method: str, rows: Sequence[Any]) -> int:
+        if method == "bulk_copy":
+            return self.postgres.bulk_copy(table, rows)
+        return self.postgres.batch_upsert(table, rows)
+
+    def load(
+        self,
+        table_rows: Mapping[TableLike, Sequence[Any]],
+        methods: Optional[Mapping[TableLike, str]] = None,
+    ) -> dict[str, int]:
+        """
+        Loads every table's rows, returning once all of them are committed. The
+        first error stops new chunks from starting and is re-raised; chunks
+        already committed stay committed.
+
+        Args:
+            table_rows (Mapping[TableLike, Sequence]): Rows to load per ORM entity
+                class or Table, as accepted by bulk_copy and batch_upsert.
+            methods (Optional[Mapping[TableLike, str]]): Load method per table,
+                overriding `method`, e.g. {FightStatEntity: "bulk_copy"} for a
+                table with a serial key.
+
+        Returns:
+            dict[str, int]: The rows written per table name.
+        """
+        rows_by_table = {get_table(table): rows for table, rows in table_rows.items()}
+        method_by_table = {
+            get_table(table): method for table, method in (methods or {}).items()
+        }
+        for table, method in method_by_table.items():
+            if method not in LOAD_METHODS:
+                raise ValueError(
+                    f"Unknown load method '{method}' for table '{table.name}'."
+                )
+        waiting_on = table_dependencies(
+            table for table in Base.metadata.sorted_tables if table in rows_by_table
+        )
+        unknown = set(rows_by_table) - set(waiting_on)
+        if unknown:
+            raise ValueError(
+                f"Tables not in the schema: {sorted(table.name for table in unknown)}"
+            )
+        children: dict[Table, list[Table]] = {table: [] for table in waiting_on}
+        for table, parents in waiting_on.items():
+            for parent in parents:
+                children[parent].append(table)
+
+        written = {table.name: 0 for table in rows_by_table}
+        chunks_left: dict[Table, int] = {}
+        futures: dict[Future, Table] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="table-load"
+        ) as executor:
+
+            def submit(table: Table) -> list[Table]:
+                rows = rows_by_table[table]
+                method = method_by_table.get(table, self.method)
+                chunks = [
+                    rows[start : start + self.chunk_size]
+                    for start in range(0, len(rows), self.chunk_size)
+                ]
+                chunks_left[table] = len(chunks)
+                for chunk in chunks:
+                    future = executor.submit(self._load_chunk, table, method, chunk)
+                    futures[future] = table
+                # A table without rows is committed as soon as it is ready.
+                return committed(table) if not chunks else []
+
+            def committed(table: Table) -> list[Table]:
+                """Returns the tables that were only waiting on `table`."""
+                ready = []
+                for child in children[table]:
+                    waiting_on[child].discard(table)
+                    if not waiting_on[child]:
+                        ready.append(child)
+                return ready
+
+            ready = [table for table, parents in waiting_on.items() if not parents]
+            try:
+                while ready or futures:
+                    while ready:
+                        ready.extend(submit(ready.pop(0)))
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        table = futures.pop(future)
+                        written[table.name] += future.result()
+                        chunks_left[table] -= 1
+                        if chunks_left[table] == 0:
+                            ready.extend(committed(table))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return written
@@ -0,0 +1,229 @@
+import argparse
+import time
+
+from fightgraphs_pipeline.extract.extraction import DEFAULT_BATCH_SIZE
+from fightgraphs_pipeline.metrics import (
+    MongoBytesListener,
+    build_report,
+    write_json_report,
+    write_prometheus_textfile,
+)
+from fightgraphs_pipeline.pipeline import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_QUEUE_SIZE,
+    ENTITIES,
+    EXTRACT_COLLECTIONS,
+    Pipeline,
+    report,
+)
+from fightgraphs_pipeline.utils import get_controllers
+
+
+def parse_concurrency(values: list[str]) -> dict[str, int]:
+    """
+    Parses "entity=workers" pairs, e.g. ["fights=8", "fight_stats=4"].
+    """
+    concurrency = {}
+    for value in values:
+        entity, _, workers = value.partition("=")
+        if entity not in DEFAULT_CONCURRENCY or not workers.isdigit():
+            raise argparse.ArgumentTypeError(
+                f"Expected one of {list(DEFAULT_CONCURRENCY)}=<workers>, got '{value}'."
+            )
+        concurrency[entity] = int(workers)
+    return concurrency
+
+
+def parse_watermark_fields(values: list[str]) -> dict[str, str]:
+    """
+    Parses "entity=field" pairs, e.g. ["fighters=updated_at"].
+    """
+    fields = {}
+    for value in values:
+        entity, _, field = value.partition("=")
+        if entity not in ENTITIES or not field:
+            raise argparse.ArgumentTypeError(
+                f"Expected one of {list(ENTITIES)}=<field>, got '{value}'."
+            )
+        fields[entity] = field
+    return fields
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the MongoDB -> PostgreSQL pipeline."
+    )
+    parser.add_argument(
+        "--concurrency",
+        nargs="*",
+        default=[],
+        metavar="ENTITY=WORKERS",
+        help=f"Worker threads per stage by entity type. Defaults: {DEFAULT_CONCURRENCY}",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument("--trusted", action="store_true")
+    parser.add_argument(
+        "--transform-processes",
+        type=int,
+        default=0,
+        help="Map fighters, events and fight stats on this many processes.",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip documents whose fingerprint matches the one stored when they were last loaded.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Record each entity's load progress, so a failed run can be resumed.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume each entity's load after its recorded progress.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only extract documents added since the watermark stored by the last incremental run.",
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Extract every document, then store watermarks for the next --incremental run.",
+    )
+    parser.add_argument(
+        "--watermark-field",
+        nargs="*",
+        default=[],
+        metavar="ENTITY=FIELD",
+        help="The field each entity type's watermark tracks, e.g. a last-modified timestamp. Defaults to _id, which misses documents updated in place.",
+    )
+    parser.add_argument(
+        "--staging",
+        action="store_true",
+        help="Load through unlogged staging tables, merged into the real tables in one transaction at the end.",
+    )
+    parser.add_argument(
+        "--fightstat-partitions",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Create a missing fightstat table hash-partitioned on fight_id into N partitions.",
+    )
+    parser.add_argument(
+        "--partition-workers",
+        type=int,
+        default=1,
+        help="Partitions of a partitioned fightstat table each load writes at the same time.",
+    )
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Create missing tables without foreign keys and indexes, and add them after the load. Fight stats are appended rather than replaced, so only use it on an empty database.",
+    )
+    parser.add_argument(
+        "--finalize-workers",
+        type=int,
+        default=1,
+        help="With --bulk-load, connections used to add the foreign keys and indexes.",
+    )
+    parser.add_argument(
+        "--maintenance-work-mem",
+        default="1GB",
+        help="With --bulk-load, maintenance_work_mem for adding each foreign key and index.",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        metavar="PATH",
+        help="Write per-stage metrics of the run as JSON.",
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        metavar="PATH",
+        help="Write per-stage metrics for node-exporter's textfile collector (*.prom).",
+    )
+    parser.add_argument(
+        "--profile-sql",
+        action="store_true",
+        help="Aggregate PostgreSQL statements by shape and print their latencies.",
+    )
+    parser.add_argument(
+        "--explain-slowest",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --profile-sql, EXPLAIN ANALYZE the N most expensive statements.",
+    )
+    args = parser.parse_args()
+    concurrency = parse_concurrency(args.concurrency)
+    watermark_fields = parse_watermark_fields(args.watermark_field)
+
+    # Counting bytes read from MongoDB re-encodes every reply, so only do it
+    # when the metrics are written somewhere.
+    mongo_bytes = (
+        MongoBytesListener() if args.metrics_json or args.metrics_textfile else None
+    )
+    mongo_controller, postgres_controller = get_controllers(
+        [mongo_bytes] if mongo_bytes else None
+    )
+    try:
+        postgres_controller.init_db(
+            bulk_load=args.bulk_load,
+            partitions={"fightstat": args.fightstat_partitions}
+            if args.fightstat_partitions
+            else None,
+        )
+        profiler = postgres_controller.enable_profiler() if args.profile_sql else None
+        pipeline = Pipeline(
+            mongo_controller,
+            postgres_controller,
+            concurrency=concurrency,
+            batch_size=args.batch_size,
+            queue_size=args.queue_size,
+            trusted=args.trusted,
+            transform_processes=args.transform_processes,
+            skip_unchanged=args.skip_unchanged,
+            checkpoint=args.checkpoint,
+            resume=args.resume,
+            staging=args.staging,
+            partition_workers=args.partition_workers,
+            incremental=args.incremental,
+            full_refresh=args.full_refresh,
+            watermark_fields=watermark_fields,
+            append_fight_stats=args.bulk_load,
+        )
+        started_at = time.time()
+        stages = pipeline.run()
+        if args.bulk_load:
+            postgres_controller.finalize_bulk_load(
+                args.finalize_workers, args.maintenance_work_mem
+            )
+        report(stages)
+        if profiler:
+            postgres_controller.disable_profiler()
+            profiler.explain_slowest(args.explain_slowest)
+            profiler.report()
+        if mongo_bytes:
+            run_report = build_report(
+                [stage.as_dict() for stage in stages],
+                started_at,
+                time.time(),
+                mongo_bytes.bytes_by_collection,
+                EXTRACT_COLLECTIONS,
+            )
+            if profiler:
+                run_report["sql_statements"] = profiler.as_dicts()
+            if args.metrics_json:
+                write_json_report(run_report, args.metrics_json)
+            if args.metrics_textfile:
+                write_prometheus_textfile(run_report, args.metrics_textfile)
+    finally:
+        mongo_controller.close_connection()
+        postgres_controller.close_db()
+
+
+if __name__ == "__main__":
+    main()
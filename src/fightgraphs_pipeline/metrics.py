@@ -0,0 +1,253 @@
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+from typing import Any, Optional
+
+import bson
+from pymongo import monitoring
+
+# Commands whose replies carry documents, and the field naming their collection.
+_CURSOR_COMMANDS: dict[str, str] = {
+    "find": "find",
+    "aggregate": "aggregate",
+    "getMore": "collection",
+}
+
+METRIC_PREFIX = "fightgraphs_pipeline"
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def peak_rss_bytes() -> int:
+    """
+    Returns the peak resident set size of this process so far.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss_bytes() -> int:
+    """
+    Returns the current resident set size of this process, or the peak where the
+    current size cannot be read cheaply (outside Linux).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return peak_rss_bytes()
+
+
+class MongoBytesListener(monitoring.CommandListener):
+    """
+    Counts the BSON bytes of cursor replies (find, aggregate and getMore) per
+    collection. Pass it to MongoDBController's `event_listeners`.
+
+    PyMongo only hands listeners decoded replies, so each reply is re-encoded to
+    be measured; this costs extraction time and is meant for instrumented runs.
+    """
+
+    def __init__(self):
+        self.bytes_by_collection: dict[str, int] = {}
+        self.replies_by_collection: dict[str, int] = {}
+        self._collections: dict[tuple[Any, int], str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        field = _CURSOR_COMMANDS.get(event.command_name)
+        if field is None:
+            return
+        collection = event.command.get(field)
+        if isinstance(collection, str):
+            with self._lock:
+                self._collections[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        if event.command_name not in _CURSOR_COMMANDS:
+            return
+        with self._lock:
+            collection = self._collections.pop(
+                (event.connection_id, event.request_id), None
+            )
+        if collection is None:
+            return
+        size = len(bson.encode(event.reply))
+        with self._lock:
+            self.bytes_by_collection[collection] = (
+                self.bytes_by_collection.get(collection, 0) + size
+            )
+            self.replies_by_collection[collection] = (
+                self.replies_by_collection.get(collection, 0) + 1
+            )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        with self._lock:
+            self._collections.pop((event.connection_id, event.request_id), None)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes_by_collection.values())
+
+
+def build_report(
+    stages: list[dict[str, Any]],
+    started_at: float,
+    finished_at: float,
+    mongo_bytes: Optional[dict[str, int]] = None,
+    collection_stages: Optional[dict[str, str]] = None,
+) -> dict[str, Any]:
+    """
+    Builds the report of a pipeline run.
+
+    Args:
+        stages (list[dict]): Per-stage metrics, see pipeline.Stage.as_dict.
+        started_at (float): Unix time the run started.
+        finished_at (float): Unix time the run finished.
+        mongo_bytes (Optional[dict[str, int]]): Bytes read per collection, see
+            MongoBytesListener.
+        collection_stages (Optional[dict[str, str]]): The extract stage each
+            collection is read by, so its bytes are added to that stage.
+
+    Returns:
+        dict: The run's totals and its stages.
+    """
+    mongo_bytes = mongo_bytes or {}
+    stages = [dict(stage, bytes_read=0) for stage in stages]
+    by_name = {stage["name"]: stage for stage in stages}
+    for collection, size in mongo_bytes.items():
+        stage = by_name.get((collection_stages or {}).get(collection))
+        if stage is not None:
+            stage["bytes_read"] += size
+    return {
+        "started_at": started_at,
+        "finished_at": finished_at,
+        "duration_seconds": finished_at - started_at,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "mongo_bytes_read": dict(mongo_bytes),
+        "stages": stages,
+    }
+
+
+def _atomic_write(path: str, text: str) -> None:
+    """
+    Writes `text` to a temporary file next to `path` and renames it into place,
+    so readers such as node-exporter's textfile collector never see a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            file.write(text)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def write_json_report(report: dict[str, Any], path: str) -> None:
+    """
+    Writes the report as JSON.
+    """
+    _atomic_write(path, json.dumps(report, indent=2) + "\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(
+            f'{key}="{_escape_label(str(label))}"' for key, label in labels.items()
+        )
+        return f"{name}{{{rendered}}} {value}"
+    return f"{name} {value}"
+
+
+# Per-stage gauges: report key -> (metric suffix, help text).
+_STAGE_METRICS: dict[str, tuple[str, str]] = {
+    "workers": ("stage_workers", "Worker threads of the stage."),
+    "wall_seconds": (
+        "stage_wall_seconds",
+        "Seconds between the stage's first and last batch.",
+    ),
+    "busy_seconds": ("stage_busy_seconds", "Seconds spent processing batches."),
+    "batches": ("stage_batches", "Batches processed."),
+    "batches_committed": ("stage_batches_committed", "Batches committed by loads."),
+    "rows_in": ("stage_rows_in", "Rows received by the stage."),
+    "rows_out": ("stage_rows_out", "Rows passed on, or written by loads."),
+    "bytes_read": ("stage_mongo_bytes_read", "BSON bytes read from MongoDB."),
+    "peak_rss_bytes": (
+        "stage_peak_rss_bytes",
+        "Largest process RSS seen while the stage ran.",
+    ),
+}
+
+
+def render_prometheus(report: dict[str, Any]) -> str:
+    """
+    Renders the report in the Prometheus text exposition format.
+    """
+    lines = []
+
+    def gauge(suffix: str, help_text: str, samples: list[tuple[dict, float]]) -> None:
+        name = f"{METRIC_PREFIX}_{suffix}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(_sample(name, labels, value) for labels, value in samples)
+
+    gauge(
+        "run_duration_seconds",
+        "Wall time of the last run.",
+        [({}, report["duration_seconds"])],
+    )
+    gauge(
+        "run_finished_timestamp_seconds",
+        "Unix time the last run finished.",
+        [({}, report["finished_at"])],
+    )
+    gauge(
+        "run_peak_rss_bytes",
+        "Peak RSS of the last run.",
+        [({}, report["peak_rss_bytes"])],
+    )
+    gauge(
+        "mongo_bytes_read",
+        "BSON bytes read from MongoDB per collection.",
+        [
+            ({"collection": name}, size)
+            for name, size in report["mongo_bytes_read"].items()
+        ],
+    )
+    for key, (suffix, help_text) in _STAGE_METRICS.items():
+        gauge(
+            suffix,
+            help_text,
+            [
+                (
+                    {
+                        "stage": stage["name"],
+                        "entity": stage["entity"],
+                        "step": stage["step"],
+                    },
+                    stage[key],
+                )
+                for stage in report["stages"]
+            ],
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(report: dict[str, Any], path: str) -> None:
+    """
+    Writes the report for node-exporter's textfile collector. The path must end
+    in ".prom" for the collector to pick it up.
+    """
+    if not path.endswith(".prom"):
+        raise ValueError(f"Textfile collector files must end in '.prom', got '{path}'.")
+    _atomic_write(path, render_prometheus(report))
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
-from typing import List, Optional, Dict
+from functools import cache
+from typing import Any, List, Optional, Dict, TypeVar
 from bson import ObjectId
 
 
@@ -159,3 +160,36 @@ class FightModel(MongoBaseModel):
     fighter2: FighterInfoModel
     fight_details: Optional[FightDetailsModel]
     fight_stats: Optional[Dict[str, RoundStatsModel]]
+
+
+# --- Batch validation ---
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@cache
+def get_batch_adapter(model: type[ModelT]) -> TypeAdapter[list[ModelT]]:
+    """
+    Returns a cached TypeAdapter that validates a list of documents as `model`.
+    Building the adapter compiles a validator, so it is done once per model.
+    """
+    return TypeAdapter(list[model])
+
+
+def validate_batch(
+    model: type[ModelT], documents: list[dict[str, Any]]
+) -> list[ModelT]:
+    """
+    Validates a batch of documents, including nested models, in a single pydantic-core call.
+
+    Args:
+        model (type[BaseModel]): The model class to validate against.
+        documents (list[dict]): Documents already shaped like the model.
+
+    Returns:
+        list[BaseModel]: The validated models, in input order.
+
+    Raises:
+        pydantic.ValidationError: If any document does not match the model.
+    """
+    return get_batch_adapter(model).validate_python(documents)
@@ -3,6 +3,7 @@ from sqlalchemy import (
     Integer,
     String,
     Date,
+    DateTime,
     Numeric,
     Boolean,
     ForeignKey,
@@ -246,7 +247,8 @@ class FightStatEntity(Base):
     distance_strikes_landed = Column(Integer, default=0)
     distance_strikes_attempted = Column(Integer, default=0)
     fighter_id = Column(Integer, ForeignKey("fighter.id"), nullable=False)
-    fight_id = Column(Integer, ForeignKey("fight.id"), nullable=False)
+    # Indexed, since loads replace a fight's stats by deleting them first.
+    fight_id = Column(Integer, ForeignKey("fight.id"), nullable=False, index=True)
 
     # Relationships
     fighter = relationship("FighterEntity", back_populates="fight_stats")
@@ -325,3 +327,40 @@ class FighterRecordEntity(Base):
 
     # Relationship
     fighter = relationship("FighterEntity", back_populates="fighter_record")
+
+
+class ExtractionWatermarkEntity(Base):
+    """SQLAlchemy model for the extractionwatermark table.
+    Holds the high-water mark of the last incremental extraction of each MongoDB collection."""
+
+    __tablename__ = "extractionwatermark"
+
+    collection_name = Column(String(100), primary_key=True, nullable=False)
+    watermark_field = Column(String(100), nullable=False)
+    watermark_type = Column(String(20), nullable=False)
+    watermark = Column(Text, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class FingerprintEntity(Base):
+    """SQLAlchemy model for the fingerprint table.
+    Holds the digest of each source document as last loaded, keyed by its gen_id_from_url id."""
+
+    __tablename__ = "fingerprint"
+
+    entity = Column(String(20), primary_key=True, nullable=False)
+    id = Column(Integer, primary_key=True, nullable=False)
+    digest = Column(String(32), nullable=False)
+
+
+class LoadProgressEntity(Base):
+    """SQLAlchemy model for the loadprogress table.
+    Holds the sort key of the last document of a checkpointed load whose batches are all committed."""
+
+    __tablename__ = "loadprogress"
+
+    entity = Column(String(20), primary_key=True, nullable=False)
+    key_field = Column(String(100), nullable=False)
+    last_key = Column(Text, nullable=False)
+    batches = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,56 @@
+from collections import namedtuple
+from typing import Iterable
+
+from sqlalchemy import Table
+
+from fightgraphs_pipeline.models.postgresql_models import (
+    EventEntity,
+    FightEntity,
+    FighterEntity,
+    FighterRecordEntity,
+    FightStatEntity,
+    JudgeEntity,
+    RefereeEntity,
+    ScorecardEntity,
+    TimeFormatEntity,
+    WeightclassEntity,
+)
+
+
+def make_row_type(entity: type, exclude: Iterable[str] = ()) -> type:
+    """
+    Generates a named tuple with the columns of an entity's table, in table order.
+
+    Rows are plain tuples with no per-instance `__dict__`, ORM state or
+    relationship collections, so they cost a fraction of an entity's memory and can
+    be handed to PostgresController.bulk_copy and batch_upsert as they are.
+
+    Args:
+        entity (type): The ORM entity class, e.g. FighterEntity.
+        exclude (Iterable[str]): Columns to leave out, e.g. a serial id the
+            database generates.
+
+    Returns:
+        type: The row class, named after the entity ("FighterEntity" -> "FighterRow").
+    """
+    table: Table = entity.__table__
+    excluded = set(exclude)
+    columns = [column.name for column in table.columns if column.name not in excluded]
+    name = entity.__name__.removesuffix("Entity") + "Row"
+    row_type = namedtuple(name, columns)
+    row_type.__doc__ = f"Row of the {table.name} table."
+    row_type.__module__ = __name__
+    return row_type
+
+
+FighterRow = make_row_type(FighterEntity)
+FighterRecordRow = make_row_type(FighterRecordEntity)
+EventRow = make_row_type(EventEntity)
+FightRow = make_row_type(FightEntity)
+ScorecardRow = make_row_type(ScorecardEntity)
+RefereeRow = make_row_type(RefereeEntity)
+JudgeRow = make_row_type(JudgeEntity)
+WeightclassRow = make_row_type(WeightclassEntity)
+TimeFormatRow = make_row_type(TimeFormatEntity)
+# fightstat ids are serial, so rows leave the id to the database.
+FightStatRow = make_row_type(FightStatEntity, exclude=("id",))
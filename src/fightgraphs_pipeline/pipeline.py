@@ -0,0 +1,853 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from fightgraphs_pipeline.database.mongodb_controller import MongoDBController
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.extract.extraction import (
+    DEFAULT_BATCH_SIZE,
+    extract_fighter_images,
+    iter_events,
+    iter_fighters,
+    iter_fights,
+)
+from fightgraphs_pipeline.extract.fingerprints import FingerprintStore, fingerprint
+from fightgraphs_pipeline.extract.incremental_extraction import (
+    DEFAULT_WATERMARK_FIELD,
+    IncrementalWindow,
+    combine_queries,
+)
+from fightgraphs_pipeline.load.event_loader import load_events, load_promotions
+from fightgraphs_pipeline.load.fight_loader import (
+    load_fight_rows,
+    load_fight_stats,
+    replace_fight_stats,
+)
+from fightgraphs_pipeline.load.fighter_loader import load_fighter_rows
+from fightgraphs_pipeline.load.load_progress import CHECKPOINT_KEYS, LoadCheckpoint
+from fightgraphs_pipeline.load.partition_router import PartitionRouter
+from fightgraphs_pipeline.load.staging import StagingArea
+from fightgraphs_pipeline.metrics import current_rss_bytes
+from fightgraphs_pipeline.models.mongodb_models import (
+    EventModel,
+    FighterModel,
+    FightModel,
+)
+from fightgraphs_pipeline.models.postgresql_models import (
+    EventEntity,
+    FightEntity,
+    FighterEntity,
+    FighterRecordEntity,
+    FightStatEntity,
+    ScorecardEntity,
+)
+from fightgraphs_pipeline.transform.dimension_cache import DimensionCache
+from fightgraphs_pipeline.transform.event_mapper import EventMapper
+from fightgraphs_pipeline.transform.fight_mapper import FightMapper
+from fightgraphs_pipeline.transform.fight_stat_mapper import FightStatMapper
+from fightgraphs_pipeline.transform.fighter_mapper import FighterMapper
+from fightgraphs_pipeline.transform.parallel_transform import ProcessPoolTransformer
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+# Worker threads per transform and load stage, by entity type.
+DEFAULT_CONCURRENCY: dict[str, int] = {
+    "fighters": 2,
+    "events": 1,
+    "fights": 4,
+    "fight_stats": 4,
+}
+
+# The entity types, each extracted from the collection of the same name.
+ENTITIES = ("fighters", "events", "fights")
+
+# The extract stage that reads each source collection, for metrics reports.
+EXTRACT_COLLECTIONS: dict[str, str] = {
+    "fighters": "fighters.extract",
+    "fighter_images": "fighters.extract",
+    "events": "events.extract",
+    "fights": "fights.extract",
+}
+
+# Batches buffered between two stages. A full queue blocks the stage feeding it,
+# so a slow load throttles extraction instead of piling batches up in memory.
+DEFAULT_QUEUE_SIZE = 4
+
+_POLL_SECONDS = 0.1
+
+
+class Stage:
+    """
+    One step of a pipeline: `workers` threads that take batches from the
+    previous stage, apply `function`, and pass the result on.
+    Batches are counted as they enter the stage, by `count` if given, else by len,
+    and results as they leave it, by `count_out` if given, else by len, or as-is
+    for loads that return the number of rows written.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[Any], Any],
+        workers: int = 1,
+        count: Optional[Callable[[Any], int]] = None,
+        count_out: Optional[Callable[[Any], int]] = None,
+    ):
+        if workers <= 0:
+            raise ValueError(f"Stage '{name}' needs at least one worker.")
+        self.name = name
+        self.function = function
+        self.workers = workers
+        self.count = count
+        self.count_out = count_out
+        self.batches = 0
+        self.rows = 0
+        self.rows_out = 0
+        self.peak_rss_bytes = 0
+        self.busy_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def entity(self) -> str:
+        return self.name.split(".", 1)[0]
+
+    @property
+    def step(self) -> str:
+        return self.name.rsplit(".", 1)[-1]
+
+    def _count_out(self, result: Any) -> int:
+        if self.count_out is not None:
+            return self.count_out(result)
+        if isinstance(result, int):
+            return result
+        return len(result) if hasattr(result, "__len__") else 0
+
+    def record(self, batch: Any, result: Any, began: float, ended: float) -> None:
+        rss = current_rss_bytes()
+        with self._lock:
+            self.batches += 1
+            if self.count is not None:
+                self.rows += self.count(batch)
+            else:
+                self.rows += len(batch) if hasattr(batch, "__len__") else 1
+            self.rows_out += self._count_out(result)
+            self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+            self.busy_seconds += ended - began
+            if self.started_at is None or began < self.started_at:
+                self.started_at = began
+            if self.finished_at is None or ended > self.finished_at:
+                self.finished_at = ended
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.rows / elapsed if elapsed else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns the stage's counters, as written to metrics reports.
+        Loads commit one transaction per batch.
+        """
+        return {
+            "name": self.name,
+            "entity": self.entity,
+            "step": self.step,
+            "workers": self.workers,
+            "batches": self.batches,
+            "batches_committed": self.batches if self.step == "load" else 0,
+            "rows_in": self.rows,
+            "rows_out": self.rows_out,
+            "busy_seconds": self.busy_seconds,
+            "wall_seconds": self.elapsed_seconds,
+            "rows_per_second": self.rows_per_second,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+class _Done:
+    """Marks the end of a stage's input."""
+
+
+_DONE = _Done()
+
+
+def _put(target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Blocks until `item` fits in `target`, which is where backpressure comes from.
+    Returns False if the pipeline was stopped while waiting.
+    """
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: queue.Queue, stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return source.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def run_pipeline(
+    source: Iterable[Any],
+    stages: list[Stage],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    name: str = "pipeline",
+    on_done: Optional[Callable[[int], None]] = None,
+) -> list[Stage]:
+    """
+    Runs `source` through `stages` concurrently. Every stage runs in its own
+    threads, connected to the next by a bounded queue of `queue_size` batches.
+    The first stage is fed by a thread iterating `source`, which is timed as the
+    "<name>.extract" stage.
+
+    The first exception raised by any stage stops every stage and is re-raised.
+    Empty list results are not passed on, so a stage that filters out a whole
+    batch spares the stages after it.
+
+    Batches are numbered from 0 in the order `source` yields them, and `on_done`
+    is called with a batch's number once the last stage has processed it or it
+    was filtered out, from the thread that did so.
+
+    Args:
+        source (Iterable): Batches to process, e.g. iter_fighters(...).
+        stages (list[Stage]): The stages, in order.
+        queue_size (int): Batches buffered between two stages.
+        name (str): Prefix for the extract stage's name.
+        on_done (Optional[Callable[[int], None]]): Called as each batch finishes.
+
+    Returns:
+        list[Stage]: The extract stage followed by `stages`, with their counters.
+    """
+    if queue_size <= 0:
+        raise ValueError("queue_size must be a positive integer.")
+
+    extract = Stage(f"{name}.extract", lambda batch: batch)
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    def fail(error: BaseException) -> None:
+        errors.append(error)
+        stop.set()
+
+    def feed() -> None:
+        try:
+            iterator = iter(source)
+            sequence = 0
+            while True:
+                began = time.perf_counter()
+                batch = next(iterator, _DONE)
+                if batch is _DONE:
+                    break
+                extract.record(batch, batch, began, time.perf_counter())
+                if not _put(queues[0], (sequence, batch), stop):
+                    return
+                sequence += 1
+        except BaseException as error:
+            fail(error)
+        finally:
+            for _ in range(stages[0].workers):
+                _put(queues[0], _DONE, stop)
+
+    def work(index: int, finished: threading.Barrier) -> None:
+        stage = stages[index]
+        output = queues[index + 1] if index + 1 < len(stages) else None
+        try:
+            while (item := _get(queues[index], stop)) is not _DONE:
+                sequence, batch = item
+                began = time.perf_counter()
+                result = stage.function(batch)
+                stage.record(batch, result, began, time.perf_counter())
+                if output is None or (isinstance(result, list) and not result):
+                    if on_done is not None:
+                        on_done(sequence)
+                    continue
+                if not _put(output, (sequence, result), stop):
+                    return
+        except BaseException as error:
+            fail(error)
+        finally:
+            # The last worker of a stage to finish tells the next stage's workers.
+            if finished.wait() == 0 and output is not None:
+                for _ in range(stages[index + 1].workers):
+                    _put(output, _DONE, stop)
+
+    threads = [threading.Thread(target=feed, name=extract.name, daemon=True)]
+    for index, stage in enumerate(stages):
+        finished = threading.Barrier(stage.workers)
+        threads.extend(
+            threading.Thread(
+                target=work, args=(index, finished), name=stage.name, daemon=True
+            )
+            for _ in range(stage.workers)
+        )
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return [extract, *stages]
+
+
+def report(stages: list[Stage]) -> None:
+    """
+    Prints the throughput of each stage. rows/s is measured over the wall time
+    between the stage's first and last batch.
+    """
+    print(
+        f"{'stage':<22}{'workers':>8}{'batches':>9}{'rows':>11}{'rows out':>11}"
+        f"{'busy s':>9}{'wall s':>9}{'rows/s':>11}{'peak MB':>9}"
+    )
+    for stage in stages:
+        print(
+            f"{stage.name:<22}{stage.workers:>8}{stage.batches:>9}{stage.rows:>11,}"
+            f"{stage.rows_out:>11,}{stage.busy_seconds:>9.2f}"
+            f"{stage.elapsed_seconds:>9.2f}{stage.rows_per_second:>11,.0f}"
+            f"{stage.peak_rss_bytes / (1 << 20):>9,.0f}"
+        )
+
+
+class Pipeline:
+    """
+    Runs the MongoDB -> PostgreSQL ETL as concurrent extract, transform and load
+    stages per entity type.
+
+    Fighters and events are loaded first, side by side, since fights refer to
+    both. Fights follow, and each fight batch moves on to the fight-stat stages
+    as soon as it is loaded, so fightstat rows never wait for the whole fights
+    collection.
+
+    With `skip_unchanged`, each document is fingerprinted before it is
+    transformed, and documents whose fingerprint matches the one stored when
+    they were last loaded are skipped, see extract.fingerprints.
+
+    With `checkpoint`, each entity type is extracted in order of its unique URL
+    and the URL of the last document whose batch, and every batch before it, is
+    committed is recorded in the loadprogress table. A run with `resume` then
+    starts after it, see load.load_progress.
+
+    Fight loads replace the fights' fightstat rows, so loading a fight again
+    does not duplicate its stats. Only `append_fight_stats`, for a first load
+    into an empty table, appends them instead.
+
+    With `incremental`, each entity type only extracts the documents added since
+    the watermark stored by the last incremental run, see
+    extract.incremental_extraction. A collection's new watermark is stored once
+    its load stage has committed every batch, or once the staging merge has.
+
+    With `staging`, loads COPY their rows into unlogged staging tables, and the
+    run ends by merging them into the real tables in one transaction, timed as
+    the "staging.merge" stage, see load.staging. Fingerprints are then only
+    stored once the merge commits.
+
+    When fightstat is hash-partitioned, see PostgresController.init_db, its rows
+    are copied into their partitions directly, `partition_workers` partitions at
+    a time, see load.partition_router.
+    """
+
+    def __init__(
+        self,
+        mongo: MongoDBController,
+        postgres: PostgresController,
+        concurrency: Optional[dict[str, int]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        trusted: bool = False,
+        transform_processes: int = 0,
+        skip_unchanged: bool = False,
+        checkpoint: bool = False,
+        resume: bool = False,
+        staging: bool = False,
+        partition_workers: int = 1,
+        incremental: bool = False,
+        full_refresh: bool = False,
+        watermark_fields: Optional[dict[str, str]] = None,
+        append_fight_stats: bool = False,
+    ):
+        """
+        Args:
+            mongo (MongoDBController): The source database.
+            postgres (PostgresController): The target database.
+            concurrency (Optional[dict[str, int]]): Worker threads per transform and
+                load stage for "fighters", "events", "fights" and "fight_stats".
+                Missing entries use DEFAULT_CONCURRENCY.
+            batch_size (int): Documents per extracted batch.
+            queue_size (int): Batches buffered between two stages.
+            trusted (bool): Passed to the extractors, see iter_fights.
+            transform_processes (int): If positive, fighters, events and fight stats
+                are mapped to row tuples on a pool of this many processes instead
+                of in the transform threads.
+            skip_unchanged (bool): Skip documents that have not changed since they
+                were last loaded, and store the fingerprints of the ones loaded.
+            checkpoint (bool): Record the progress of each entity's load, starting over.
+            resume (bool): Resume each entity's load from its recorded progress, and
+                keep recording it. Implies `checkpoint`.
+            staging (bool): Load through unlogged staging tables merged at the end.
+                Cannot be combined with `checkpoint`, since staged rows do not
+                survive until a resumed run merges them.
+            partition_workers (int): Partitions of a partitioned fightstat table each
+                fight-stat load writes at the same time, on connections of its own.
+            incremental (bool): Only extract documents added since the last
+                incremental run.
+            full_refresh (bool): Extract every document, then store new watermarks
+                for the next incremental run. Implies `incremental`.
+            watermark_fields (Optional[dict[str, str]]): The field each of
+                "fighters", "events" and "fights" is tracked on, e.g. a last-modified
+                timestamp. Missing entries use DEFAULT_WATERMARK_FIELD, which
+                misses documents updated in place.
+            append_fight_stats (bool): Copy fightstat rows without first deleting
+                the stats already loaded for their fights. Only for a first load
+                into an empty table, e.g. with bulk_load; a rerun duplicates stats.
+                Ignored with `skip_unchanged` or `checkpoint`.
+        """
+        unknown = set(concurrency or {}) - set(DEFAULT_CONCURRENCY)
+        if unknown:
+            raise ValueError(f"Unknown entity types in concurrency: {sorted(unknown)}")
+        if staging and (checkpoint or resume):
+            raise ValueError("staging cannot be combined with checkpoint or resume.")
+        unknown = set(watermark_fields or {}) - set(ENTITIES)
+        if unknown:
+            raise ValueError(
+                f"Unknown entity types in watermark_fields: {sorted(unknown)}"
+            )
+        self.mongo = mongo
+        self.postgres = postgres
+        self.concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.trusted = trusted
+        self.transform_processes = transform_processes
+        self.skip_unchanged = skip_unchanged
+        self.fingerprints: dict[str, FingerprintStore] = {}
+        self.checkpoint = checkpoint or resume
+        self.resume = resume
+        self.checkpoints: dict[str, LoadCheckpoint] = {}
+        self.staging = staging
+        self.staging_area: Optional[StagingArea] = None
+        self._staged_fingerprints: list[tuple[FingerprintStore, list[int]]] = []
+        self.partition_workers = partition_workers
+        self.incremental = incremental or full_refresh
+        self.full_refresh = full_refresh
+        self.watermark_fields = watermark_fields or {}
+        self.append_fight_stats = append_fight_stats
+        self.windows: dict[str, IncrementalWindow] = {}
+        self._staged_windows: list[IncrementalWindow] = []
+        self.transformer: Optional[ProcessPoolTransformer] = None
+        self.fight_refs: list[dict] = []
+        self.stages: list[Stage] = []
+
+    def _extract_kwargs(self) -> dict[str, Any]:
+        return {"batch_size": self.batch_size, "trusted": self.trusted}
+
+    def _source(
+        self, entity: str, extractor: Callable[..., Iterable[list]]
+    ) -> tuple[Iterable[list], Optional[Callable[[int], None]]]:
+        """
+        Returns the batches to run an entity type's pipeline on, and the callback
+        that records their progress when the load is checkpointed.
+        """
+        window = self.windows.get(entity)
+        if window is not None and window.empty:
+            return iter(()), None
+        query = window.remaining_query() if window is not None else None
+        checkpoint = self.checkpoints.get(entity)
+        if checkpoint is None:
+            return extractor(self.mongo, query=query, **self._extract_kwargs()), None
+        batches = extractor(
+            self.mongo,
+            query=combine_queries(query, checkpoint.remaining_query()),
+            sort=checkpoint.sort,
+            **self._extract_kwargs(),
+        )
+        return checkpoint.track(batches), checkpoint.done
+
+    def _loaded_queries(self, entity: str) -> list[dict[str, Any]]:
+        """
+        Returns filters for the documents an earlier run loaded and this run does
+        not extract again: those below the incremental window, and those in it
+        that a resumed load already committed.
+        """
+        window = self.windows.get(entity)
+        checkpoint = self.checkpoints.get(entity)
+        queries = []
+        if window is not None and window.loaded_query() is not None:
+            queries.append(window.loaded_query())
+        if checkpoint is not None and checkpoint.loaded_query() is not None:
+            if window is None:
+                queries.append(checkpoint.loaded_query())
+            elif not window.empty:
+                queries.append(
+                    combine_queries(window.remaining_query(), checkpoint.loaded_query())
+                )
+        return queries
+
+    def _commit_watermark(self, entity: str) -> None:
+        """
+        Stores the watermark of an entity type whose load stage has committed, or,
+        when loading through staging tables, holds it until the merge commits.
+        """
+        window = self.windows.get(entity)
+        if window is None:
+            return
+        if self.staging_area is not None:
+            self._staged_windows.append(window)
+        else:
+            window.commit()
+
+    def _commit_fingerprints(
+        self, store: Optional[FingerprintStore], ids: list[int]
+    ) -> None:
+        """
+        Stores the fingerprints of loaded rows, or, when loading through staging
+        tables, holds them until the merge commits.
+        """
+        if store is None:
+            return
+        if self.staging_area is not None:
+            self._staged_fingerprints.append((store, ids))
+        else:
+            store.commit(ids)
+
+    def _add_fight_refs(self, events: Iterable[EventModel]) -> None:
+        """
+        Adds the fight references of events that are not transformed in this run,
+        which the fights still need.
+        """
+        mapper = EventMapper()
+        for event in events:
+            self.fight_refs.extend(
+                mapper.map_fight_refs(
+                    gen_id_from_url(event.event_name), event.fight_refs
+                )
+            )
+
+    def run_fighters(self) -> list[Stage]:
+        image_lookup = FighterMapper.build_image_lookup(
+            extract_fighter_images(self.mongo, trusted=self.trusted)
+        )
+        map_fighters = (
+            self.transformer.map_fighters
+            if self.transformer
+            else FighterMapper().map_fighters_to_rows
+        )
+        workers = self.concurrency["fighters"]
+        store = self.fingerprints.get("fighters")
+
+        def load(rows: tuple[list, list]) -> int:
+            if self.staging_area is not None:
+                written = self.staging_area.copy(
+                    {FighterEntity: rows[0], FighterRecordEntity: rows[1]}
+                )
+            else:
+                written = load_fighter_rows(self.postgres, *rows)
+            self._commit_fingerprints(store, [row.id for row in rows[0]])
+            return written
+
+        stages = [
+            Stage(
+                "fighters.transform",
+                lambda fighters: map_fighters(fighters, image_lookup),
+                workers,
+                count_out=lambda rows: len(rows[0]),
+            ),
+            Stage("fighters.load", load, workers, count=lambda rows: len(rows[0])),
+        ]
+        if store is not None:
+
+            def key(fighter: FighterModel) -> tuple[int, str]:
+                fighter_id = gen_id_from_url(fighter.fighter_ufcstats_url)
+                return fighter_id, fingerprint(fighter, image_lookup.get(fighter_id))
+
+            stages.insert(
+                0,
+                Stage(
+                    "fighters.filter",
+                    lambda fighters: store.partition(fighters, key)[0],
+                    workers,
+                ),
+            )
+        source, on_done = self._source("fighters", iter_fighters)
+        stages = run_pipeline(
+            source, stages, self.queue_size, name="fighters", on_done=on_done
+        )
+        self._commit_watermark("fighters")
+        return stages
+
+    def run_events(self) -> list[Stage]:
+        map_events = (
+            self.transformer.map_events
+            if self.transformer
+            else EventMapper().map_events_to_rows
+        )
+        workers = self.concurrency["events"]
+        store = self.fingerprints.get("events")
+
+        def transform(events: list[EventModel]) -> list[tuple]:
+            event_rows, fight_refs = map_events(events)
+            self.fight_refs.extend(fight_refs)
+            return event_rows
+
+        def load(rows: list[tuple]) -> int:
+            if self.staging_area is not None:
+                written = self.staging_area.copy({EventEntity: rows})
+            else:
+                written = load_events(self.postgres, rows)
+            self._commit_fingerprints(store, [row.id for row in rows])
+            return written
+
+        stages = [
+            Stage("events.transform", transform, workers),
+            Stage("events.load", load, workers),
+        ]
+        if store is not None:
+
+            def skip_unchanged(events: list[EventModel]) -> list[EventModel]:
+                changed, unchanged = store.partition(
+                    events,
+                    lambda event: (
+                        gen_id_from_url(event.event_name),
+                        fingerprint(event),
+                    ),
+                )
+                self._add_fight_refs(unchanged)
+                return changed
+
+            stages.insert(0, Stage("events.filter", skip_unchanged, workers))
+
+        load_promotions(self.postgres)
+        for query in self._loaded_queries("events"):
+            for events in iter_events(
+                self.mongo, query=query, **self._extract_kwargs()
+            ):
+                self._add_fight_refs(events)
+        source, on_done = self._source("events", iter_events)
+        stages = run_pipeline(
+            source, stages, self.queue_size, name="events", on_done=on_done
+        )
+        self._commit_watermark("events")
+        return stages
+
+    def run_fights(self) -> list[Stage]:
+        mapper = FightMapper(DimensionCache(self.postgres))
+        map_fight_stats = (
+            self.transformer.map_fight_stats
+            if self.transformer
+            else FightStatMapper().map_fights_to_rows
+        )
+        ref_lookup = {ref["fight_id"]: ref for ref in self.fight_refs}
+        workers = self.concurrency["fights"]
+        stat_workers = self.concurrency["fight_stats"]
+        store = self.fingerprints.get("fights")
+        append_stats = self.append_fight_stats and store is None and not self.checkpoint
+        router: Optional[PartitionRouter] = None
+        if self.staging_area is None:
+            router = PartitionRouter(
+                self.postgres, FightStatEntity, workers=self.partition_workers
+            )
+            if not router.refresh():
+                router = None
+
+        # Fights whose event was not loaded, e.g. because it was added after the
+        # events were extracted. Appending to a list is thread-safe.
+        dropped: list[str] = []
+
+        def transform(fights: list[FightModel]) -> list[tuple]:
+            mapped = []
+            for fight in fights:
+                fight_ref = ref_lookup.get(gen_id_from_url(fight.fight_ufcstats_url))
+                if fight_ref is None:
+                    dropped.append(fight.fight_ufcstats_url)
+                    continue
+                mapped.append((fight, *mapper.map_fight_to_rows(fight, fight_ref)))
+            return mapped
+
+        def load(mapped: list[tuple]) -> list[FightModel]:
+            fight_rows = [fight_row for _, fight_row, _ in mapped]
+            scorecard_rows = [
+                row for _, _, scorecard_rows in mapped for row in scorecard_rows
+            ]
+            if self.staging_area is not None:
+                # Dimensions are small and shared by every batch; they are
+                # written directly, before the fights that refer to them.
+                mapper.flush_dimensions()
+                self.staging_area.copy(
+                    {FightEntity: fight_rows, ScorecardEntity: scorecard_rows}
+                )
+            else:
+                load_fight_rows(self.postgres, mapper, fight_rows, scorecard_rows)
+            return [fight for fight, _, _ in mapped]
+
+        def transform_stats(fights: list[FightModel]) -> tuple[list, list]:
+            return fights, map_fight_stats(fights)
+
+        def load_stats(mapped: tuple[list, list]) -> int:
+            fights, rows = mapped
+            if self.staging_area is None and append_stats:
+                return load_fight_stats(self.postgres, rows, router)
+            fight_ids = [gen_id_from_url(fight.fight_ufcstats_url) for fight in fights]
+            if self.staging_area is not None:
+                # The merge replaces the staged fights' fightstat rows.
+                written = self.staging_area.copy({FightStatEntity: rows})
+            else:
+                written = replace_fight_stats(self.postgres, fight_ids, rows, router)
+            # A fight's fingerprint covers its stats, so it is stored only now.
+            self._commit_fingerprints(store, fight_ids)
+            return written
+
+        stages = [
+            Stage("fights.transform", transform, workers),
+            Stage("fights.load", load, workers),
+            Stage(
+                "fight_stats.transform",
+                transform_stats,
+                stat_workers,
+                count_out=lambda mapped: len(mapped[1]),
+            ),
+            Stage(
+                "fight_stats.load",
+                load_stats,
+                stat_workers,
+                count=lambda mapped: len(mapped[1]),
+            ),
+        ]
+        if store is not None:
+
+            def key(fight: FightModel) -> tuple[int, str]:
+                fight_id = gen_id_from_url(fight.fight_ufcstats_url)
+                return fight_id, fingerprint(fight, ref_lookup.get(fight_id))
+
+            stages.insert(
+                0,
+                Stage(
+                    "fights.filter",
+                    lambda fights: store.partition(fights, key)[0],
+                    workers,
+                ),
+            )
+        source, on_done = self._source("fights", iter_fights)
+        stages = run_pipeline(
+            source, stages, self.queue_size, name="fights", on_done=on_done
+        )
+        if dropped:
+            print(f"Skipped {len(dropped)} fights whose event is not loaded.")
+            window = self.windows.get("fights")
+            if window is not None:
+                window.hold({"fight_ufcstats_url": {"$in": dropped}})
+        self._commit_watermark("fights")
+        return stages
+
+    def run(self) -> list[Stage]:
+        """
+        Runs every entity pipeline and returns all stages with their counters.
+        """
+        if self.transform_processes > 0:
+            self.transformer = ProcessPoolTransformer(self.transform_processes)
+        try:
+            return self._run()
+        finally:
+            if self.transformer:
+                self.transformer.close()
+                self.transformer = None
+
+    def _run(self) -> list[Stage]:
+        self.fight_refs = []
+        self.fingerprints = {}
+        if self.skip_unchanged:
+            for entity in ENTITIES:
+                self.fingerprints[entity] = FingerprintStore(self.postgres, entity)
+                self.fingerprints[entity].prefetch()
+        self.checkpoints = {}
+        if self.checkpoint:
+            for entity in CHECKPOINT_KEYS:
+                self.checkpoints[entity] = LoadCheckpoint(self.postgres, entity)
+                last_key = self.checkpoints[entity].start(self.resume)
+                if last_key is not None:
+                    print(
+                        f"Resuming {entity} after {last_key} "
+                        f"({self.checkpoints[entity].batches} batches loaded)."
+                    )
+        self.windows = {}
+        if self.incremental:
+            for entity in ENTITIES:
+                window = IncrementalWindow(
+                    self.mongo,
+                    self.postgres,
+                    entity,
+                    self.watermark_fields.get(entity, DEFAULT_WATERMARK_FIELD),
+                    self.full_refresh,
+                )
+                if window.open() and window.lower is not None:
+                    print(f"Extracting {entity} after {window.lower}.")
+                elif window.empty:
+                    print(f"No new {entity} since the last run.")
+                self.windows[entity] = window
+        self.staging_area = None
+        self._staged_fingerprints = []
+        self._staged_windows = []
+        if self.staging:
+            self.staging_area = StagingArea(self.postgres)
+            self.staging_area.create()
+        results: dict[str, list[Stage]] = {}
+        errors: list[BaseException] = []
+
+        def run_into(key: str, run: Callable[[], list[Stage]]) -> None:
+            try:
+                results[key] = run()
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [
+            threading.Thread(target=run_into, args=("fighters", self.run_fighters)),
+            threading.Thread(target=run_into, args=("events", self.run_events)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+        results["fights"] = self.run_fights()
+        self.stages = [stage for key in ENTITIES for stage in results[key]]
+        if self.staging_area is not None:
+            self.stages.append(self._merge_staging())
+        return self.stages
+
+    def _merge_staging(self) -> Stage:
+        """
+        Merges the staging tables into the real tables, then stores the
+        fingerprints held back until then.
+        """
+        merge = Stage(
+            "staging.merge",
+            lambda _: None,
+            count=lambda written: sum(written.values()),
+            count_out=lambda written: sum(written.values()),
+        )
+        began = time.perf_counter()
+        written = self.staging_area.merge()
+        merge.record(written, written, began, time.perf_counter())
+        for store, ids in self._staged_fingerprints:
+            store.commit(ids)
+        self._staged_fingerprints = []
+        for window in self._staged_windows:
+            window.commit()
+        self._staged_windows = []
+        return merge
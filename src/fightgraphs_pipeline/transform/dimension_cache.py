@@ -0,0 +1,119 @@
+import threading
+from typing import Any
+
+from sqlalchemy import select
+
+from fightgraphs_pipeline.database.postgres_controller import PostgresController
+from fightgraphs_pipeline.models.postgresql_models import (
+    JudgeEntity,
+    RefereeEntity,
+    TimeFormatEntity,
+    WeightclassEntity,
+)
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+# The natural key of each dimension table; tables not listed use "name".
+DIMENSION_KEY_COLUMNS: dict[type, str] = {
+    TimeFormatEntity: "format_string",
+}
+
+DIMENSION_ENTITIES: tuple[type, ...] = (
+    RefereeEntity,
+    WeightclassEntity,
+    TimeFormatEntity,
+    JudgeEntity,
+)
+
+
+class DimensionCache:
+    """
+    In-memory name -> id lookup for small dimension tables (referee, weightclass,
+    timeformat, judge).
+
+    Each table is read once, names are resolved in O(1), and values that are not in
+    the table yet get a deterministic id from their name and are queued. `flush`
+    writes the queued values in one upsert per table, so mapping a batch of fights
+    costs no per-row queries.
+    """
+
+    def __init__(self, postgres: PostgresController):
+        self._postgres = postgres
+        self._ids: dict[type, dict[str, int]] = {}
+        self._pending: dict[type, dict[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def prefetch(self, *entities: type) -> None:
+        """
+        Loads the key -> id mapping of the given dimension tables, or of every
+        known dimension table if none are given.
+        """
+        with self._postgres.get_db_session() as session:
+            for entity in entities or DIMENSION_ENTITIES:
+                table = entity.__table__
+                key = table.c[DIMENSION_KEY_COLUMNS.get(entity, "name")]
+                rows = session.execute(select(key, table.c.id)).all()
+                with self._lock:
+                    self._ids[entity] = {name: id for name, id in rows}
+                    self._pending.setdefault(entity, {})
+
+    def resolve(self, entity: type, key: str, **attributes: Any) -> int:
+        """
+        Returns the id of a dimension value, queuing it for insertion if it is new.
+
+        Args:
+            entity (type): The dimension entity class, e.g. RefereeEntity.
+            key (str): The natural key, e.g. the referee's name.
+            **attributes: Other column values, used only if the value is new.
+
+        Returns:
+            int: The existing id, or a deterministic id generated from `key`.
+        """
+        ids = self._ids.get(entity)
+        if ids is None:
+            self.prefetch(entity)
+            ids = self._ids[entity]
+        id = ids.get(key)
+        if id is not None:
+            return id
+        with self._lock:
+            id = ids.get(key)
+            if id is None:
+                id = ids[key] = gen_id_from_url(key)
+                self._pending[entity][key] = {"id": id, **attributes}
+            return id
+
+    def flush(self) -> int:
+        """
+        Inserts every queued dimension value, one multi-row upsert per table.
+        Flushes are serialized, so when a flush returns every id resolved before it
+        was called is committed, even if another thread's flush wrote it.
+
+        Returns:
+            int: The number of rows written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = {
+                    entity: values for entity, values in self._pending.items() if values
+                }
+                self._pending = {entity: {} for entity in self._pending}
+
+            written = 0
+            try:
+                for entity, values in pending.items():
+                    key = DIMENSION_KEY_COLUMNS.get(entity, "name")
+                    written += self._postgres.batch_upsert(
+                        entity,
+                        [
+                            entity(**{key: name}, **attributes)
+                            for name, attributes in values.items()
+                        ],
+                    )
+            except Exception:
+                # Re-queue everything so ids already handed out stay loadable.
+                with self._lock:
+                    for entity, values in pending.items():
+                        self._pending[entity] = {**values, **self._pending[entity]}
+                raise
+            return written
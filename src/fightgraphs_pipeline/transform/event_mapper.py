@@ -5,6 +5,7 @@ from fightgraphs_pipeline.models.mongodb_models import EventModel, FightRefModel
 from fightgraphs_pipeline.utils import gen_id_from_url, convert_date
 
 from fightgraphs_pipeline.models.postgresql_models import EventEntity
+from fightgraphs_pipeline.models.row_models import EventRow
 
 
 class EventMapper:
@@ -15,6 +16,21 @@ class EventMapper:
     def __init__(self):
         pass
 
+    def map_event_to_values(self, event: EventModel) -> dict:
+        """
+        Maps a MongoDB EventModel to the column values of its event row.
+        """
+        if not event.event_name or not event.event_date or not event.event_location:
+            raise ValueError("Event must have name, date, and location")
+        return {
+            "id": gen_id_from_url(event.event_name),
+            "name": event.event_name,
+            "date": convert_date(event.event_date),
+            "location": event.event_location,
+            "ufcstats_url": event.event_ufcstats_url,
+            "promotion_id": 1,  ## UFC is the only promotion in this context
+        }
+
     def map_event_to_postgres(
         self, event: EventModel
     ) -> tuple[EventEntity, list[dict]]:
@@ -27,24 +43,10 @@ class EventMapper:
         Returns:
             EventEntity: The mapped PostgreSQL event entity.
         """
-        if not event.event_name or not event.event_date or not event.event_location:
-            raise ValueError("Event must have name, date, and location")
-        id = gen_id_from_url(event.event_name)
-        name = event.event_name
-        date = convert_date(event.event_date)
-        location = event.event_location
-        ufcstats_url = event.event_ufcstats_url
-        promotion_id = 1  ## UFC is the only promotion in this context
-        event_entity = EventEntity(
-            id=id,
-            name=name,
-            date=date,
-            location=location,
-            ufcstats_url=ufcstats_url,
-            promotion_id=promotion_id,
-        )
-
-        fight_refs = self.map_fight_refs(id, event.fight_refs)
+        event_values = self.map_event_to_values(event)
+        event_entity = EventEntity(**event_values)
+
+        fight_refs = self.map_fight_refs(event_values["id"], event.fight_refs)
         return event_entity, fight_refs
 
     def map_fight_refs(
@@ -79,3 +81,23 @@ class EventMapper:
                 }
             )
         return mapped_refs
+
+    def map_events_to_rows(
+        self, events: list[EventModel]
+    ) -> tuple[list[EventRow], list[dict]]:
+        """
+        Maps events to EventRow records plus their fight references.
+
+        Args:
+            events (list[EventModel]): The MongoDB event models to map.
+
+        Returns:
+            tuple[list[EventRow], list[dict]]: The event rows, and the fight references of every event as returned by map_fight_refs.
+        """
+        event_rows = []
+        fight_refs = []
+        for event in events:
+            event_values = self.map_event_to_values(event)
+            event_rows.append(EventRow(**event_values))
+            fight_refs.extend(self.map_fight_refs(event_values["id"], event.fight_refs))
+        return event_rows, fight_refs
@@ -0,0 +1,294 @@
+import re
+from datetime import time
+from typing import Any, Optional
+
+from fightgraphs_pipeline.models.mongodb_models import FightDetailsModel, FightModel
+from fightgraphs_pipeline.models.postgresql_models import (
+    FightEntity,
+    JudgeEntity,
+    RefereeEntity,
+    ScorecardEntity,
+    TimeFormatEntity,
+    WeightclassEntity,
+)
+from fightgraphs_pipeline.models.row_models import FightRow, ScorecardRow
+from fightgraphs_pipeline.transform.dimension_cache import DimensionCache
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+_ROUNDS_FORMAT = re.compile(r"(\d+)\s*Rnd\b[^(]*\(([\d\s-]+)\)", re.IGNORECASE)
+_OVERTIME_FORMAT = re.compile(r"\+\s*(\d*)\s*OT", re.IGNORECASE)
+_UNLIMITED_ROUNDS_FORMAT = re.compile(r"Unlimited\s+Rnd\s*\((\d+)", re.IGNORECASE)
+_FINISH_TIME = re.compile(r"(\d+):(\d{2})")
+_SCORE = re.compile(r"(\d+)\s*-\s*(\d+)")
+# Words that qualify a bout rather than name its weight class.
+_WEIGHT_CLASS_NOISE = re.compile(
+    r"\b(?:UFC|Interim|Title|Bout|Tournament)\b", re.IGNORECASE
+)
+
+JUDGE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("judge1_name", "judge1_score"),
+    ("judge2_name", "judge2_score"),
+    ("judge3_name", "judge3_score"),
+)
+
+
+class FightMapper:
+    """
+    Mapper class to convert MongoDB FightModel to PostgreSQL FightEntity and its
+    ScorecardEntity rows.
+
+    Referee, weight class, time format and judge names are resolved to ids through a
+    DimensionCache, so a batch of fights costs no per-fight queries. New dimension
+    values are written by `flush_dimensions`, which must run before the fights are
+    loaded.
+    """
+
+    def __init__(self, dimension_cache: DimensionCache):
+        self.dimension_cache = dimension_cache
+        self._time_formats: dict[str, dict[str, Any]] = {}
+
+    def parse_time_format(self, format_string: str) -> dict[str, Any]:
+        """
+        Parses a time format such as "3 Rnd (5-5-5)" or "1 Rnd + OT (15-3)" into
+        TimeFormatEntity fields, with durations in seconds. Each distinct string is
+        parsed once.
+        """
+        fields = self._time_formats.get(format_string)
+        if fields is not None:
+            return fields
+
+        fields = {
+            "base_rounds": None,
+            "base_round_duration": 0,
+            "overtime_rounds": 0,
+            "overtime_duration": None,
+            "unlimited_rounds": False,
+            "no_time_limit": False,
+        }
+        if re.search(r"No Time Limit", format_string, re.IGNORECASE):
+            fields["no_time_limit"] = True
+        elif match := _UNLIMITED_ROUNDS_FORMAT.search(format_string):
+            fields["unlimited_rounds"] = True
+            fields["base_round_duration"] = int(match.group(1)) * 60
+        elif match := _ROUNDS_FORMAT.search(format_string):
+            base_rounds = int(match.group(1))
+            minutes = [int(m) for m in re.findall(r"\d+", match.group(2))]
+            fields["base_rounds"] = base_rounds
+            if minutes:
+                fields["base_round_duration"] = minutes[0] * 60
+            overtime = _OVERTIME_FORMAT.search(format_string)
+            if overtime and len(minutes) > base_rounds:
+                fields["overtime_rounds"] = int(overtime.group(1) or 1)
+                fields["overtime_duration"] = minutes[base_rounds] * 60
+
+        self._time_formats[format_string] = fields
+        return fields
+
+    def normalize_weight_class(self, weight_class: str) -> tuple[str, str]:
+        """
+        Strips bout qualifiers from a weight class, e.g.
+        "UFC Women's Strawweight Title Bout" -> ("Women's Strawweight", "Women").
+
+        Returns:
+            tuple[str, str]: The weight class name and its gender.
+        """
+        name = " ".join(_WEIGHT_CLASS_NOISE.sub("", weight_class).split())
+        gender = "Women" if name.lower().startswith("women's") else "Men"
+        return name or weight_class.strip(), gender
+
+    def convert_time_finished(self, time_finished: Optional[str]) -> Optional[time]:
+        """
+        Convert the "M:SS" time a fight ended into a time of day offset.
+        """
+        if not time_finished:
+            return None
+        match = _FINISH_TIME.match(time_finished.strip())
+        if not match:
+            return None
+        minutes, seconds = int(match.group(1)), int(match.group(2))
+        return time(minutes // 60, minutes % 60, seconds)
+
+    def resolve_time_format(self, format_string: str) -> int:
+        return self.dimension_cache.resolve(
+            TimeFormatEntity, format_string, **self.parse_time_format(format_string)
+        )
+
+    def resolve_weight_class(self, weight_class: str) -> int:
+        name, gender = self.normalize_weight_class(weight_class)
+        return self.dimension_cache.resolve(
+            WeightclassEntity,
+            name,
+            gender=gender,
+            promotion_id=1,  ## UFC is the only promotion in this context
+        )
+
+    def map_scorecards_to_values(
+        self, fight_id: int, fight: FightModel, details: FightDetailsModel
+    ) -> list[dict[str, Any]]:
+        """
+        Maps the judges' "X - Y" scores to the column values of one scorecard row
+        per judge per fighter.
+        """
+        fighter_ids = (
+            gen_id_from_url(fight.fighter1.fighter_ufcstats_url),
+            gen_id_from_url(fight.fighter2.fighter_ufcstats_url),
+        )
+        scorecards = []
+        for name_field, score_field in JUDGE_FIELDS:
+            judge_name = getattr(details, name_field)
+            match = _SCORE.search(getattr(details, score_field) or "")
+            if not judge_name or not match:
+                continue
+            judge_id = self.dimension_cache.resolve(JudgeEntity, judge_name)
+            for fighter_id, score in zip(fighter_ids, match.groups()):
+                scorecards.append(
+                    {
+                        "id": gen_id_from_url(f"{fight_id}:{judge_id}:{fighter_id}"),
+                        "fight_id": fight_id,
+                        "judge_id": judge_id,
+                        "fighter_id": fighter_id,
+                        "scorecard": int(score),
+                    }
+                )
+        return scorecards
+
+    def map_scorecards(
+        self, fight_id: int, fight: FightModel, details: FightDetailsModel
+    ) -> list[ScorecardEntity]:
+        """
+        Maps the judges' "X - Y" scores to one ScorecardEntity per judge per fighter.
+        """
+        return [
+            ScorecardEntity(**values)
+            for values in self.map_scorecards_to_values(fight_id, fight, details)
+        ]
+
+    def map_fight_to_values(
+        self, fight: FightModel, fight_ref: dict
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """
+        Maps a FightModel to the column values of its fight row and scorecard rows.
+
+        Args:
+            fight (FightModel): The MongoDB fight model to map.
+            fight_ref (dict): The fight's reference from EventMapper.map_fight_refs,
+                giving its event_id and card_position.
+
+        Returns:
+            tuple[dict, list[dict]]: The fight's values and its scorecards' values.
+        """
+        if not fight.fight_ufcstats_url:
+            raise ValueError("Fight model must have a valid UFCStats URL")
+        details = fight.fight_details
+        if not details or not details.time_format or not details.weight_class:
+            raise ValueError("Fight must have a time format and weight class")
+        if not fight.fighter1.fighter_ufcstats_url or not (
+            fight.fighter2.fighter_ufcstats_url
+        ):
+            raise ValueError("Fight must have both fighters' UFCStats URLs")
+        if not fight_ref or fight_ref.get("event_id") is None:
+            raise ValueError("Fight reference must have an event_id")
+
+        id = gen_id_from_url(fight.fight_ufcstats_url)
+        fighter1_id = gen_id_from_url(fight.fighter1.fighter_ufcstats_url)
+        fighter2_id = gen_id_from_url(fight.fighter2.fighter_ufcstats_url)
+        winner_id = None
+        if fight.fighter1.fighter_status == "W":
+            winner_id = fighter1_id
+        elif fight.fighter2.fighter_status == "W":
+            winner_id = fighter2_id
+
+        card_position = fight_ref.get("card_position")
+        round_finished = None
+        if fight.fight_stats:
+            rounds = [int(r) for r in re.findall(r"\d+", " ".join(fight.fight_stats))]
+            round_finished = max(rounds, default=None)
+
+        fight_values = {
+            "id": id,
+            "method": details.method,
+            "finish_details": details.finish_details,
+            "time_format_id": self.resolve_time_format(details.time_format),
+            "round_finished": round_finished,
+            "time_finished": self.convert_time_finished(details.time),
+            "event_id": fight_ref["event_id"],
+            "fighter1_id": fighter1_id,
+            "fighter2_id": fighter2_id,
+            "winner_id": winner_id,
+            "weight_class_id": self.resolve_weight_class(details.weight_class),
+            "referee_id": (
+                self.dimension_cache.resolve(RefereeEntity, details.referee)
+                if details.referee
+                else None
+            ),
+            "ufcstats_url": fight.fight_ufcstats_url,
+            "card_position": int(card_position) if card_position else None,
+        }
+        return fight_values, self.map_scorecards_to_values(id, fight, details)
+
+    def map_fight_to_entity(
+        self, fight: FightModel, fight_ref: dict
+    ) -> tuple[FightEntity, list[ScorecardEntity]]:
+        """
+        Maps a FightModel to a FightEntity and its ScorecardEntity rows.
+        See map_fight_to_values for the arguments.
+        """
+        fight_values, scorecard_values = self.map_fight_to_values(fight, fight_ref)
+        return FightEntity(**fight_values), [
+            ScorecardEntity(**values) for values in scorecard_values
+        ]
+
+    def map_fight_to_rows(
+        self, fight: FightModel, fight_ref: dict
+    ) -> tuple[FightRow, list[ScorecardRow]]:
+        """
+        Maps a FightModel to a FightRow and its ScorecardRow records, which the
+        loaders take in place of entities. See map_fight_to_values for the arguments.
+        """
+        fight_values, scorecard_values = self.map_fight_to_values(fight, fight_ref)
+        return FightRow(**fight_values), [
+            ScorecardRow(**values) for values in scorecard_values
+        ]
+
+    def map_fights_to_entities(
+        self, fights: list[FightModel], fight_refs: list[dict]
+    ) -> list[dict[str, Any]]:
+        """
+        Maps a list of FightModel objects to a list of dicts with FightEntity and its
+        ScorecardEntity rows. Fights without a fight reference are skipped.
+
+        Args:
+            fights (list[FightModel]): List of fight models from MongoDB.
+            fight_refs (list[dict]): Fight references from EventMapper.map_fight_refs.
+
+        Returns:
+            list[dict[str, Any]]: List of dictionaries containing FightEntity and
+            its ScorecardEntity list.
+        """
+        ref_lookup = {ref["fight_id"]: ref for ref in fight_refs}
+
+        fight_and_scorecard_entities = []
+        for fight in fights:
+            fight_ref = ref_lookup.get(gen_id_from_url(fight.fight_ufcstats_url))
+            if fight_ref is None:
+                continue
+            fight_entity, scorecard_entities = self.map_fight_to_entity(
+                fight, fight_ref
+            )
+            fight_and_scorecard_entities.append(
+                {
+                    "fight_entity": fight_entity,
+                    "scorecard_entities": scorecard_entities,
+                }
+            )
+        return fight_and_scorecard_entities
+
+    def flush_dimensions(self) -> int:
+        """
+        Inserts the dimension values first seen in this batch. Call before loading
+        the mapped fights so their foreign keys resolve.
+
+        Returns:
+            int: The number of dimension rows written.
+        """
+        return self.dimension_cache.flush()
@@ -0,0 +1,254 @@
+import re
+from itertools import starmap
+from operator import attrgetter
+from typing import Any, Iterable, Optional
+
+from fightgraphs_pipeline.models.mongodb_models import (
+    FightModel,
+    PerFighterRoundStatsModel,
+)
+from fightgraphs_pipeline.models.row_models import FightStatRow
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+# Column order of the emitted rows: every fightstat column except the serial id.
+FIGHT_STAT_COLUMNS: tuple[str, ...] = FightStatRow._fields
+
+# "X of Y" fields and the (landed, attempted) columns they fill.
+LANDED_OF_ATTEMPTED_FIELDS: dict[str, tuple[str, str]] = {
+    "sig_strikes": ("significant_strikes_landed", "significant_strikes_attempted"),
+    "total_strikes": ("total_strikes_landed", "total_strikes_attempted"),
+    "takedowns": ("takedowns_landed", "takedowns_attempted"),
+    "head_strikes": ("head_strikes_landed", "head_strikes_attempted"),
+    "body_strikes": ("body_strikes_landed", "body_strikes_attempted"),
+    "leg_strikes": ("leg_strikes_landed", "leg_strikes_attempted"),
+    "distance_strikes": ("distance_strikes_landed", "distance_strikes_attempted"),
+    "clinch_strikes": ("clinch_strikes_landed", "clinch_strikes_attempted"),
+    "ground_strikes": ("ground_strikes_landed", "ground_strikes_attempted"),
+}
+
+# Plain count fields and the column they fill.
+COUNT_FIELDS: dict[str, str] = {
+    "kd": "knockdowns",
+    "sub_attempts": "submissions_attempted",
+    "reversals": "reversals",
+}
+
+# "M:SS" duration fields and the column they fill, in seconds.
+DURATION_FIELDS: dict[str, str] = {
+    "control_time": "control_time_seconds",
+}
+
+STAT_FIELDS: tuple[str, ...] = (
+    *LANDED_OF_ATTEMPTED_FIELDS,
+    *COUNT_FIELDS,
+    *DURATION_FIELDS,
+)
+
+# Whole-column patterns: when a joined column matches, every value is well formed
+# and the column can be converted with str.split and int alone.
+_ALL_LANDED_OF_ATTEMPTED = re.compile(r"(?:\d+ of \d+\n)*\d+ of \d+")
+_ALL_COUNTS = re.compile(r"(?:\d+\n)*\d+")
+_ALL_DURATIONS = re.compile(r"(?:\d+:\d+\n)*\d+:\d+")
+
+# Per-line patterns for columns with gaps. Each matches exactly once per line:
+# either the value or, for anything unparseable ("--", "", None), an empty match
+# whose groups are empty strings.
+_LANDED_OF_ATTEMPTED = re.compile(r"^(\d+)\s+of\s+(\d+)|^.*$", re.MULTILINE)
+_COUNT = re.compile(r"^(\d+)|^.*$", re.MULTILINE)
+_DURATION = re.compile(r"^(\d+):(\d+)|^.*$", re.MULTILINE)
+_ROUND_NUMBER = re.compile(r"\d+")
+
+_get_stat_fields = attrgetter(*STAT_FIELDS)
+
+
+def _join(values: list[Optional[str]]) -> str:
+    return "\n".join([value or "" for value in values])
+
+
+def _findall(pattern: re.Pattern, joined: str, values: list[Optional[str]]) -> list:
+    """
+    Matches every value with a single pass of `pattern` over the joined column,
+    returning what `findall` returns for each value. Falls back to one match per
+    value if a value spans several lines.
+    """
+    matches = pattern.findall(joined)
+    if len(matches) != len(values):
+        matches = []
+        for value in values:
+            groups = pattern.match(value or "").groups()
+            matches.append(tuple(group or "" for group in groups))
+        if pattern.groups == 1:
+            matches = [groups[0] for groups in matches]
+    return matches
+
+
+def parse_landed_of_attempted(
+    values: list[Optional[str]],
+) -> tuple[list[int], list[int]]:
+    """
+    Parses a column of "X of Y" values into landed and attempted columns.
+    Unparseable values become 0.
+    """
+    joined = _join(values)
+    if _ALL_LANDED_OF_ATTEMPTED.fullmatch(joined):
+        numbers = list(map(int, joined.replace(" of ", "\n").split("\n")))
+        return numbers[0::2], numbers[1::2]
+    matches = _findall(_LANDED_OF_ATTEMPTED, joined, values)
+    return [int(x or 0) for x, _ in matches], [int(y or 0) for _, y in matches]
+
+
+def parse_counts(values: list[Optional[str]]) -> list[int]:
+    """
+    Parses a column of integer counts. Unparseable values become 0.
+    """
+    joined = _join(values)
+    if _ALL_COUNTS.fullmatch(joined):
+        return list(map(int, joined.split("\n")))
+    return [int(x or 0) for x in _findall(_COUNT, joined, values)]
+
+
+def parse_durations(values: list[Optional[str]]) -> list[int]:
+    """
+    Parses a column of "M:SS" durations into seconds. Unparseable values become 0.
+    """
+    joined = _join(values)
+    if _ALL_DURATIONS.fullmatch(joined):
+        numbers = list(map(int, joined.replace(":", "\n").split("\n")))
+        return [m * 60 + s for m, s in zip(numbers[0::2], numbers[1::2])]
+    return [
+        int(m or 0) * 60 + int(s or 0) for m, s in _findall(_DURATION, joined, values)
+    ]
+
+
+class FightStatMapper:
+    """
+    Mapper class to convert per-round fighter stats into fightstat rows.
+
+    Rounds are collected column by column and every stat column is parsed with one
+    compiled regex pass over the joined column, instead of one regex call per field
+    per round per fighter.
+    Rows are emitted as FightStatRow records, ready for PostgresController.bulk_copy.
+    """
+
+    def __init__(self):
+        self._id_cache: dict[str, int] = {}
+
+    def _gen_id(self, url: Optional[str]) -> int:
+        id = self._id_cache.get(url)
+        if id is None:
+            id = self._id_cache[url] = gen_id_from_url(url)
+        return id
+
+    def parse_round_number(self, round_key: str, default: int) -> int:
+        """
+        Extracts the round number from a fight_stats key such as "Round 2".
+        """
+        match = _ROUND_NUMBER.search(round_key)
+        return int(match.group()) if match else default
+
+    def map_columns(
+        self,
+        fight_ids: list[int],
+        rounds: list[int],
+        fighter_ids: list[int],
+        stats: dict[str, list[Optional[str]]],
+    ) -> list[FightStatRow]:
+        """
+        Builds fightstat rows from stats already collected into columns.
+
+        Args:
+            fight_ids (list[int]): The fight id of each row.
+            rounds (list[int]): The round number of each row.
+            fighter_ids (list[int]): The fighter id of each row.
+            stats (dict[str, list[Optional[str]]]): Raw values for each of STAT_FIELDS.
+
+        Returns:
+            list[FightStatRow]: One row per input position.
+        """
+        columns: dict[str, list] = {
+            "round": rounds,
+            "fighter_id": fighter_ids,
+            "fight_id": fight_ids,
+        }
+        for field, (landed, attempted) in LANDED_OF_ATTEMPTED_FIELDS.items():
+            columns[landed], columns[attempted] = parse_landed_of_attempted(
+                stats[field]
+            )
+        for field, column in COUNT_FIELDS.items():
+            columns[column] = parse_counts(stats[field])
+        for field, column in DURATION_FIELDS.items():
+            columns[column] = parse_durations(stats[field])
+        return list(
+            starmap(FightStatRow, zip(*(columns[name] for name in FIGHT_STAT_COLUMNS)))
+        )
+
+    def map_fights_to_rows(self, fights: Iterable[FightModel]) -> list[FightStatRow]:
+        """
+        Maps the per-round stats of a batch of fights to fightstat rows.
+
+        Args:
+            fights (Iterable[FightModel]): Fights with their `fight_stats`.
+
+        Returns:
+            list[FightStatRow]: One row per fighter per round.
+        """
+        fight_ids: list[int] = []
+        rounds: list[int] = []
+        fighter_ids: list[int] = []
+        stat_models: list[PerFighterRoundStatsModel] = []
+        for fight in fights:
+            if not fight.fight_stats:
+                continue
+            fight_id = self._gen_id(fight.fight_ufcstats_url)
+            for position, (round_key, round_stats) in enumerate(
+                fight.fight_stats.items(), start=1
+            ):
+                round_number = self.parse_round_number(round_key, position)
+                for stats, fighter in (
+                    (round_stats.fighter1, fight.fighter1),
+                    (round_stats.fighter2, fight.fighter2),
+                ):
+                    fight_ids.append(fight_id)
+                    rounds.append(round_number)
+                    fighter_ids.append(
+                        self._gen_id(
+                            stats.fighter_ufcstats_url or fighter.fighter_ufcstats_url
+                        )
+                    )
+                    stat_models.append(stats)
+
+        if not stat_models:
+            return []
+        values = zip(*map(_get_stat_fields, stat_models))
+        return self.map_columns(
+            fight_ids, rounds, fighter_ids, dict(zip(STAT_FIELDS, map(list, values)))
+        )
+
+    def map_flat_stats(self, documents: list[dict[str, Any]]) -> list[FightStatRow]:
+        """
+        Maps flat per-round, per-fighter stat documents, as produced by the
+        `iter_flat_fight_stats` aggregation, to fightstat rows.
+
+        Args:
+            documents (list[dict]): Documents with fight_ufcstats_url, round_key,
+                round_index, fighter_ufcstats_url and the raw STAT_FIELDS values.
+
+        Returns:
+            list[FightStatRow]: One row per document.
+        """
+        if not documents:
+            return []
+        gen_id = self._gen_id
+        parse_round_number = self.parse_round_number
+        return self.map_columns(
+            [gen_id(document["fight_ufcstats_url"]) for document in documents],
+            [
+                parse_round_number(document["round_key"], document["round_index"] + 1)
+                for document in documents
+            ],
+            [gen_id(document.get("fighter_ufcstats_url")) for document in documents],
+            {
+                field: [document.get(field) for document in documents]
+                for field in STAT_FIELDS
+            },
+        )
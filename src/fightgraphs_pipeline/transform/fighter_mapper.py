@@ -1,5 +1,5 @@
 import re
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Mapping, Union
 from fightgraphs_pipeline.models.mongodb_models import FighterModel, FighterImageModel
 from fightgraphs_pipeline.utils import gen_id_from_url, convert_date
 
@@ -7,6 +7,10 @@ from fightgraphs_pipeline.models.postgresql_models import (
     FighterEntity,
     FighterRecordEntity,
 )
+from fightgraphs_pipeline.models.row_models import FighterRecordRow, FighterRow
+
+# Fighter images as a list, or looked up by the id of their fighter.
+FighterImages = Union[list[FighterImageModel], Mapping[int, FighterImageModel]]
 
 
 class FighterMapper:
@@ -79,76 +83,103 @@ class FighterMapper:
             }
         return {"wins": 0, "losses": 0, "draws": 0, "no_contests": 0}
 
-    def map_fighter_to_entity(
+    def map_fighter_to_values(
         self,
         fighter_model: FighterModel,
         fighter_image_model: Optional[FighterImageModel] = None,
-    ) -> tuple[FighterEntity, FighterRecordEntity]:
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
-        Maps a FighterModel to a FighterEntity for PostgreSQL.
+        Maps a FighterModel to the column values of its fighter and fighterrecord rows.
         """
         if not fighter_model:
             raise ValueError("Fighter model cannot be None")
         if not fighter_model.fighter_ufcstats_url:
             raise ValueError("Fighter model must have a valid UFCStats URL")
         id = gen_id_from_url(fighter_model.fighter_ufcstats_url)
-        first_name = fighter_model.first_name
-        last_name = fighter_model.last_name
-        nickname = fighter_model.nickname
-        date_of_birth = convert_date(fighter_model.date_of_birth)
-        height_cm = self.convert_height(fighter_model.height)
-        weight_kg = self.convert_weight(fighter_model.weight)
-        reach_cm = self.convert_reach(fighter_model.reach)
-        stance = fighter_model.stance
-        image_url = (
-            fighter_image_model.fighter_image_url
-            if fighter_image_model is not None
-            else None
-        )
-        ufcstats_url = fighter_model.fighter_ufcstats_url
         fighter_record = self.convert_record(fighter_model.fighter_record)
 
-        fighter_entity = FighterEntity(
-            id=id,
-            first_name=first_name,
-            last_name=last_name,
-            nickname=nickname,
-            date_of_birth=date_of_birth,
-            height_cm=height_cm,
-            weight_kg=weight_kg,
-            reach_cm=reach_cm,
-            stance=stance,
-            image_url=image_url,
-            ufcstats_url=ufcstats_url,
+        fighter_values = {
+            "id": id,
+            "first_name": fighter_model.first_name,
+            "last_name": fighter_model.last_name,
+            "nickname": fighter_model.nickname,
+            "date_of_birth": convert_date(fighter_model.date_of_birth),
+            "height_cm": self.convert_height(fighter_model.height),
+            "weight_kg": self.convert_weight(fighter_model.weight),
+            "reach_cm": self.convert_reach(fighter_model.reach),
+            "stance": fighter_model.stance,
+            "image_url": (
+                fighter_image_model.fighter_image_url
+                if fighter_image_model is not None
+                else None
+            ),
+            "ufcstats_url": fighter_model.fighter_ufcstats_url,
+        }
+        fighter_record_values = {
+            "id": id,  # One record per fighter, keyed like the fighter for upserts
+            "fighter_id": id,
+            "wins": fighter_record["wins"],
+            "losses": fighter_record["losses"],
+            "draws": fighter_record["draws"],
+            "no_contests": fighter_record["no_contests"],
+        }
+        return fighter_values, fighter_record_values
+
+    def map_fighter_to_entity(
+        self,
+        fighter_model: FighterModel,
+        fighter_image_model: Optional[FighterImageModel] = None,
+    ) -> tuple[FighterEntity, FighterRecordEntity]:
+        """
+        Maps a FighterModel to a FighterEntity for PostgreSQL.
+        """
+        fighter_values, fighter_record_values = self.map_fighter_to_values(
+            fighter_model, fighter_image_model
         )
-        fighter_record_entity = FighterRecordEntity(
-            fighter_id=id,
-            wins=fighter_record["wins"],
-            losses=fighter_record["losses"],
-            draws=fighter_record["draws"],
-            no_contests=fighter_record["no_contests"],
+        return FighterEntity(**fighter_values), FighterRecordEntity(
+            **fighter_record_values
         )
 
-        return fighter_entity, fighter_record_entity
+    @staticmethod
+    def build_image_lookup(
+        fighter_images: Iterable[FighterImageModel],
+    ) -> dict[int, FighterImageModel]:
+        """
+        Returns fighter images by the id of their fighter. Build it once and pass
+        it to every batch mapped against the same images.
+
+        Args:
+            fighter_images (Iterable[FighterImageModel]): Fighter image models from MongoDB.
+
+        Returns:
+            dict[int, FighterImageModel]: The images by fighter id.
+        """
+        return {
+            gen_id_from_url(image.fighter_ufcstats_url): image
+            for image in fighter_images
+        }
 
     def map_fighters_to_entities(
         self,
         fighter_models: list[FighterModel],
-        fighter_images: list[FighterImageModel],
+        fighter_images: FighterImages,
     ) -> list[dict[str, Any]]:
         """
         Maps a list of FighterModel objects to a list of dicts with FighterEntity and FighterRecordEntity.
 
         Args:
             fighter_models (list[FighterModel]): List of fighter models from MongoDB.
-            fighter_images (list[FighterImageModel]): List of fighter image models from MongoDB.
+            fighter_images (FighterImages): List of fighter image models from MongoDB,
+                or the lookup build_image_lookup returns for them.
 
         Returns:
             list[dict[str, Any]]: List of dictionaries containing FighterEntity and FighterRecordEntity.
         """
-        image_lookup = {
-            gen_id_from_url(img.fighter_ufcstats_url): img for img in fighter_images
-        }
+        image_lookup = (
+            fighter_images
+            if isinstance(fighter_images, Mapping)
+            else self.build_image_lookup(fighter_images)
+        )
 
         fighter_and_record_entities = []
         for fighter_model in fighter_models:
@@ -167,3 +198,39 @@ class FighterMapper:
             )
 
         return fighter_and_record_entities
+
+    def map_fighters_to_rows(
+        self,
+        fighter_models: list[FighterModel],
+        fighter_images: FighterImages,
+    ) -> tuple[list[FighterRow], list[FighterRecordRow]]:
+        """
+        Maps FighterModel objects to FighterRow and FighterRecordRow records.
+        Rows are plain named tuples, far lighter than entities to hold and to pickle,
+        and the loaders take them as they are.
+
+        Args:
+            fighter_models (list[FighterModel]): List of fighter models from MongoDB.
+            fighter_images (FighterImages): List of fighter image models from MongoDB,
+                or the lookup build_image_lookup returns for them.
+
+        Returns:
+            tuple[list[FighterRow], list[FighterRecordRow]]: The fighter and
+            fighterrecord rows.
+        """
+        image_lookup = (
+            fighter_images
+            if isinstance(fighter_images, Mapping)
+            else self.build_image_lookup(fighter_images)
+        )
+
+        fighter_rows = []
+        fighter_record_rows = []
+        for fighter_model in fighter_models:
+            fighter_id = gen_id_from_url(fighter_model.fighter_ufcstats_url)
+            fighter_values, fighter_record_values = self.map_fighter_to_values(
+                fighter_model, image_lookup.get(fighter_id, None)
+            )
+            fighter_rows.append(FighterRow(**fighter_values))
+            fighter_record_rows.append(FighterRecordRow(**fighter_record_values))
+        return fighter_rows, fighter_record_rows
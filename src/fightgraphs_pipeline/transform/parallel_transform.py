@@ -0,0 +1,153 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from fightgraphs_pipeline.models.mongodb_models import (
+    EventModel,
+    FighterImageModel,
+    FighterModel,
+    FightModel,
+)
+from fightgraphs_pipeline.models.row_models import (
+    EventRow,
+    FighterRecordRow,
+    FighterRow,
+    FightStatRow,
+)
+from fightgraphs_pipeline.transform.event_mapper import EventMapper
+from fightgraphs_pipeline.transform.fight_stat_mapper import FightStatMapper
+from fightgraphs_pipeline.transform.fighter_mapper import FighterImages, FighterMapper
+from fightgraphs_pipeline.utils import gen_id_from_url
+
+DEFAULT_CHUNK_SIZE = 500
+
+# One mapper per worker process, so caches such as FightStatMapper's id cache
+# survive from one chunk to the next.
+_fighter_mapper = FighterMapper()
+_event_mapper = EventMapper()
+_fight_stat_mapper = FightStatMapper()
+
+
+def _map_fighters(
+    fighters: list[FighterModel], fighter_images: dict[int, FighterImageModel]
+) -> tuple[list[FighterRow], list[FighterRecordRow]]:
+    return _fighter_mapper.map_fighters_to_rows(fighters, fighter_images)
+
+
+def _map_events(events: list[EventModel]) -> tuple[list[EventRow], list[dict]]:
+    return _event_mapper.map_events_to_rows(events)
+
+
+def _map_fight_stats(fights: list[FightModel]) -> list[FightStatRow]:
+    return _fight_stat_mapper.map_fights_to_rows(fights)
+
+
+def _chunks(items: Iterable[Any], chunk_size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+class ProcessPoolTransformer:
+    """
+    Runs the CPU-bound mappers on a process pool so transform throughput scales
+    with the number of cores.
+
+    Source models are split into chunks of `chunk_size` and mapped in worker
+    processes, which send back row records (named tuples) instead of ORM entities,
+    since they are far cheaper to pickle. Results keep the input order.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        mp_context: Optional[Any] = None,
+    ):
+        """
+        Args:
+            max_workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+            chunk_size (int): Models per task.
+            mp_context: A multiprocessing context. Defaults to "spawn", since the
+                pipeline's threads make forking unsafe.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context or multiprocessing.get_context("spawn"),
+        )
+
+    def map_fighters(
+        self,
+        fighters: list[FighterModel],
+        fighter_images: FighterImages,
+    ) -> tuple[list[FighterRow], list[FighterRecordRow]]:
+        """
+        Parallel FighterMapper.map_fighters_to_rows. Each chunk is sent only the
+        images of its own fighters, already looked up by fighter id.
+        """
+        image_lookup = (
+            fighter_images
+            if isinstance(fighter_images, Mapping)
+            else FighterMapper.build_image_lookup(fighter_images)
+        )
+        chunks = list(_chunks(fighters, self.chunk_size))
+        chunk_images = []
+        for chunk in chunks:
+            fighter_ids = (
+                gen_id_from_url(fighter.fighter_ufcstats_url) for fighter in chunk
+            )
+            chunk_images.append(
+                {
+                    fighter_id: image_lookup[fighter_id]
+                    for fighter_id in fighter_ids
+                    if fighter_id in image_lookup
+                }
+            )
+        fighter_rows: list[FighterRow] = []
+        fighter_record_rows: list[FighterRecordRow] = []
+        for rows, record_rows in self._executor.map(
+            _map_fighters, chunks, chunk_images
+        ):
+            fighter_rows.extend(rows)
+            fighter_record_rows.extend(record_rows)
+        return fighter_rows, fighter_record_rows
+
+    def map_events(self, events: list[EventModel]) -> tuple[list[EventRow], list[dict]]:
+        """
+        Parallel EventMapper.map_events_to_rows.
+        """
+        event_rows: list[EventRow] = []
+        fight_refs: list[dict] = []
+        for rows, refs in self._executor.map(
+            _map_events, _chunks(events, self.chunk_size)
+        ):
+            event_rows.extend(rows)
+            fight_refs.extend(refs)
+        return event_rows, fight_refs
+
+    def map_fight_stats(self, fights: list[FightModel]) -> list[FightStatRow]:
+        """
+        Parallel FightStatMapper.map_fights_to_rows.
+        """
+        rows: list[FightStatRow] = []
+        for chunk_rows in self._executor.map(
+            _map_fight_stats, _chunks(fights, self.chunk_size)
+        ):
+            rows.extend(chunk_rows)
+        return rows
+
+    def close(self) -> None:
+        """
+        Shuts the worker processes down.
+        """
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ProcessPoolTransformer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -35,16 +35,24 @@ def convert_date(date: Optional[str]) -> Optional[date]:
         return None
 
 
-def get_controllers() -> Tuple[MongoDBController, PostgresController]:
+def get_controllers(
+    mongo_event_listeners: Optional[list] = None,
+) -> Tuple[MongoDBController, PostgresController]:
     """
     Initialize and return MongoDB and PostgreSQL controllers.
+
+    Args:
+        mongo_event_listeners (Optional[list]): PyMongo monitoring listeners for
+            the MongoDB client, e.g. metrics.MongoBytesListener.
     """
     load_dotenv()
     mongo_uri = os.getenv("MONGODB_URI")
     mongo_db = os.getenv("MONGODB_DATABASE")
     if not mongo_uri or not mongo_db:
         raise ValueError("MONGODB_URI and MONGODB_DATABASE must be set in .env file")
-    mongo_controller = MongoDBController(mongo_uri, mongo_db)
+    mongo_controller = MongoDBController(
+        mongo_uri, mongo_db, event_listeners=mongo_event_listeners
+    )
     postgres_uri = os.getenv("POSTGRES_URI")
     postgres_db = os.getenv("POSTGRES_DATABASE")
     if not postgres_uri or not postgres_db:
@@ -1,8 +1,7 @@
 from fightgraphs_pipeline.extract.extraction import (
+    extract_all,
     extract_fighters,
     extract_fighter_images,
-    extract_events,
-    extract_fights,
 )
 from fightgraphs_pipeline.transform.fighter_mapper import FighterMapper
 from fightgraphs_pipeline.utils import get_controllers
@@ -11,26 +10,23 @@ import json
 # Old direct MongoDBController usage (can be removed if using get_controllers)
 mongo_controller, postgres_controller = get_controllers()
 
+fighters, fighter_images, events, fights = extract_all(mongo_controller)
 
-fighters = extract_fighters(mongo_controller)
 print("Fighters:")
 for i in range(min(5, len(fighters))):
     print(json.dumps(fighters[i].model_dump(), indent=4))
 
-# Extract and print fighter images
-fighter_images = extract_fighter_images(mongo_controller)
+# Print fighter images
 print("\nFighter Images:")
 for i in range(min(5, len(fighter_images))):
     print(json.dumps(fighter_images[i].model_dump(), indent=4))
 
-# Extract and print events
-events = extract_events(mongo_controller)
+# Print events
 print("\nEvents:")
 for i in range(min(5, len(events))):
     print(json.dumps(events[i].model_dump(), indent=4))
 
-# Extract and print fights
-fights = extract_fights(mongo_controller)
+# Print fights
 print("\nFights:")
 for i in range(min(2, len(fights))):  # fights may be large, print 2
     print(json.dumps(fights[i].model_dump(), indent=4))